@@ -0,0 +1,68 @@
+# coding:utf-8
+"""
+Compares the per-call ``make_*`` path against the ``make_*_many``
+batch companions.
+
+Usage: python benchmarks/batch.py [n]
+"""
+
+import sys
+import timeit
+
+from datetime import datetime
+
+from data_factory import factory
+from data_factory.distributions import Normal, Zipf
+
+
+# 10k categories with zipf like weights
+CATEGORIES = list(range(10000))
+WEIGHTS = [1.0 / (i + 1) for i in CATEGORIES]
+
+KEYS = Zipf(1.1, 10 ** 4)
+KEYS_LARGE = Zipf(1.1, 10 ** 8)
+
+CASES = [
+    ('choose', (CATEGORIES,)),
+    ('choose', (CATEGORIES, WEIGHTS)),
+    ('make_integer', ()),
+    ('make_big_integer', ()),
+    ('make_big_integer', (KEYS,)),
+    ('make_big_integer', (KEYS_LARGE,)),
+    ('make_unsigned_small_integer', ()),
+    ('make_boolean', ()),
+    ('make_real', ()),
+    ('make_double', (6, 2)),
+    ('make_double', (6, 2, Normal(1000, 100))),
+    ('make_decimal', (12,)),
+    ('make_money', ()),
+    ('make_money_cents', ()),
+    ('make_string', (32,)),
+    ('make_slug', (32,)),
+    ('make_unicode', (32,)),
+    ('make_datetime', (datetime(2020, 1, 1),)),
+    ('make_timestamp', (datetime(2020, 1, 1),)),
+    ('make_hostname', (32,)),
+    ('make_email', (12, 20)),
+    ('make_url', (40,)),
+    ('make_ip_address', ()),
+    ('make_ip_address_str', (False,)),
+    ('make_ip_address_int', (False, 6)),
+    ('make_filename', (20,)),
+]
+
+
+def main(n=100000):
+    print('%-30s %12s %12s %8s' % ('generator', 'single/s', 'batch/s', 'speedup'))
+
+    for name, args in CASES:
+        fnc = getattr(factory, name)
+        fnc_many = getattr(factory, name + '_many')
+
+        single = min(timeit.repeat(lambda: [fnc(*args) for i in range(n)], number=1, repeat=3))
+        batch = min(timeit.repeat(lambda: fnc_many(n, *args), number=1, repeat=3))
+        print('%-30s %12d %12d %7.1fx' % (name, n / single, n / batch, single / batch))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
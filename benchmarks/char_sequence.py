@@ -0,0 +1,47 @@
+# coding:utf-8
+"""
+Measures ``make_char_sequence`` against the previous one ``random.choice``
+per character implementation, for the module tables and lengths from 1
+to 10^6.
+
+Usage: python benchmarks/char_sequence.py [max_exponent]
+"""
+
+import sys
+import string
+import random
+import timeit
+
+from data_factory import factory
+
+
+TABLES = [
+    ('BINARY_TABLE', factory.BINARY_TABLE),
+    ('SLUG_TABLE', factory.SLUG_TABLE),
+    ('string.printable', string.printable),
+    ('ASCII_TABLE', factory.ASCII_TABLE),
+    ('user table', u'αβγδεζηθ'),
+]
+
+
+def choice_per_char(table, length):
+    return ''.join([random.choice(table) for i in range(length)])
+
+
+def main(max_exponent=6):
+    print('%-18s %9s %14s %14s %8s' % ('table', 'length', 'choice ns/chr', 'engine ns/chr', 'speedup'))
+
+    for name, table in TABLES:
+        for exponent in range(max_exponent + 1):
+            length = 10 ** exponent
+            number = max(1, 10 ** 5 // length)
+
+            old = min(timeit.repeat(lambda: choice_per_char(table, length), number=number, repeat=3))
+            new = min(timeit.repeat(lambda: factory.make_char_sequence(table, length), number=number, repeat=3))
+
+            scale = 1e9 / (number * length)
+            print('%-18s %9d %14.1f %14.1f %7.1fx' % (name, length, old * scale, new * scale, old / new))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,264 @@
+# coding:utf-8
+"""
+Measures every public generator of ``data_factory.factory``, one value
+at a time and through its ``_many`` batch companion, for small and
+large arguments, and saves the results as a JSON baseline. ``compare``
+flags the cases that got slower than a baseline by more than a
+threshold, and exits with 1 when there are any.
+
+Each case runs for about ``--time`` seconds, the best of ``--repeat``
+runs being kept; the whole suite takes about a minute with the
+defaults. Timings are only comparable on the same machine and python.
+
+Usage:
+    python benchmarks/generators.py run [-o results.json] [-k filter] [--baseline base.json]
+    python benchmarks/generators.py compare base.json results.json [--threshold 0.2]
+"""
+
+import sys
+import json
+import time
+import timeit
+import platform
+import argparse
+
+from datetime import datetime, timedelta
+
+from data_factory import factory
+from data_factory.factory import Factory
+from data_factory.distributions import Zipf
+
+
+NOW = datetime(2024, 1, 1)
+CATEGORIES = list(range(10000))
+WEIGHTS = [1.0 / (i + 1) for i in CATEGORIES]
+NETWORKS = ['10.0.0.0/8', '172.16.0.0/12']
+
+# generator name -> list of (label, args, keyword arguments)
+CASES = dict(
+    choose=[
+        ('10', (CATEGORIES[:10],), {}),
+        ('10k weighted', (CATEGORIES, WEIGHTS), {}),
+    ],
+    make_tiny_integer=[('', (), {})],
+    make_small_integer=[('', (), {})],
+    make_integer=[
+        ('', (), {}),
+        ('zipf', (), dict(distribution=Zipf(1.1, 10 ** 4))),
+    ],
+    make_big_integer=[('', (), {})],
+    make_unsigned_tiny_integer=[('', (), {})],
+    make_unsigned_small_integer=[('', (), {})],
+    make_unsigned_integer=[('', (), {})],
+    make_unsigned_big_integer=[('', (), {})],
+    make_real=[('', (), {})],
+    make_double=[
+        ('', (), {}),
+        ('6, 2', (6, 2), {}),
+    ],
+    make_decimal=[
+        ('12', (12,), {}),
+        ('38, 20, 10', (38, 20, 10), {}),
+    ],
+    make_money=[('', (), {})],
+    make_money_cents=[('', (), {})],
+    make_char_sequence=[
+        ('slug, 8', (factory.SLUG_TABLE, 8), {}),
+        ('slug, 1000', (factory.SLUG_TABLE, 1000), {}),
+    ],
+    make_binary=[
+        ('8', (8,), {}),
+        ('1000', (1000,), {}),
+    ],
+    make_ascii_string=[
+        ('8', (8,), {}),
+        ('1000', (1000,), {}),
+    ],
+    make_string=[
+        ('8', (8,), {}),
+        ('1000', (1000,), {}),
+    ],
+    make_unicode=[
+        ('8', (8,), {}),
+        ('1000', (1000,), {}),
+    ],
+    make_slug=[
+        ('8', (8,), {}),
+        ('1000', (1000,), {}),
+    ],
+    make_boolean=[('', (), {})],
+    make_datetime=[
+        ('', (), {}),
+        ('10 years, us', (NOW - timedelta(days=3650),), dict(resolution='us')),
+    ],
+    make_timestamp=[('', (NOW - timedelta(days=3650),), {})],
+    make_hostname_label=[('20', (20,), {})],
+    make_hostname=[
+        ('16', (16,), {}),
+        ('200', (200,), {}),
+    ],
+    make_email_local_part=[('20', (20,), {})],
+    make_email=[
+        ('12, 20', (12, 20), {}),
+        ('64, 180', (64, 180), {}),
+    ],
+    make_url=[
+        ('40', (40,), {}),
+        ('200', (200,), {}),
+    ],
+    make_ip_address=[('', (), {})],
+    make_ip_address_str=[
+        ('v4', (), {}),
+        ('public v6', (False, 6), {}),
+        ('networks', (), dict(networks=NETWORKS)),
+    ],
+    make_ip_address_int=[('public', (False,), {})],
+    make_ip_address_packed=[('', (), {})],
+    make_ip_address_object=[('', (), {})],
+    make_mime_type=[('', (), {})],
+    make_filename=[
+        ('20', (20,), {}),
+        ('200', (200,), {}),
+    ],
+)
+
+
+def generator_names():
+    """
+    Returns the names of the public generators of ``Factory``.
+
+    """
+    return sorted(
+        name for name in dir(Factory)
+        if (name.startswith('make_') or name == 'choose') and not name.endswith('_many'))
+
+
+def measure(fnc, seconds, repeat):
+    """
+    Returns the best seconds per value of ``fnc(n)``, which makes ``n``
+    values, calibrating ``n`` so that a run takes about ``seconds``.
+
+    """
+    n = 10
+    while True:
+        elapsed = timeit.timeit(lambda: fnc(n), number=1)
+        if elapsed >= seconds / 10 or n >= 10 ** 7:
+            break
+        n *= 10
+
+    n = max(1, int(n * seconds / max(elapsed, 1e-9)))
+    return min(timeit.repeat(lambda: fnc(n), number=1, repeat=repeat)) / n
+
+
+def run(seconds=0.1, repeat=3, pattern=''):
+    """
+    Measures all cases matching ``pattern``. Returns a dict of case key
+    to results, a key being like ``make_email(12, 20):batch``.
+
+    """
+    missing = set(generator_names()) - set(CASES)
+    if missing:
+        raise KeyError("no benchmark case for %s" % ', '.join(sorted(missing)))
+
+    target = Factory(seed=0, now=NOW)
+    results = dict()
+
+    for name, cases in CASES.items():  # fail before measuring anything
+        for label, args, kw in cases:
+            getattr(target, name)(*args, **kw)
+
+    for name in sorted(CASES):
+        single, many = getattr(target, name), getattr(target, name + '_many')
+
+        for label, args, kw in CASES[name]:
+            modes = [
+                ('single', lambda n: [single(*args, **kw) for i in range(n)]),
+                ('batch', lambda n: many(n, *args, **kw)),
+            ]
+
+            for mode, fnc in modes:
+                key = '%s(%s):%s' % (name, label, mode)
+                if pattern not in key:
+                    continue
+
+                per_value = measure(fnc, seconds, repeat)
+                results[key] = dict(ns_per_value=per_value * 1e9, ops_per_second=1 / per_value)
+                print('%-50s %12.0f ns %12d /s' % (key, per_value * 1e9, 1 / per_value))
+                sys.stdout.flush()
+
+    return results
+
+
+def compare(baseline, results, threshold=0.2):
+    """
+    Prints the cases of ``results`` slower than in ``baseline`` by
+    more than ``threshold`` (a fraction) and returns their keys.
+
+    """
+    regressions = []
+
+    print('%-50s %12s %12s %8s' % ('case', 'base ns', 'ns', 'change'))
+    for key in sorted(set(baseline) & set(results)):
+        before, after = baseline[key]['ns_per_value'], results[key]['ns_per_value']
+        change = after / before - 1
+        flag = ''
+
+        if change > threshold:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print('%-50s %12.0f %12.0f %+7.0f%%%s' % (key, before, after, change * 100, flag))
+
+    print('\n%d regressions over %d%%, %d baseline cases not measured' % (
+        len(regressions), threshold * 100, len(set(baseline) - set(results))))
+    return regressions
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='measure the generators')
+    run_parser.add_argument('-o', '--output', help='JSON file to save the results to')
+    run_parser.add_argument('-k', '--filter', default='', help='only cases containing this')
+    run_parser.add_argument('--time', type=float, default=0.1, help='seconds per case run')
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--baseline', help='JSON baseline to compare the results to')
+    run_parser.add_argument('--threshold', type=float, default=0.2)
+
+    compare_parser = commands.add_parser('compare', help='compare results to a baseline')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('results')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='slowdown flagged as a regression, as a fraction')
+
+    options = parser.parse_args(argv)
+
+    if options.command == 'compare':
+        return 1 if compare(load(options.baseline), load(options.results), options.threshold) else 0
+
+    results = run(options.time, options.repeat, options.filter)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(dict(
+                created=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                python=platform.python_version(),
+                implementation=platform.python_implementation(),
+                machine=platform.machine(),
+                results=results,
+            ), f, indent=2, sort_keys=True)
+
+    if options.baseline:
+        print()
+        return 1 if compare(load(options.baseline), results, options.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
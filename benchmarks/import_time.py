@@ -0,0 +1,71 @@
+# coding:utf-8
+"""
+Measures the cost of ``import data_factory`` with ``python -X importtime``
+and fails when it goes over a budget, so that eager imports creeping
+back in are noticed.
+
+The time of an empty package import is subtracted, which leaves out
+interpreter and ``site`` noise. The best of ``repeat`` fresh
+interpreters is kept.
+
+Usage: python benchmarks/import_time.py [module] [budget_us] [repeat]
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+
+# extra microseconds over an empty package import
+BUDGET_US = 5000
+
+
+def import_times(module, env=None):
+    """
+    Returns a dict of module name to (self, cumulative) import microseconds
+    for a fresh interpreter importing ``module``.
+
+    """
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+        env=env, stderr=subprocess.PIPE, check=True).stderr.decode('utf-8')
+
+    times = dict()
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def best_time(module, repeat, env=None):
+    return min(import_times(module, env)[module][1] for i in range(repeat))
+
+
+def main(module='data_factory', budget_us=BUDGET_US, repeat=7):
+    budget_us, repeat = int(budget_us), int(repeat)
+
+    with tempfile.TemporaryDirectory() as path:
+        os.mkdir(os.path.join(path, 'empty_package'))
+        open(os.path.join(path, 'empty_package', '__init__.py'), 'w').close()
+        baseline = best_time('empty_package', repeat, dict(os.environ, PYTHONPATH=path))
+
+    cost = best_time(module, repeat)
+    times = import_times(module)
+
+    print('%-40s %10s %10s' % ('module', 'self us', 'cumul. us'))
+    for name, (self_us, cumulative_us) in sorted(times.items(), key=lambda i: -i[1][0])[:10]:
+        print('%-40s %10d %10d' % (name, self_us, cumulative_us))
+
+    print('\nimport %s: %d us, empty package: %d us, budget: %d us over empty'
+          % (module, cost, baseline, budget_us))
+
+    if cost - baseline > budget_us:
+        print('over budget by %d us' % (cost - baseline - budget_us))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv[1:]))
@@ -0,0 +1,46 @@
+# coding:utf-8
+"""
+Compares a hand-written row loop against the equivalent compiled ``Schema``.
+
+Usage: python benchmarks/schema.py [rows]
+"""
+
+import sys
+import timeit
+
+from data_factory import factory
+from data_factory.schema import Schema, BigInteger, Email, DateTime, Integer, Slug
+
+
+schema = Schema(
+    id=BigInteger(),
+    email=Email(20, 30),
+    created=DateTime(),
+    score=Integer(null=0.2),
+    slug=Slug(40),
+)
+
+
+def hand_written(rows):
+    maybe_integer = factory.or_null(factory.make_integer, 0.2)
+    return [
+        (factory.make_big_integer(), factory.make_email(20, 30), factory.make_datetime(),
+         maybe_integer(), factory.make_slug(40))
+        for i in range(rows)]
+
+
+def main(rows=100000):
+    cases = [
+        ('hand-written loop', lambda: hand_written(rows)),
+        ('schema.tuples', lambda: schema.tuples(rows)),
+        ('schema.dicts', lambda: schema.dicts(rows)),
+        ('schema.chunks(columns)', lambda: list(schema.chunks(rows, format='columns'))),
+    ]
+
+    for name, fnc in cases:
+        elapsed = min(timeit.repeat(fnc, number=1, repeat=3))
+        print('%-25s %10d rows/s' % (name, rows / elapsed))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
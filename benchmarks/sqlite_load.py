@@ -0,0 +1,52 @@
+# coding:utf-8
+"""
+Measures ``load_sqlite`` rows/s for several batch sizes against a
+local SQLite file.
+
+Usage: python benchmarks/sqlite_load.py [rows]
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+
+from data_factory.schema import Schema, BigInteger, Email, DateTime, Integer, String
+from data_factory.sql import load_sqlite
+
+
+schema = Schema(
+    id=BigInteger(),
+    email=Email(20, 30),
+    created=DateTime(),
+    score=Integer(null=0.2),
+    bio=String(100),
+)
+
+BATCH_SIZES = (1, 10, 100, 1000, 10000)
+
+
+def main(rows=100000):
+    data = schema.tuples(rows)  # generation is not measured
+    directory = tempfile.mkdtemp()
+
+    for batch_size in BATCH_SIZES:
+        path = os.path.join(directory, 'bench_%d.sqlite3' % batch_size)
+        connection = sqlite3.connect(path)
+        connection.execute('CREATE TABLE t (id INTEGER, email TEXT, created TEXT, score INTEGER, bio TEXT)')
+        connection.commit()
+
+        started = time.time()
+        load_sqlite(connection, 't', data, batch_size=batch_size)
+        elapsed = time.time() - started
+
+        connection.close()
+        os.remove(path)
+        print('batch_size=%-6d %10d rows/s' % (batch_size, rows / elapsed))
+
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -20,5 +20,10 @@ setup(
     keywords="data factory testing",
     description="Simple collection of data generating functions very useful for testing software.",
     package_dir={'': 'src'},
-    py_modules=["data_factory"],
+    packages=["data_factory"],
+    python_requires='>=3.8',
+    extras_require={
+        'numpy': ['numpy'],
+        'arrow': ['pyarrow'],
+    },
 )
@@ -1,3 +1,57 @@
 __author__ = 'italo.maia'
+__version__ = '0.3'
 
-from .factory import *
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562), so that
+# ``import data_factory`` stays cheap. Names not listed in __exports
+# come from ``data_factory.factory``, as with the former
+# ``from .factory import *``. Modules with optional dependencies, like
+# ``data_factory.np``, must still be imported explicitly.
+
+import importlib
+
+__submodules = (
+    'aio', 'cache', 'catalogs', 'counter', 'distributions', 'factory', 'instrumentation', 'parallel',
+    'schema', 'sinks', 'sql', 'uniqueness')
+__exports = dict(
+    agenerate='aio',
+    aload='aio',
+    CounterRandom='counter',
+    rows_at='counter',
+    row_at='counter',
+    generate_parallel='parallel',
+    instrument='instrumentation',
+    stats='instrumentation',
+    unique='uniqueness',
+    make_unique_integers='uniqueness',
+    Zipf='distributions',
+    Pareto='distributions',
+    Normal='distributions',
+    Exponential='distributions',
+)
+
+
+def __public_names():
+    factory = importlib.import_module('.factory', __name__)
+    names = [name for name in vars(factory) if not name.startswith('_')]
+    return sorted(set(names) | set(__exports))
+
+
+def __getattr__(name):
+    if name in __submodules:
+        return importlib.import_module('.' + name, __name__)
+
+    if name == '__all__':
+        return __public_names()
+
+    if not name.startswith('__'):
+        module = importlib.import_module('.' + __exports.get(name, 'factory'), __name__)
+
+        if hasattr(module, name):
+            value = globals()[name] = getattr(module, name)
+            return value
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__public_names()) | set(__submodules))
@@ -0,0 +1,126 @@
+# -*- coding:utf-8 -*-
+
+"""
+Asyncio producer for async database drivers.
+
+Chunks of rows are generated in an executor while the event loop
+awaits the inserts of the previous ones. Finished chunks wait in a
+bounded queue: when the consumer is slower than generation, the
+producer blocks instead of piling up rows::
+
+    >>> async for chunk in agenerate(users, 10 ** 6, chunk_size=5000):
+    ...     await connection.executemany(sql, chunk)
+
+Chunks are the blocks of ``generate_parallel``, so for a given seed
+``agenerate`` yields the same rows as ``generate_parallel`` with
+``block_size=chunk_size``.
+"""
+
+import random
+import asyncio
+
+from datetime import datetime
+
+from .parallel import make_block
+from .sinks import SinkStats
+
+
+CHUNK_SIZE = 10000
+MAX_PENDING = 2
+
+__DONE = object()
+
+
+async def agenerate(spec, rows, chunk_size=CHUNK_SIZE, seed=None, now=None,
+                    max_pending=MAX_PENDING, executor=None):
+    """
+    Yields ``rows`` rows made with ``spec`` in lists of up to
+    ``chunk_size`` rows, generated in ``executor``.
+
+    At most ``max_pending`` chunks wait in the queue, so no more than
+    ``max_pending + 2`` chunks are in memory: the queued ones, the one
+    being generated and the one being consumed.
+
+    Arguments:
+    spec -- a ``Schema``, or a callable that receives a ``Factory``
+            and returns a row
+    rows -- number of rows to generate
+
+    Keyword arguments:
+    chunk_size  -- rows per chunk
+    seed        -- master seed; same seed and chunk_size, same rows
+    now         -- reference datetime of all chunks; defaults to the
+                   current time when generation starts
+    max_pending -- chunks generated ahead of the consumer
+    executor    -- ``concurrent.futures`` executor; the default one of
+                   the loop (threads) if None. With a process pool,
+                   ``spec`` must be picklable.
+    """
+    assert max_pending > 0
+
+    if seed is None:
+        seed = random.getrandbits(64)
+    if now is None:
+        now = datetime.now()
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=max_pending)
+
+    async def produce():
+        try:
+            for index, start in enumerate(range(0, rows, chunk_size)):
+                chunk = await loop.run_in_executor(
+                    executor, make_block, spec, seed, index, min(chunk_size, rows - start), now)
+                await queue.put(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:  # from the spec, re-raised by the consumer
+            await queue.put(error)
+            return
+        await queue.put(__DONE)
+
+    producer = asyncio.ensure_future(produce())
+
+    try:
+        while True:
+            chunk = await queue.get()
+
+            if chunk is __DONE:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def aload(insert, spec, rows, chunk_size=CHUNK_SIZE, seed=None, now=None,
+                max_pending=MAX_PENDING, executor=None, progress=None):
+    """
+    Generates ``rows`` rows with ``agenerate`` and awaits
+    ``insert(chunk)`` for each chunk, like an ``executemany`` or
+    ``copy_records_to_table`` wrapper of an async driver.
+
+    Keyword arguments are those of ``agenerate``, and:
+    progress    -- callable receiving the ``SinkStats`` after each chunk
+
+    Returns a ``SinkStats``; ``bytes`` is always 0.
+    """
+    stats = SinkStats()
+    chunks = agenerate(spec, rows, chunk_size, seed, now, max_pending, executor)
+
+    try:
+        async for chunk in chunks:
+            await insert(chunk)
+
+            stats.update(len(chunk), 0)
+            if progress is not None:
+                progress(stats)
+    finally:
+        await chunks.aclose()
+
+    return stats
@@ -0,0 +1,261 @@
+# -*- coding:utf-8 -*-
+
+"""
+Arrow and Parquet output for schemas.
+
+Each column of a ``Schema`` is generated straight into an Arrow array,
+one record batch at a time, and batches are written incrementally to a
+Parquet file, so memory use is bounded by ``batch_size`` rows. Numeric
+columns skip python objects altogether when numpy is installed.
+
+This module is not imported by ``data_factory``; import it explicitly
+when pyarrow is available::
+
+    >>> from data_factory.arrow import write_parquet
+    >>> stats = write_parquet(users, 10 ** 8, 'users.parquet')
+
+"""
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "data_factory.arrow requires pyarrow; install it with "
+        "`pip install data-factory[arrow]`")
+
+try:
+    import numpy
+    from . import np as dnp
+except ImportError:  # pragma: no cover
+    numpy = dnp = None
+
+from .factory import MONEY_DIGITS, MONEY_SCALE, default_factory
+from .sinks import SinkStats
+
+
+BATCH_SIZE = 65536
+
+# arrow types for factory methods; None means inferred from values
+ARROW_TYPES = {
+    'make_tiny_integer': pyarrow.int8(),
+    'make_small_integer': pyarrow.int16(),
+    'make_integer': pyarrow.int32(),
+    'make_big_integer': pyarrow.int64(),
+    'make_unsigned_tiny_integer': pyarrow.uint8(),
+    'make_unsigned_small_integer': pyarrow.uint16(),
+    'make_unsigned_integer': pyarrow.uint32(),
+    'make_unsigned_big_integer': pyarrow.uint64(),
+    'make_real': pyarrow.float32(),
+    'make_double': pyarrow.float64(),
+    'make_boolean': pyarrow.bool_(),
+    'make_datetime': pyarrow.timestamp('us'),
+    'make_timestamp': pyarrow.int64(),
+    'make_char_sequence': pyarrow.string(),
+    'make_binary': pyarrow.string(),
+    'make_ascii_string': pyarrow.string(),
+    'make_string': pyarrow.string(),
+    'make_unicode': pyarrow.string(),
+    'make_slug': pyarrow.string(),
+    'make_hostname_label': pyarrow.string(),
+    'make_hostname': pyarrow.string(),
+    'make_email_local_part': pyarrow.string(),
+    'make_email': pyarrow.string(),
+    'make_url': pyarrow.string(),
+    'make_ip_address_str': pyarrow.string(),
+    'make_ip_address_packed': pyarrow.binary(),
+    'make_mime_type': pyarrow.string(),
+    'make_filename': pyarrow.string(),
+}
+
+
+def decimal_type(max_digits, decimal=None, precision=None):
+    """
+    Returns the smallest decimal type holding every value
+    ``make_decimal(max_digits, decimal, precision)`` can make.
+
+    """
+    scale = max_digits - (decimal or 1) if precision is None else precision
+    integer_digits = max_digits if decimal is None else decimal
+    digits = integer_digits + scale
+
+    if digits <= 38:
+        return pyarrow.decimal128(digits, scale)
+    return pyarrow.decimal256(digits, scale)
+
+
+def money_params(column):
+    """
+    Returns the ``make_money`` arguments of ``column`` as a dict.
+
+    """
+    params = dict(max_digits=MONEY_DIGITS, scale=MONEY_SCALE)
+    params.update(zip(('max_digits', 'scale', 'negative'), column.args))
+    params.update(column.kw)
+    return params
+
+
+def timezone_name(tz):
+    """
+    Returns the arrow name of timezone ``tz``, like 'Europe/Paris'
+    or '+02:00'.
+
+    """
+    if getattr(tz, 'key', None):  # zoneinfo
+        return tz.key
+    offset = int(tz.utcoffset(None).total_seconds()) // 60
+    return '%s%02d:%02d' % ('-' if offset < 0 else '+', abs(offset) // 60, abs(offset) % 60)
+
+
+def arrow_type(column):
+    """
+    Returns the arrow type of ``column`` values, or None if it
+    must be inferred.
+
+    """
+    if column.method == 'make_decimal':
+        params = dict(zip(('max_digits', 'decimal', 'precision'), column.args))
+        params.update(column.kw)
+        return decimal_type(**params)
+    if column.method == 'make_money':
+        params = money_params(column)
+        if params['max_digits'] <= 38:
+            return pyarrow.decimal128(params['max_digits'], params['scale'])
+        return pyarrow.decimal256(params['max_digits'], params['scale'])
+    if column.method == 'make_money_cents':
+        return pyarrow.int64() if money_params(column)['max_digits'] <= 18 else None
+    if column.method == 'make_datetime' and column.kw.get('tz') is not None:
+        return pyarrow.timestamp('us', tz=timezone_name(column.kw['tz']))
+    if column.method == 'make_ip_address_int':
+        params = dict(zip(('include_private', 'v', 'networks'), column.args))
+        params.update(column.kw)
+        # IPv6 addresses do not fit any arrow integer; use IPAddressPacked
+        return pyarrow.uint32() if params.get('v', 4) == 4 else None
+    return ARROW_TYPES.get(column.method)
+
+
+def __cents_array(cents, type_, mask):
+    """
+    Returns a decimal128 array of ``type_`` whose unscaled values are the
+    int64 ``cents``, sign extended to 128 bits, without python decimals.
+
+    """
+    n = len(cents)
+    data = numpy.empty((n, 2), dtype=numpy.int64)
+    data[:, 0] = cents
+    data[:, 1] = cents >> 63
+
+    if mask is None or not mask.any():
+        return pyarrow.Array.from_buffers(type_, n, [None, pyarrow.py_buffer(data)])
+
+    validity = pyarrow.py_buffer(numpy.packbits(~mask, bitorder='little'))
+    return pyarrow.Array.from_buffers(
+        type_, n, [validity, pyarrow.py_buffer(data)], null_count=int(mask.sum()))
+
+
+def __compile_money(column, type_, rng):
+    """
+    Returns a function making a decimal128 array of ``n`` amounts for a
+    ``make_money`` column, drawn as int64 cents.
+
+    """
+    params, null = money_params(column), column.null
+    params.pop('scale')
+
+    def make_array(n):
+        cents = dnp.make_money_cents_many(n, rng=rng, **params)
+        return __cents_array(cents, type_, rng.random(n) < null if null else None)
+    return make_array
+
+
+def __compile_column(column, factory, rng):
+    """
+    Returns a function making an arrow array of ``n`` values for ``column``.
+
+    """
+    type_ = arrow_type(column)
+    many = getattr(dnp, column.method + '_many', None) if dnp else None
+
+    if dnp and column.method == 'make_money' and money_params(column)['max_digits'] <= 18:
+        return __compile_money(column, type_, rng)
+
+    if many is None:
+        make_values = column.compile(factory)
+        return lambda n: pyarrow.array(make_values(n), type=type_)
+
+    (args, kw), null = column.arguments(factory), column.null
+    many(0, *args, rng=rng, **kw)  # validates arguments
+
+    def make_array(n):
+        values = many(n, *args, rng=rng, **kw)
+        mask = rng.random(n) < null if null else None
+        return pyarrow.array(values, type=type_, mask=mask)
+    return make_array
+
+
+def compile_batches(schema, factory=None):
+    """
+    Returns a function making a ``pyarrow.RecordBatch`` of ``n`` rows.
+
+    Numpy backed columns use a generator seeded from ``factory``, so
+    seeded factories still give reproducible batches.
+    """
+    factory = default_factory if factory is None else factory
+    rng = numpy.random.default_rng(factory.random.getrandbits(128)) if numpy else None
+    makers = [__compile_column(c, factory, rng) for c in schema.columns.values()]
+    names = schema.names
+
+    def make_batch(n):
+        return pyarrow.RecordBatch.from_arrays([make(n) for make in makers], names=names)
+    return make_batch
+
+
+def record_batches(schema, rows, batch_size=BATCH_SIZE, factory=None):
+    """
+    Yields ``rows`` rows of ``schema`` as record batches of up to
+    ``batch_size`` rows.
+
+    """
+    make_batch = compile_batches(schema, factory)
+
+    for start in range(0, rows, batch_size):
+        yield make_batch(min(batch_size, rows - start))
+
+
+def write_parquet(schema, rows, target, batch_size=BATCH_SIZE, factory=None,
+                  progress=None, **writer_options):
+    """
+    Writes ``rows`` rows of ``schema`` to a Parquet file, one record
+    batch at a time.
+
+    Arguments:
+    schema  -- ``data_factory.schema.Schema``
+    rows    -- number of rows
+    target  -- path or binary file object
+
+    Keyword arguments:
+    batch_size      -- rows per record batch (and row group)
+    factory         -- ``Factory`` used to generate values
+    progress        -- callable receiving the ``SinkStats`` after each batch
+    writer_options  -- ``pyarrow.parquet.ParquetWriter`` options, like
+                       ``compression``
+
+    Returns a ``SinkStats``; ``bytes`` counts in memory arrow bytes.
+    """
+    stats = SinkStats()
+    writer = None
+
+    try:
+        for batch in record_batches(schema, rows, batch_size, factory):
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(target, batch.schema, **writer_options)
+            writer.write_batch(batch)
+
+            stats.update(batch.num_rows, batch.nbytes)
+            if progress is not None:
+                progress(stats)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return stats
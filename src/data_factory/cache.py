@@ -0,0 +1,544 @@
+# -*- coding:utf-8 -*-
+
+"""
+On-disk cache of generated datasets.
+
+A dataset is identified by a fingerprint of its schema (generators and
+arguments), number of rows, seed, reference time, chunk size, the
+version of data-factory and a hash of its source code, so that a
+change to any generator makes a new dataset instead of reusing a stale
+one. Columns are stored in a compact binary format and memory-mapped
+when loaded, instead of being generated again::
+
+    >>> from data_factory.cache import DatasetCache
+    >>> cache = DatasetCache(max_bytes=2 * 1024 ** 3)
+    >>> users = cache.get(schema, 10 ** 7, seed=42, now=datetime(2024, 1, 1))
+    >>> users.columns['email'][123]
+
+Fixed width columns (integers, floats, booleans, timestamps, naive
+datetimes) are raw arrays read through ``memoryview``, text and bytes
+columns are offsets and a data blob, decoded on access, and other
+columns are pickled.
+Datasets least recently used are removed when the cache grows over
+``max_bytes``, and datasets of other versions of the code first.
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import pickle
+import shutil
+import hashlib
+
+from array import array
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+from .factory import Factory, INT_TYPECODES
+
+
+MAX_BYTES = 1024 ** 3
+CHUNK_SIZE = 100000
+
+# fixed width columns, as array typecodes
+FIXED_TYPES = {
+    'make_tiny_integer': INT_TYPECODES[True, 1],
+    'make_small_integer': INT_TYPECODES[True, 2],
+    'make_integer': INT_TYPECODES[True, 4],
+    'make_big_integer': INT_TYPECODES[True, 8],
+    'make_unsigned_tiny_integer': INT_TYPECODES[False, 1],
+    'make_unsigned_small_integer': INT_TYPECODES[False, 2],
+    'make_unsigned_integer': INT_TYPECODES[False, 4],
+    'make_unsigned_big_integer': INT_TYPECODES[False, 8],
+    'make_timestamp': INT_TYPECODES[True, 8],
+    'make_real': 'd',
+    'make_double': 'd',
+    'make_boolean': '?',
+}
+TEXT_METHODS = frozenset([
+    'make_char_sequence', 'make_binary', 'make_ascii_string', 'make_string', 'make_unicode',
+    'make_slug', 'make_hostname_label', 'make_hostname', 'make_email_local_part', 'make_email',
+    'make_url', 'make_ip_address_str', 'make_mime_type', 'make_filename',
+])
+BYTES_METHODS = frozenset(['make_ip_address_packed'])
+# columns relative to ``now``, the current time unless pinned
+DATE_METHODS = frozenset(['make_datetime', 'make_timestamp'])
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+__code_hash = None
+
+
+def code_hash():
+    """
+    Returns a hash of the source files of ``data_factory``, so that
+    cached datasets are not reused once the generators change.
+
+    """
+    global __code_hash
+
+    if __code_hash is None:
+        package = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+
+        for name in sorted(os.listdir(package)):
+            if name.endswith('.py'):
+                with open(os.path.join(package, name), 'rb') as f:
+                    digest.update(name.encode('utf-8') + b'\0' + f.read())
+        __code_hash = digest.hexdigest()
+    return __code_hash
+
+
+def column_encoding(column):
+    """
+    Returns how values of ``column`` are stored: an array typecode,
+    'text', 'bytes', 'datetime' or 'pickle'. 'datetime' columns may
+    still turn to 'pickle', see ``ColumnWriter``.
+
+    """
+    if column.method in FIXED_TYPES:
+        return FIXED_TYPES[column.method]
+    if column.method in TEXT_METHODS:
+        return 'text'
+    if column.method in BYTES_METHODS:
+        return 'bytes'
+    if column.method == 'make_datetime' and column.kw.get('tz') is None and len(column.args) < 5:
+        return 'datetime'  # naive, as microseconds, unless values are aware
+    return 'pickle'
+
+
+class MaskedColumn(object):
+    """
+    Read only sequence of ``values`` with ``None`` where ``nulls`` is set.
+
+    """
+    def __init__(self, values, nulls):
+        self.values = values
+        self.nulls = nulls
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return None if self.nulls[index] else self.values[index]
+
+    def __iter__(self):
+        return (None if null else value for value, null in zip(self.values, self.nulls))
+
+    def tolist(self):
+        return list(self)
+
+
+class BlobColumn(object):
+    """
+    Read only sequence of the text or bytes values stored in ``data``
+    between consecutive ``offsets``.
+
+    """
+    def __init__(self, offsets, data, text):
+        self.offsets = offsets
+        self.data = data
+        self.text = text
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        value = self.data[self.offsets[index]:self.offsets[index + 1]]
+        return str(value, 'utf-8') if self.text else bytes(value)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def tolist(self):
+        return list(self)
+
+
+class DatetimeColumn(object):
+    """
+    Read only sequence of naive datetimes stored as ``microseconds``
+    since the epoch.
+
+    """
+    def __init__(self, microseconds):
+        self.microseconds = microseconds
+
+    def __len__(self):
+        return len(self.microseconds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EPOCH + timedelta(microseconds=v) for v in self.microseconds[index]]
+        return EPOCH + timedelta(microseconds=self.microseconds[index])
+
+    def __iter__(self):
+        return (EPOCH + timedelta(microseconds=v) for v in self.microseconds)
+
+    def tolist(self):
+        return list(self)
+
+
+class CachedDataset(object):
+    """
+    Columns of a dataset loaded from the cache. Fixed width and blob
+    columns are backed by memory maps, released by ``close``.
+
+    """
+    def __init__(self, key, names, columns, resources):
+        self.key = key
+        self.names = names
+        self.columns = dict(zip(names, columns))
+        self.__resources = resources
+
+    def __repr__(self):
+        return '<CachedDataset %s rows=%d columns=%s>' % (self.key[:12], len(self), ', '.join(self.names))
+
+    def __len__(self):
+        return len(self.columns[self.names[0]]) if self.names else 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def tuples(self):
+        """
+        Returns the rows as a list of tuples.
+
+        """
+        return list(zip(*[self.columns[name] for name in self.names]))
+
+    def close(self):
+        """
+        Releases the memory maps; columns can not be read afterwards.
+
+        """
+        for resource in reversed(self.__resources):  # views before their maps
+            if isinstance(resource, memoryview):
+                resource.release()
+            else:
+                resource.close()
+        self.__resources = []
+
+
+class ColumnWriter(object):
+    """
+    Appends chunks of values of a column to its files in ``path``.
+
+    'datetime' columns are checked on their first value: aware ones,
+    from aware bounds or ``now``, are pickled instead, and ``encoding``
+    is then 'pickle'.
+    """
+    def __init__(self, path, encoding):
+        self.path = path
+        self.encoding = encoding
+        self.checked = encoding != 'datetime'
+        self.rows = 0
+        self.nulls = bytearray()
+        self.data = open(path + '.data', 'wb')
+        self.offsets = None
+
+        if encoding in ('text', 'bytes'):
+            self.offsets = open(path + '.offsets', 'wb')
+            self.end = 0
+            array('q', [0]).tofile(self.offsets)
+
+    def write(self, values):
+        if not self.checked:
+            self.__check(values)
+
+        self.rows += len(values)
+        self.nulls.extend(value is None for value in values)
+        encoding = self.encoding
+
+        if encoding == 'pickle':
+            pickle.dump(values, self.data, pickle.HIGHEST_PROTOCOL)
+            return
+
+        if encoding in ('text', 'bytes'):
+            if encoding == 'text':
+                blobs = [b'' if v is None else v.encode('utf-8') for v in values]
+            else:
+                blobs = [b'' if v is None else bytes(v) for v in values]
+
+            ends = array('q', accumulate(map(len, blobs), initial=self.end))
+            self.end = ends[-1]
+
+            self.data.write(b''.join(blobs))
+            ends[1:].tofile(self.offsets)
+            return
+
+        if encoding == 'datetime':
+            values = [v if v is None else (v - EPOCH) // MICROSECOND for v in values]
+            encoding = 'q'
+
+        fill = False if encoding == '?' else 0
+        values = [fill if v is None else v for v in values]
+        if encoding == '?':
+            self.data.write(bytes(values))
+        else:
+            array(encoding, values).tofile(self.data)
+
+    def __check(self, values):
+        first = next((v for v in values if v is not None), None)
+        if first is None:
+            return
+
+        self.checked = True
+        if first.tzinfo is not None:
+            self.encoding = 'pickle'
+            self.data.seek(0)
+            self.data.truncate()
+            if self.rows:  # only None values so far
+                pickle.dump([None] * self.rows, self.data, pickle.HIGHEST_PROTOCOL)
+
+    def close(self):
+        self.data.close()
+        if self.offsets is not None:
+            self.offsets.close()
+
+        if self.encoding != 'pickle' and any(self.nulls):  # pickles keep None
+            with open(self.path + '.nulls', 'wb') as f:
+                f.write(self.nulls)
+
+
+class DatasetCache(object):
+    """
+    Directory of cached datasets, of up to ``max_bytes`` bytes.
+
+    Keyword arguments:
+    directory   -- defaults to ``$DATA_FACTORY_CACHE``, or
+                   ``~/.cache/data-factory``
+    max_bytes   -- total size over which least recently used datasets
+                   are removed
+    """
+    def __init__(self, directory=None, max_bytes=MAX_BYTES):
+        if directory is None:
+            directory = os.environ.get('DATA_FACTORY_CACHE') or os.path.join(
+                os.path.expanduser('~'), '.cache', 'data-factory')
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return '<DatasetCache %s max_bytes=%d>' % (self.directory, self.max_bytes)
+
+    @staticmethod
+    def __map(path, resources):
+        """
+        Returns a read only memoryview of a memory map of ``path``. An
+        empty file cannot be mapped, it gives an empty view.
+
+        """
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return memoryview(b'')
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(m)
+        resources.extend([m, view])
+        return view
+
+    @staticmethod
+    def __read_column(path, encoding, resources):
+        """
+        Returns the values of a column written by ``ColumnWriter``.
+        Memory maps and views to release are added to ``resources``.
+
+        """
+        if encoding == 'pickle':
+            values = []
+            with open(path + '.data', 'rb') as f:
+                while True:
+                    try:
+                        values.extend(pickle.load(f))
+                    except EOFError:
+                        return values  # None values are pickled as such
+
+        if encoding in ('text', 'bytes'):
+            offsets = DatasetCache.__map(path + '.offsets', resources).cast('q')
+            data = DatasetCache.__map(path + '.data', resources)
+            resources.append(offsets)
+            values = BlobColumn(offsets, data, encoding == 'text')
+        elif encoding == 'datetime':
+            microseconds = DatasetCache.__map(path + '.data', resources).cast('q')
+            resources.append(microseconds)
+            values = DatetimeColumn(microseconds)
+        else:
+            values = DatasetCache.__map(path + '.data', resources).cast(encoding)
+            resources.append(values)
+
+        if os.path.exists(path + '.nulls'):
+            with open(path + '.nulls', 'rb') as f:
+                return MaskedColumn(values, f.read())
+        return values
+
+    @staticmethod
+    def __uses_now(schema):
+        """
+        Tells if dates of ``schema`` depend on the current time, that is
+        if it has date columns not given their own ``now``.
+
+        """
+        return any(
+            column.method in DATE_METHODS and len(column.args) < 3 and column.kw.get('now') is None
+            for column in schema.columns.values())
+
+    @staticmethod
+    def __version():
+        import data_factory
+        return '%s:%s' % (data_factory.__version__, code_hash())
+
+    def key(self, schema, rows, seed, now=None, chunk_size=CHUNK_SIZE):
+        """
+        Returns the fingerprint of a dataset, as an hexadecimal string.
+        ``seed`` is required, and so is ``now`` for schemas with date
+        columns, which would otherwise be pinned to the time they were
+        stored.
+
+        """
+        if seed is None:
+            raise ValueError("datasets without a seed can not be cached")
+        if now is None and self.__uses_now(schema):
+            raise ValueError("datasets with date columns can not be cached without a pinned now")
+
+        spec = repr((repr(schema), rows, seed, now, chunk_size, sys.byteorder, self.__version()))
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+    def load(self, schema, rows, seed, now=None, chunk_size=CHUNK_SIZE):
+        """
+        Returns the cached dataset, or None if it is not cached.
+
+        """
+        key = self.key(schema, rows, seed, now, chunk_size)
+        path = os.path.join(self.directory, key)
+
+        try:
+            with open(os.path.join(path, 'meta.json')) as f:
+                meta = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        os.utime(os.path.join(path, 'meta.json'))  # last use, for eviction
+        resources = []
+        columns = [
+            self.__read_column(os.path.join(path, 'c%d' % i), encoding, resources)
+            for i, encoding in enumerate(meta['encodings'])]
+        return CachedDataset(key, meta['names'], columns, resources)
+
+    def store(self, schema, rows, seed, now=None, chunk_size=CHUNK_SIZE):
+        """
+        Generates the dataset, stores it and returns it loaded from the
+        cache. Values are those of ``schema.chunks(rows, chunk_size,
+        Factory(seed=seed, now=now), format='columns')``.
+
+        """
+        key = self.key(schema, rows, seed, now, chunk_size)
+        path = os.path.join(self.directory, key)
+        temporary = '%s.%d.tmp' % (path, os.getpid())
+
+        shutil.rmtree(temporary, ignore_errors=True)
+        os.makedirs(temporary)
+
+        try:
+            names = schema.names
+            encodings = [column_encoding(column) for column in schema.columns.values()]
+            writers = [
+                ColumnWriter(os.path.join(temporary, 'c%d' % i), encoding)
+                for i, encoding in enumerate(encodings)]
+
+            factory = Factory(seed=seed, now=now)
+            for chunk in schema.chunks(rows, chunk_size, factory, format='columns'):
+                for name, writer in zip(names, writers):
+                    writer.write(chunk[name])
+            for writer in writers:
+                writer.close()
+            encodings = [writer.encoding for writer in writers]
+
+            with open(os.path.join(temporary, 'meta.json'), 'w') as f:
+                json.dump(dict(
+                    names=names, encodings=encodings, rows=rows, schema=repr(schema),
+                    version=self.__version(), created=time.time(),
+                ), f)
+
+            try:
+                os.rename(temporary, path)
+            except OSError:  # stored meanwhile by another process
+                shutil.rmtree(temporary, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(temporary, ignore_errors=True)
+            raise
+
+        self.evict(keep=key)
+        return self.load(schema, rows, seed, now, chunk_size)
+
+    def get(self, schema, rows, seed, now=None, chunk_size=CHUNK_SIZE):
+        """
+        Returns the dataset from the cache, generating and storing it
+        first if it is not there.
+
+        """
+        dataset = self.load(schema, rows, seed, now, chunk_size)
+        if dataset is None:
+            dataset = self.store(schema, rows, seed, now, chunk_size)
+        return dataset
+
+    def entries(self):
+        """
+        Returns a list of ``(key, bytes, last_used, version)`` of the
+        cached datasets, least recently used first.
+
+        """
+        entries = []
+        for key in os.listdir(self.directory):
+            path = os.path.join(self.directory, key)
+            try:
+                with open(os.path.join(path, 'meta.json')) as f:
+                    version = json.load(f).get('version')
+                last_used = os.stat(os.path.join(path, 'meta.json')).st_mtime
+            except (IOError, OSError, ValueError):
+                continue  # being written, or not a dataset
+
+            size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+            entries.append((key, size, last_used, version))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self, keep=None):
+        """
+        Removes the datasets made by other versions of the code, then
+        the least recently used ones until the cache fits in
+        ``max_bytes``. Returns the keys removed.
+
+        """
+        entries, version = self.entries(), self.__version()
+        total = sum(entry[1] for entry in entries)
+        removed = []
+
+        stale = [entry for entry in entries if entry[3] != version]
+        fresh = [entry for entry in entries if entry[3] == version]
+
+        for key, size, last_used, entry_version in stale + fresh:
+            if key == keep or (entry_version == version and total <= self.max_bytes):
+                continue
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+            removed.append(key)
+            total -= size
+        return removed
+
+    def clear(self):
+        """
+        Removes all cached datasets.
+
+        """
+        for key, size, last_used, version in self.entries():
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
@@ -0,0 +1,115 @@
+# -*- coding:utf-8 -*-
+
+"""
+Lazily loaded, cached value catalogs.
+
+Catalogs are built on first use and kept as deduplicated, sorted
+tuples, so drawing a value from them is a single ``random.choice``.
+The ``mimetypes`` database, read from system files, is only loaded
+when a mime type or file extension catalog is first asked for.
+"""
+
+from functools import lru_cache, reduce
+
+
+# domain suffixes of make_hostname and make_email by default
+DEFAULT_TLDS = ('.com', '.org', '.net')
+
+# common domain suffixes, for domains=TLDS
+TLDS = (
+    '.com', '.org', '.net', '.edu', '.gov', '.info', '.biz', '.io', '.co',
+    '.dev', '.app', '.ai', '.me', '.tv', '.us', '.uk', '.co.uk', '.de',
+    '.fr', '.es', '.it', '.nl', '.be', '.ch', '.at', '.se', '.no', '.dk',
+    '.fi', '.pl', '.pt', '.ru', '.cn', '.jp', '.kr', '.in', '.au',
+    '.com.au', '.ca', '.br', '.com.br', '.mx', '.ar', '.cl', '.za',
+)
+
+# IANA IPv4 special-purpose address registry, plus multicast
+IPV4_SPECIAL_NETWORKS = (
+    '0.0.0.0/8', '10.0.0.0/8', '100.64.0.0/10', '127.0.0.0/8',
+    '169.254.0.0/16', '172.16.0.0/12', '192.0.0.0/24', '192.0.2.0/24',
+    '192.31.196.0/24', '192.52.193.0/24', '192.88.99.0/24', '192.168.0.0/16',
+    '192.175.48.0/24', '198.18.0.0/15', '198.51.100.0/24', '203.0.113.0/24',
+    '224.0.0.0/4', '240.0.0.0/4', '255.255.255.255/32',
+)
+
+# IANA IPv6 special-purpose address registry, plus link-local and multicast
+IPV6_SPECIAL_NETWORKS = (
+    '::/128', '::1/128', '::ffff:0:0/96', '64:ff9b::/96', '64:ff9b:1::/48',
+    '100::/64', '2001::/23', '2001:db8::/32', '2002::/16', '2620:4f:8000::/48',
+    '3fff::/20', '5f00::/16', 'fc00::/7', 'fe80::/10', 'ff00::/8',
+)
+
+# IPv6 global unicast space; the rest is reserved by the IETF
+IPV6_GLOBAL_UNICAST = '2000::/3'
+
+
+@lru_cache(maxsize=None)
+def __types_map():
+    import mimetypes
+
+    if not mimetypes.inited:  # init() would drop the types added by users
+        mimetypes.init()
+    return dict(mimetypes.types_map)
+
+
+@lru_cache(maxsize=None)
+def mime_types():
+    """
+    Returns a tuple of the known mime types.
+
+    """
+    return tuple(sorted(set(__types_map().values())))
+
+
+@lru_cache(maxsize=None)
+def extensions():
+    """
+    Returns a tuple of the known file extensions, like '.txt'.
+
+    """
+    return tuple(sorted(__types_map()))
+
+
+@lru_cache(maxsize=None)
+def mime_extension_pairs():
+    """
+    Returns a tuple of (mime type, extension) pairs, one for
+    each known extension.
+
+    """
+    return tuple(sorted((mime, ext) for ext, mime in __types_map().items()))
+
+
+@lru_cache(maxsize=None)
+def __extensions_by_mime_type():
+    result = dict()
+    for mime, ext in mime_extension_pairs():
+        result.setdefault(mime, []).append(ext)
+    return dict((mime, tuple(exts)) for mime, exts in result.items())
+
+
+def extensions_for(mime_type):
+    """
+    Returns a tuple of the extensions of ``mime_type``.
+
+    """
+    try:
+        return __extensions_by_mime_type()[mime_type]
+    except KeyError:
+        raise ValueError("unknown mime type %r" % mime_type)
+
+
+@lru_cache(maxsize=128)
+def __get_suffixes(suffixes):
+    return suffixes, reduce(max, map(len, suffixes))
+
+
+def get_suffixes(suffixes):
+    """
+    Returns domain or file extension ``suffixes`` as a tuple and the
+    length of the longest one. Results are cached, so suffix lists
+    are only inspected once.
+
+    """
+    return __get_suffixes(tuple(suffixes))
@@ -0,0 +1,250 @@
+# -*- coding:utf-8 -*-
+
+"""
+Non uniform distributions for the numeric generators.
+
+A distribution is prepared once and given to ``make_integer``,
+``make_big_integer``, ``make_real`` or ``make_double`` (and their
+``_many`` companions) as ``distribution``; values outside of the
+generator range are clamped to it::
+
+    >>> from data_factory import make_integer_many, Zipf
+    >>> product_ids = make_integer_many(10 ** 6, distribution=Zipf(1.1, 10 ** 5))
+
+Distributions draw from any object with the ``random.Random``
+interface, so seeded factories stay reproducible, and ``draw_array``
+draws a whole array from a ``numpy.random.Generator`` for
+``data_factory.np``.
+"""
+
+from math import exp, expm1, log, log1p
+
+from .factory import WeightedChoices
+from .instrumentation import add_retries
+
+
+# zipf distributions over up to this many ranks use an alias table
+ZIPF_TABLE_SIZE = 2 ** 16
+
+
+class Distribution(object):
+    """
+    Base distribution. Subclasses implement ``draw_one``.
+
+    """
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(
+            '%s=%r' % item for item in sorted(vars(self).items()) if not item[0].startswith('_')))
+
+    def draw_one(self, rng):
+        """
+        Returns one value, drawn from ``rng``.
+
+        """
+        raise NotImplementedError()
+
+    def draw(self, rng, n):
+        """
+        Returns a list of ``n`` values, drawn from ``rng``.
+
+        """
+        draw_one = self.draw_one
+        return [draw_one(rng) for i in range(n)]
+
+    def draw_array(self, generator, n):
+        """
+        Returns a numpy array of ``n`` values, drawn from the
+        ``numpy.random.Generator`` ``generator``.
+
+        """
+        raise NotImplementedError()
+
+
+class Normal(Distribution):
+    """
+    Normal distribution of mean ``mu`` and standard deviation ``sigma``.
+
+    """
+    def __init__(self, mu=0.0, sigma=1.0):
+        if not sigma > 0:
+            raise ValueError("sigma must be positive, not %r" % (sigma,))
+        self.mu = mu
+        self.sigma = sigma
+
+    def draw_one(self, rng):
+        return rng.gauss(self.mu, self.sigma)
+
+    def draw(self, rng, n):
+        gauss, mu, sigma = rng.gauss, self.mu, self.sigma
+        return [gauss(mu, sigma) for i in range(n)]
+
+    def draw_array(self, generator, n):
+        return generator.normal(self.mu, self.sigma, n)
+
+
+class Exponential(Distribution):
+    """
+    Exponential distribution of rate ``rate`` (mean ``1 / rate``), like
+    waiting times.
+
+    """
+    def __init__(self, rate=1.0):
+        if not rate > 0:
+            raise ValueError("rate must be positive, not %r" % (rate,))
+        self.rate = rate
+
+    def draw_one(self, rng):
+        return rng.expovariate(self.rate)
+
+    def draw(self, rng, n):
+        expovariate, rate = rng.expovariate, self.rate
+        return [expovariate(rate) for i in range(n)]
+
+    def draw_array(self, generator, n):
+        return generator.exponential(1 / self.rate, n)
+
+
+class Pareto(Distribution):
+    """
+    Pareto distribution of shape ``alpha`` and minimum ``scale``, like
+    sizes or incomes: the smaller ``alpha``, the longer the tail.
+
+    """
+    def __init__(self, alpha, scale=1.0):
+        if not alpha > 0 or not scale > 0:
+            raise ValueError("alpha and scale must be positive")
+        self.alpha = alpha
+        self.scale = scale
+
+    def draw_one(self, rng):
+        return self.scale * rng.paretovariate(self.alpha)
+
+    def draw(self, rng, n):
+        paretovariate, alpha, scale = rng.paretovariate, self.alpha, self.scale
+        return [scale * paretovariate(alpha) for i in range(n)]
+
+    def draw_array(self, generator, n):
+        # numpy draws the Lomax distribution, a Pareto shifted to 0
+        return self.scale * (generator.pareto(self.alpha, n) + 1)
+
+
+class Zipf(Distribution):
+    """
+    Zipf distribution of exponent ``s`` over the ranks 1 to ``n``: rank
+    ``k`` is drawn with a probability proportional to ``k ** -s``, like
+    the popularity of keys, words or products.
+
+    Up to ``ZIPF_TABLE_SIZE`` ranks, an alias table of the ranks is
+    prepared and each draw takes constant time. Above it, draws use
+    rejection-inversion (Hörmann and Derflinger, 1996), which takes
+    constant time and memory whatever ``n``, but is slower.
+    """
+    def __init__(self, s, n):
+        if not s > 0:
+            raise ValueError("s must be positive, not %r" % (s,))
+        if n < 1:
+            raise ValueError("n must be positive, not %r" % (n,))
+
+        self.s = s
+        self.n = n
+        self._table = self._cdf = None
+
+        if n <= ZIPF_TABLE_SIZE:
+            self._table = WeightedChoices(range(1, n + 1), [k ** -s for k in range(1, n + 1)])
+        else:
+            self._h_integral_x1 = self.h_integral(1.5) - 1
+            self._h_integral_n = self.h_integral(n + 0.5)
+            self._s_bound = 2 - self.h_integral_inverse(self.h_integral(2.5) - self.h(2))
+
+    @staticmethod
+    def __helper1(x):
+        """ log1p(x) / x, 1 at 0 """
+        return log1p(x) / x if abs(x) > 1e-8 else 1 - x / 2
+
+    @staticmethod
+    def __helper2(x):
+        """ expm1(x) / x, 1 at 0 """
+        return expm1(x) / x if abs(x) > 1e-8 else 1 + x / 2
+
+    def h(self, x):
+        return exp(-self.s * log(x))
+
+    def h_integral(self, x):
+        """
+        Integral of ``h``, ``(x ** (1 - s) - 1) / (1 - s)``.
+
+        """
+        log_x = log(x)
+        return self.__helper2((1 - self.s) * log_x) * log_x
+
+    def h_integral_inverse(self, x):
+        t = max(-1.0, x * (1 - self.s))
+        return exp(self.__helper1(t) * x)
+
+    def draw_one(self, rng):
+        if self._table is not None:
+            return self._table.draw_one(rng.random)
+
+        return self.draw(rng, 1)[0]
+
+    def draw(self, rng, n):
+        if self._table is not None:
+            return self._table.draw(rng.random, n)
+
+        random, size, s = rng.random, self.n, self.s
+        h_integral_n, width = self._h_integral_n, self._h_integral_x1 - self._h_integral_n
+        s_bound, values, draws = self._s_bound, [], 0
+
+        for i in range(n):
+            while True:
+                draws += 1
+                u = h_integral_n + random() * width
+                t = u * (1 - s)  # h_integral_inverse(u), inlined
+                x = exp(log1p(t) / t * u) if t > -1 and abs(t) > 1e-8 else self.h_integral_inverse(u)
+                k = int(x + 0.5)
+                k = 1 if k < 1 else size if k > size else k
+                if k - x <= s_bound or u >= self.h_integral(k + 0.5) - self.h(k):
+                    values.append(k)
+                    break
+
+        if draws > n:
+            add_retries('zipf', draws - n)
+        return values
+
+    def draw_array(self, generator, n):
+        import numpy
+
+        if self._table is not None:
+            if self._cdf is None:
+                cdf = numpy.array(self._table.cum_weights)
+                self._cdf = cdf / cdf[-1]
+            ranks = numpy.searchsorted(self._cdf, generator.random(n), side='right') + 1
+            return numpy.minimum(ranks, self.n)
+
+        # rejection-inversion as in draw_one, redrawing the rejected values
+        s, size = self.s, self.n
+        h_integral_n, width = self._h_integral_n, self._h_integral_x1 - self._h_integral_n
+
+        def helper(x, f, slope):
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                return numpy.where(numpy.abs(x) > 1e-8, f(x) / x, 1 + slope * x)
+
+        def h_integral(x):
+            log_x = numpy.log(x)
+            return helper((1 - s) * log_x, numpy.expm1, 0.5) * log_x
+
+        ranks = numpy.empty(n, dtype=numpy.int64)
+        pending = numpy.arange(n)
+
+        while len(pending):
+            u = h_integral_n + generator.random(len(pending)) * width
+            t = numpy.maximum(-1.0, u * (1 - s))
+            x = numpy.exp(helper(t, numpy.log1p, -0.5) * u)
+            k = numpy.clip(numpy.floor(x + 0.5), 1, size)
+            accepted = (k - x <= self._s_bound) | (u >= h_integral(k + 0.5) - numpy.exp(-s * numpy.log(k)))
+
+            ranks[pending[accepted]] = k[accepted]
+            pending = pending[~accepted]
+            if len(pending):
+                add_retries('zipf', len(pending))
+        return ranks
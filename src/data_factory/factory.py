@@ -1,25 +1,19 @@
 # -*- coding:utf-8 -*-
 
-import re
 import sys
-import string
+import codecs
 import random
-import mimetypes
 
-from functools import reduce
-from decimal import Decimal
-from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_right
+from math import floor
+from itertools import accumulate, repeat
+from functools import lru_cache
+from decimal import Decimal, Context, MAX_PREC
+from datetime import datetime, timedelta, timezone
 
-
-try:  # for py2 and py3
-    __g = globals()
-    unichr = __g['__builtins__'].get('unichr', chr)
-    unicode = __g['__builtins__'].get('unicode', str)
-    basestring = __g['__builtins__'].get('basestring', str)
-except AttributeError:  # for pypy
-    unichr = getattr(__g['__builtins__'], 'unichr', None)
-    unicode = getattr(__g['__builtins__'], 'unicode', None)
-    basestring = getattr(__g['__builtins__'], 'basestring', None)
+from . import catalogs
+from .catalogs import get_suffixes
 
 
 MIN_TINY_INT, MAX_TINY_INT = -128, 127  # 8bits integer
@@ -29,11 +23,60 @@ MIN_BIG_INT, MAX_BIG_INT = -9223372036854775808, 9223372036854775807  # 64bits i
 
 REAL_DIGITS = 23
 DOUBLE_DIGITS = 53
+# DECIMAL(12, 2) amounts for make_money
+MONEY_DIGITS = 12
+MONEY_SCALE = 2
+# decimals are built exactly, whatever their number of digits
+DECIMAL_CONTEXT = Context(prec=MAX_PREC)
 
 # complete character ascii table
-ASCII_TABLE = ''.join([chr(j) for j in range(255)])
-SLUG_TABLE = string.ascii_letters + string.digits + '-_'
+ASCII_TABLE = bytes(range(255)).decode('latin-1')
+# string.digits, string.ascii_letters and string.printable, without
+# importing string, which imports re
+DIGITS_TABLE = '0123456789'
+LETTERS_TABLE = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+PRINTABLE_TABLE = DIGITS_TABLE + LETTERS_TABLE + '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ \t\n\r\x0b\x0c'
+SLUG_TABLE = LETTERS_TABLE + DIGITS_TABLE + '-_'
 BINARY_TABLE = '01'
+HOSTNAME_TABLE = LETTERS_TABLE + DIGITS_TABLE
+HOSTNAME_HYPHEN_TABLE = HOSTNAME_TABLE + '-'
+EMAIL_LOCAL_TABLE = LETTERS_TABLE + DIGITS_TABLE + "!#$%&'*+-/=?^_`{|}~"
+EMAIL_LOCAL_DOT_TABLE = EMAIL_LOCAL_TABLE + '.'
+FILENAME_TABLE = ''.join([c for c in PRINTABLE_TABLE if c not in '/?%*:|"<>'])
+
+# unicode blocks for make_unicode, as inclusive code point ranges
+UNICODE_BLOCKS = dict(
+    all=((0, sys.maxunicode),),
+    bmp=((0, 0xFFFF),),
+    smp=((0x10000, 0x1FFFF),),
+    latin=((0x20, 0x7E), (0xA0, 0x24F)),
+    greek=((0x370, 0x3FF),),
+    cyrillic=((0x400, 0x4FF),),
+    arabic=((0x600, 0x6FF),),
+    hebrew=((0x590, 0x5FF),),
+    kana=((0x3040, 0x30FF),),
+    hangul=((0xAC00, 0xD7A3),),
+    cjk=((0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)),
+    emoji=((0x2600, 0x27BF), (0x1F300, 0x1F64F), (0x1F680, 0x1F6FF), (0x1F900, 0x1FAFF)),
+)
+SURROGATES = (0xD800, 0xDFFF)
+
+# microseconds per step of each datetime resolution
+TIME_UNITS = dict(s=10 ** 6, ms=10 ** 3, us=1)
+EPOCH = datetime(1970, 1, 1)
+UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+# weighted choices batches bisect cumulative weights up to this size
+BISECT_SIZE = 64
+# weighted choices kept prepared by get_weighted_choices
+WEIGHTED_CACHE_SIZE = 64
+
+# array typecodes indexed by (signed, size in bytes)
+INT_TYPECODES = dict()
+for __code in 'BHILQbhilq':
+    INT_TYPECODES.setdefault((__code.islower(), array(__code).itemsize), __code)
+del __code
 
 
 error_msgs = dict()
@@ -41,478 +84,1743 @@ error_msgs["max_length"] = "Informed max_length %d is too small."
 error_msgs["max_length_ext"] = "max_length is too small for given extensions"
 
 
-def __make_decimal_str(max_digits, decimal_length=None, precision_length=None):
+class CharTable(object):
     """
-    Makes a decimal number with up to `max_digits` digits.
+    Lookup structures to turn random bytes into characters of ``table``.
 
-    Arguments:
-    max_digits - max number of digits for the number
-    decimal_length - number of decimal places for the decimal part of the float
-    precision_length - number of decimal places for the precision part of the float
+    Byte ``b`` maps to ``table[b % len(table)]``. Bytes above the largest
+    multiple of ``len(table)`` are dropped, so every position of the
+    table stays equally likely. Only tables of up to 256 characters
+    can be used, see ``get_char_table``.
     """
+    def __init__(self, table):
+        size = len(table)
+        limit = 256 - 256 % size
 
-    if decimal_length is None and precision_length is None:
-        decimal_length = random.randint(1, max_digits)
-        precision_length = random.randint(0, max_digits - decimal_length)
-    elif decimal_length is None and precision_length is not None:
-        assert precision_length >= 0
-        assert precision_length < max_digits
-        decimal_length = random.randint(1, max_digits - precision_length)
-    elif precision_length is None and decimal_length is not None:
-        assert decimal_length <= max_digits
-        assert decimal_length > 0
-        precision_length = random.randint(0, max_digits - decimal_length)
-    else:  # neither is none
-        assert (decimal_length + precision_length) < max_digits
-        assert decimal_length > 0
-        assert precision_length >= 0
-        assert precision_length < max_digits
-
-    return "%s.%s" % (
-        make_char_sequence(string.digits, decimal_length),
-        make_char_sequence(string.digits, precision_length)
-    )
-
-
-def choose(choices):
-    """
-    Alias for random.choice
+        self.table = table
+        self.decoding = ''.join([table[b % size] for b in range(limit)]) + '\0' * (256 - limit)
+        self.rejected = bytes(range(limit, 256))
+        self.ratio = 256.0 / limit  # random bytes needed per character
 
-    """
-    return random.choice(choices)
+    def draw(self, getrandbits, length):
+        """
+        Returns a random string of ``length`` characters of the table,
+        using ``getrandbits`` as source.
 
+        """
+        data = b''
 
-def unsigned(number):
-    """
-    Generates the corresponding unsigned integer for ``number``
+        while len(data) < length:
+            missing = length - len(data)
+            size = int(missing * self.ratio) + 8 if self.rejected else missing
+            data += getrandbits(8 * size).to_bytes(size, 'little').translate(None, self.rejected)
 
-    Arguments:
-    number -- some integer value
+        return codecs.charmap_decode(data[:length], 'strict', self.decoding)[0]
 
-    """
-    return number * 2 + 1
 
+@lru_cache(maxsize=256)
+def __get_char_table(table):
+    if 0 < len(table) <= 256:
+        return CharTable(table)
 
-def or_null(fnc, frequency=0.5):
-    """
-    Decorates a function so that it may return ``null``
-
-    Arguments:
-    fnc -- factory function
-
-    Keyword arguments:
-    frequency -- how often you should get a null value
 
+def get_char_table(table):
     """
-    def _fnc(*args, **kw):
-        if random.random() < frequency:
-            return None
-        else:
-            return fnc(*args, **kw)
-    return _fnc
-
+    Returns the cached ``CharTable`` for ``table``, or None if the
+    table can not be drawn from random bytes.
 
-def make_tiny_integer():
     """
-    Returns a 8bits complement 2 signed integer.
+    if isinstance(table, str):
+        return __get_char_table(table)
 
-    """
-    return random.randint(MIN_TINY_INT, MAX_TINY_INT)
 
-
-def make_small_integer():
+class CodePoints(object):
     """
-    Returns a 16bits complement 2 signed integer.
+    Set of unicode scalar values, drawn from without rejection.
 
+    Ranges are merged and surrogates removed. A draw takes a uniform
+    index over all values and shifts it into its range, so every
+    value is equally likely.
     """
-    return random.randint(MIN_SMALL_INT, MAX_SMALL_INT)
+    utf32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
 
+    def __init__(self, ranges):
+        pieces = []
+        for start, end in ranges:
+            end = min(end, sys.maxunicode)
+            pieces.append((start, min(end, SURROGATES[0] - 1)))
+            pieces.append((max(start, SURROGATES[1] + 1), end))
 
-def make_integer():
-    """
-    Returns a 32bits complement 2 signed integer.
+        merged = []
+        for start, end in sorted(p for p in pieces if p[0] <= p[1]):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
 
-    """
-    return random.randint(MIN_INT, MAX_INT)
+        if not merged:
+            raise ValueError("no unicode scalar values in %r" % (ranges,))
 
+        self.ranges = [tuple(r) for r in merged]
+        self.offsets = []  # index of the first value of each range
+        self.deltas = []  # index to code point shift of each range
+        self.size = 0
 
-def make_big_integer():
-    """
-    Returns a 64bits complement 2 signed integer.
+        for start, end in self.ranges:
+            self.offsets.append(self.size)
+            self.deltas.append(start - self.size)
+            self.size += end - start + 1
 
-    """
-    return random.randint(MIN_BIG_INT, MAX_BIG_INT)
+    def draw(self, getrandbits, length):
+        """
+        Returns a random string of ``length`` characters, using
+        ``getrandbits`` as source.
 
+        """
+        if length < 1:
+            return ''
 
-def make_unsigned_tiny_integer():
-    """
-    Returns a 8bits complement 2 unsigned integer.
+        # 64 random bits per character, scaled down to an index by a
+        # multiplication: the bias is below size / 2 ** 64
+        words = array(INT_TYPECODES[False, 8], getrandbits(64 * length).to_bytes(8 * length, 'little'))
+        size = self.size
 
-    """
-    return random.randint(0, unsigned(MAX_TINY_INT))
+        if len(self.deltas) == 1:
+            delta = self.deltas[0]
+            points = [(w * size >> 64) + delta for w in words]
+        elif len(self.deltas) == 2:  # like the 'all' and 'bmp' blocks
+            (d0, d1), o1 = self.deltas, self.offsets[1]
+            points = [
+                i + d1 if i >= o1 else i + d0
+                for i in [w * size >> 64 for w in words]]
+        else:
+            offsets, deltas = self.offsets, self.deltas
+            points = [
+                i + deltas[bisect_right(offsets, i) - 1]
+                for i in [w * size >> 64 for w in words]]
 
+        return array(INT_TYPECODES[False, 4], points).tobytes().decode(self.utf32)
 
-def make_unsigned_small_integer():
-    """
-    Returns a 16bits complement 2 unsigned integer.
 
-    """
-    return random.randint(0, unsigned(MAX_SMALL_INT))
+@lru_cache(maxsize=64)
+def __get_code_points(ranges):
+    return CodePoints(ranges)
 
 
-def make_unsigned_integer():
+def get_code_points(blocks='all'):
     """
-    Returns a 32bits complement 2 unsigned integer.
+    Returns the cached ``CodePoints`` for ``blocks``: a name of
+    ``UNICODE_BLOCKS``, an inclusive (start, end) code point range,
+    or a sequence of those.
 
     """
-    return random.randint(0, unsigned(MAX_INT))
+    if isinstance(blocks, str) or isinstance(blocks[0], int):
+        blocks = (blocks,)
 
+    ranges = []
+    for block in blocks:
+        if isinstance(block, str):
+            if block not in UNICODE_BLOCKS:
+                raise ValueError("unknown unicode block %r" % block)
+            ranges.extend(UNICODE_BLOCKS[block])
+        else:
+            start, end = block
+            ranges.append((start, end))
 
-def make_unsigned_big_integer():
-    """
-    Returns a 64bits complement 2 unsigned integer.
+    return __get_code_points(tuple(ranges))
 
-    """
-    return random.randint(0, unsigned(MAX_BIG_INT))
 
-
-def make_real(digits=None, precision=None):
+def epoch_microseconds(value):
     """
-    Returns a 4bytes floating point number.
+    Returns datetime ``value`` as microseconds since the epoch. Naive
+    datetimes are read as UTC.
 
     """
-
-    return float(__make_decimal_str(REAL_DIGITS, digits, precision)) * random.choice((1, -1))
+    delta = value - (EPOCH if value.tzinfo is None else UTC_EPOCH)
+    return (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds
 
 
-def make_double(digits=None, precision=None):
+class TimeRange(object):
     """
-    Returns a 8bytes floating point number.
+    Datetimes around a reference instant ``now``: ``now`` plus a number
+    of ``resolution`` steps in [0, future], minus another in [0, past].
 
-    """
+    Offsets in steps are drawn by the caller and turned into datetimes or
+    epoch integers with plain arithmetic, so the current time is read
+    once per range instead of once per value.
 
-    return float(__make_decimal_str(DOUBLE_DIGITS, digits, precision)) * random.choice((1, -1))
+    Keyword arguments:
+    from_date   -- earliest datetime; defaults to ``now``
+    to_date     -- latest datetime; defaults to ``now``
+    now         -- reference instant; defaults to the current time
+    resolution  -- step between values: 's', 'ms' or 'us'
+    tz          -- timezone of the datetimes; naive arguments are taken
+                   as local time, like ``datetime.astimezone`` does
+    """
+    def __init__(self, from_date=None, to_date=None, now=None, resolution='s', tz=None):
+        try:
+            unit = TIME_UNITS[resolution]
+        except KeyError:
+            raise ValueError("unknown resolution %r" % resolution)
+
+        if now is None:
+            now = datetime.now(tz)
+        elif tz is not None:
+            now = now.astimezone(tz)
+
+        if tz is not None:
+            from_date = from_date and from_date.astimezone(tz)
+            to_date = to_date and to_date.astimezone(tz)
+
+        self.now = now
+        self.unit = unit
+        # arithmetic is done in UTC for timezones with daylight saving time
+        self.utc_now = None if now.tzinfo is None or now.tzinfo.__class__ is timezone \
+            else now.astimezone(timezone.utc)
+
+        # timedelta // timedelta is several times slower
+        if from_date:
+            delta = now - from_date
+            self.past = ((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds) // unit
+        else:
+            self.past = 0
+        if to_date:
+            delta = to_date - now
+            self.future = ((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds) // unit
+        else:
+            self.future = 0
 
+        if self.past < 0 or self.future < 0:
+            raise ValueError("from_date must not be after now, nor to_date before it")
 
-def make_decimal(max_digits=None, decimal=None, precision=None):
-    """
-    Decimal with up to `digits` digits and `precision` decimal places.
+    def to_datetime(self, offset):
+        """
+        Returns the datetime ``offset`` steps away from ``now``.
 
-    """
+        """
+        if self.utc_now is None:
+            return self.now + timedelta(0, 0, offset * self.unit)
+        return (self.utc_now + timedelta(0, 0, offset * self.unit)).astimezone(self.now.tzinfo)
 
-    return Decimal(__make_decimal_str(max_digits, decimal, precision)) * random.choice((1, -1))
+    def to_datetimes(self, offsets):
+        """
+        Returns the datetimes ``offsets`` steps away from ``now``.
 
+        """
+        now, unit = self.now, self.unit
 
-def make_char_sequence(table, length):
-    """
-    Helper method that generates a random string from a char table.
+        if self.utc_now is None:
+            if unit == 10 ** 6:
+                return [now + timedelta(0, o) for o in offsets]
+            return [now + timedelta(0, 0, o * unit) for o in offsets]
 
-    @param table: possible characters for the generated string.
-    @param length: length for the given string.
-    @return: randomly generated str with given length.
-    """
-    return ''.join([random.choice(table) for i in range(length)])
+        now, tz = self.utc_now, now.tzinfo
+        return [(now + timedelta(0, 0, o * unit)).astimezone(tz) for o in offsets]
 
+    def to_timestamps(self, offsets):
+        """
+        Returns the epoch integers, in steps, ``offsets`` steps away
+        from ``now``.
 
-def make_binary(length):
-    """
-    Returns a binary string with informed length.
+        """
+        start = epoch_microseconds(self.now) // self.unit
+        return [start + o for o in offsets]
 
-    @param length:
-    @return: string in the format '01000101...'
-    """
-    if length < 1:
-        raise ValueError('length too short for binary')
 
-    return make_char_sequence(BINARY_TABLE, length)
+@lru_cache(maxsize=64)
+def __get_time_range(from_date, to_date, now, resolution, tz):
+    return TimeRange(from_date, to_date, now, resolution, tz)
 
 
-def make_ascii_string(max_length, empty=False):
+def get_time_range(from_date=None, to_date=None, now=None, resolution='s', tz=None):
     """
-    Keyword arguments:
-        max_length  -- max length for string
-        empty       -- allow empty string?
+    Returns a ``TimeRange``, cached when ``now`` is given; otherwise
+    it is built for the current time.
 
     """
-    return make_char_sequence(
-        ASCII_TABLE,
-        random.randint(int(not empty), max_length))
+    if now is None:
+        return TimeRange(from_date, to_date, now, resolution, tz)
+    return __get_time_range(from_date, to_date, now, resolution, tz)
 
 
-def make_string(max_length, empty=False):
-    """
-    Creates a random length non-empty string. If `empty` is set to True,
-    an empty string can be generated.
+# decimal strings of the bytes, for ip address formatting
+OCTETS = [str(i) for i in range(256)]
 
-    Keyword arguments:
-        max_length  -- max length for string
-        empty       -- allow empty string?
 
+class AddressSpace(object):
     """
-    return make_char_sequence(
-        string.printable,
-        random.randint(int(not empty), max_length))
-
+    Set of IP addresses of version ``v``, as sorted and disjoint
+    inclusive integer ranges.
 
-def make_unicode(max_length, empty=False):
+    Addresses are drawn by scaling a random word to an index in the
+    whole set and shifting it into its range, so no draw is rejected.
+    Words are 64 bits wider than the index, which keeps the bias
+    below 2 ** -32.
     """
-    Gets you a unicode string. Character range depends in the UCS your python
-    was configured with (UCS2/UCS4).
+    def __init__(self, ranges, v=4):
+        sizes = [end - start + 1 for start, end in ranges]
 
-    See http://pyref.infogami.com/unichr
+        self.v = v
+        self.bits = 32 if v == 4 else 128
+        self.ranges = ranges
+        self.size = sum(sizes)
+        self.offsets = [0] + list(accumulate(sizes))[:-1]
+        self.deltas = [start - offset for (start, end), offset in zip(ranges, self.offsets)]
 
-    Keyword arguments:
-        max_length  --
-        empty       --
-    @return: randomly generated unicode string
-    """
-    return ''.join(
-        [
-            unichr(random.randint(0, sys.maxunicode))
-            for i in range(random.randint(int(not empty), max_length))
-        ])
+        if not self.size:
+            raise ValueError("no IPv%d address to draw from" % v)
 
+    @staticmethod
+    def __words(getrandbits, n, bits):
+        """
+        Returns ``n`` random integers of ``bits`` bits.
 
-def make_slug(max_length, empty=False):
-    """
-    @see: https://docs.djangoproject.com/en/1.3/ref/models/fields/#slugfield
+        """
+        data = getrandbits(bits * n).to_bytes(bits // 8 * n, 'little')
 
-    @param max_length: max length for randomly generated slug.
-    @param empty: allow empty slugs?
-    @return:
-    """
-    return make_char_sequence(SLUG_TABLE, random.randint(int(not empty), max_length))
+        if bits in (32, 64):
+            return array(INT_TYPECODES[False, bits // 8], data).tolist()
 
+        step = bits // 8
+        return [int.from_bytes(data[i:i + step], 'little') for i in range(0, len(data), step)]
 
-# TODO implement
-#def get_xml():
-#    pass
+    def draw(self, getrandbits, n):
+        """
+        Returns ``n`` random addresses as integers, using ``getrandbits``
+        from a ``random.Random`` instance.
 
+        """
+        if n < 1:
+            return []
 
-def make_boolean():
-    """
-    Returns True or False
+        size, bits = self.size, self.bits
+        if size == 1 << bits:  # the whole space
+            return self.__words(getrandbits, n, bits)
 
-    """
-    return choose((True, False))
+        shift = 64 if bits == 32 else 192
+        indexes = [w * size >> shift for w in self.__words(getrandbits, n, shift)]
 
+        if len(self.deltas) == 1:
+            delta = self.deltas[0]
+            return [i + delta for i in indexes]
 
-def make_datetime(from_date=None, to_date=None):
-    """
-    Creates a datetime in the past or in the future.
+        offsets, deltas = self.offsets, self.deltas
+        return [i + deltas[bisect_right(offsets, i) - 1] for i in indexes]
 
-    @param from_date: limit date in the past random datetime will be generated.
-    @param to_date: limit date in the future  random datetime will be
-    generated. If not informed, generated datetime will be in the past.
-    @return: datetime between from_date and to_date
-    """
-    now = datetime.now()
+    def draw_one(self, getrandbits):
+        """
+        Returns a random address as an integer, see ``draw``.
 
-    from_date = from_date or now
-    to_date = to_date or now
+        """
+        if self.size == 1 << self.bits:
+            return getrandbits(self.bits)
 
-    past_delta = now - from_date  # timedelta
-    future_delta = to_date - now  # timedelta
+        shift = 64 if self.bits == 32 else 192
+        i = getrandbits(shift) * self.size >> shift
+        return i + self.deltas[bisect_right(self.offsets, i) - 1]
 
-    # seconds to the past
-    past_delta_in_seconds = past_delta.total_seconds()
+    def __packed(self, addresses):
+        """
+        Returns ``addresses`` as a single big endian bytes object.
 
-    # seconds to the future
-    future_delta_in_seconds = future_delta.total_seconds()
+        """
+        if self.v == 6:
+            return b''.join([a.to_bytes(16, 'big') for a in addresses])
 
-    rp_delta_in_seconds = random.randint(0, int(past_delta_in_seconds))
-    rf_delta_in_seconds = random.randint(0, int(future_delta_in_seconds))
+        words = array(INT_TYPECODES[False, 4], addresses)
+        if sys.byteorder == 'little':
+            words.byteswap()
+        return words.tobytes()
 
-    # result can be negative or positive
-    delta_in_seconds = rf_delta_in_seconds - rp_delta_in_seconds  # in seconds
+    def to_packed(self, addresses):
+        """
+        Returns ``addresses`` as big endian bytes, like
+        ``ipaddress.ip_address(...).packed``.
 
-    return now + timedelta(seconds=delta_in_seconds)
+        """
+        if self.v == 6:
+            return [a.to_bytes(16, 'big') for a in addresses]
 
+        data = self.__packed(addresses)
+        return [data[i:i + 4] for i in range(0, len(data), 4)]
 
-def make_hostname_label(length):
-    """
-    A hostname is formed by a series of labels joined with dots. This
-    method should be used for that purpose.
+    def to_string(self, address):
+        """
+        Returns ``address`` as a string, see ``to_strings``.
+
+        """
+        if self.v == 6:
+            return self.to_strings((address,))[0]
+        return '%d.%d.%d.%d' % (address >> 24, address >> 16 & 255, address >> 8 & 255, address & 255)
+
+    def to_strings(self, addresses):
+        """
+        Returns ``addresses`` as strings; IPv6 ones in the compressed
+        form of RFC 5952, like ``str(ipaddress.ip_address(...))``.
+
+        """
+        if self.v == 6:
+            from socket import inet_ntop, AF_INET6
+            return [inet_ntop(AF_INET6, a.to_bytes(16, 'big')) for a in addresses]
+
+        octets = iter(map(OCTETS.__getitem__, self.__packed(addresses)))
+        return ['.'.join(a) for a in zip(octets, octets, octets, octets)]
 
-    @see http://en.wikipedia.org/wiki/Hostname#Restrictions_on_valid_host_names
-    @param length: length of the generated hostname
-    @return:
-    """
-    assert 0 < length < 64
+    def to_list(self, address):
+        """
+        Returns ``address`` as a list, see ``to_lists``.
 
-    char_table = string.ascii_letters + string.digits
-    char_table_with_hyphen = string.ascii_letters + string.digits + "-"
-    local_str = ""
+        """
+        if self.v == 6:
+            return [hex(address >> i & 0xFFFF) for i in range(112, -1, -16)]
+        return list(address.to_bytes(4, 'big'))
 
-    for i in range(length):
-        if i == 0 or i == length - 1:
-            local_str += random.choice(char_table)
+    def to_lists(self, addresses):
+        """
+        Returns ``addresses`` as lists of 4 bytes (IPv4), or
+        of 8 hex strings (IPv6).
+
+        """
+        if self.v == 6:
+            groups = array(INT_TYPECODES[False, 2], self.__packed(addresses))
+            if sys.byteorder == 'little':
+                groups.byteswap()
+            groups = iter(map(hex, groups))
+            return [list(a) for a in zip(*[groups] * 8)]
+
+        data = iter(self.__packed(addresses))
+        return [list(a) for a in zip(data, data, data, data)]
+
+    def to_objects(self, addresses):
+        """
+        Returns ``addresses`` as ``ipaddress`` objects.
+
+        """
+        import ipaddress
+
+        make = ipaddress.IPv4Address if self.v == 4 else ipaddress.IPv6Address
+        return [make(a) for a in addresses]
+
+
+def __merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
         else:
-            local_str += random.choice(char_table_with_hyphen)
+            merged.append((start, end))
+    return merged
 
-    return local_str
 
+def __subtract_ranges(ranges, holes):
+    result = []
+    for start, end in ranges:
+        for hole_start, hole_end in holes:
+            if hole_end < start:
+                continue
+            if hole_start > end:
+                break
+            if hole_start > start:
+                result.append((start, hole_start - 1))
+            start = hole_end + 1
+        if start <= end:
+            result.append((start, end))
+    return result
 
-def make_hostname(max_length, domains=(".com", ".org", ".net")):
-    """
-    Creates an hostname with length up to max_length using one of the
-    informed extensions.
 
-    Keyword Arguments:
-        max_length  -- max length for randomly generated hostname.
-        domains     -- iterable with possible extensions for hostname
-    """
+def __network_ranges(networks, v):
+    import ipaddress
 
-    # verifies if max_length is in length range
-    assert 0 < max_length < 256  # up to 255
+    ranges = []
+    for network in networks:
+        network = ipaddress.ip_network(network, strict=False)
+        if network.version != v:
+            raise ValueError("%s is not an IPv%d network" % (network, v))
+        ranges.append((int(network.network_address), int(network.broadcast_address)))
+    return __merge_ranges(ranges)
 
-    # complains if any len(ext) is less than max_length
-    assert reduce(max, map(len, domains)) < max_length, \
-        error_msgs["max_length_ext"]
 
-    extension = random.choice(domains)
+@lru_cache(maxsize=64)
+def __get_address_space(v, include_private, networks):
+    if networks is not None:
+        ranges = __network_ranges(networks, v)
+    elif v == 4 or include_private:
+        ranges = [(0, (1 << (32 if v == 4 else 128)) - 1)]
+    else:
+        ranges = __network_ranges([catalogs.IPV6_GLOBAL_UNICAST], v)
 
-    max_length -= len(extension)
-    label = make_hostname_label(random.randint(1, min(63, max_length)))
+    if not include_private:
+        special = catalogs.IPV4_SPECIAL_NETWORKS if v == 4 else catalogs.IPV6_SPECIAL_NETWORKS
+        ranges = __subtract_ranges(ranges, __network_ranges(special, v))
 
-    return label + extension
+    return AddressSpace(ranges, v)
 
 
-def make_email_local_part(length):
+def get_address_space(v=4, include_private=True, networks=None):
     """
-    Creates an email local part.
+    Returns the cached ``AddressSpace`` of IPv``v`` addresses.
 
-    See http://en.wikipedia.org/wiki/Email_address#Syntax
+    Keyword arguments:
+    v               -- ip address version 4|6
+    include_private -- if False, leaves out the IANA special-purpose
+                       networks (private, loopback, link local,
+                       documentation...), multicast and reserved
+                       space; IPv6 addresses are then global unicast
+    networks        -- networks to draw from, like '10.0.0.0/8', as
+                       strings or ``ipaddress`` networks
+    """
+    if v not in (4, 6):
+        raise ValueError("ip address version must be 4 or 6, not %r" % (v,))
+    if isinstance(networks, str):
+        networks = (networks,)
+    elif networks is not None:
+        networks = tuple(str(network) for network in networks)
+
+    return __get_address_space(v, bool(include_private), networks)
+
+
+class WeightedChoices(object):
+    """
+    Weighted draws from ``choices``, prepared once so that each draw
+    costs the same whatever the number of choices.
+
+    A Vose alias table splits the weights in ``len(choices)`` columns of
+    equal weight, each shared by a choice and an alias: ``random()``
+    times the number of columns picks a column by its integer part and
+    its choice is kept while the fractional part is below the column
+    threshold. Batches from tables of up to ``BISECT_SIZE`` choices
+    bisect cumulative weights instead, which is faster for them.
+    """
+    def __init__(self, choices, weights):
+        choices, weights = tuple(choices), [float(w) for w in weights]
+        size = len(choices)
+
+        if size != len(weights):
+            raise ValueError("%d choices for %d weights" % (size, len(weights)))
+        if not all(0 <= w < float('inf') for w in weights):
+            raise ValueError("weights must be finite and not negative")
+        total = sum(weights)
+        if not total > 0:
+            raise ValueError("weights must not all be zero")
+
+        scaled = [w * size / total for w in weights]
+        thresholds, aliases = [1.0] * size, list(range(size))
+        small = [i for i, w in enumerate(scaled) if w < 1]
+        large = [i for i, w in enumerate(scaled) if w >= 1]
+
+        while small and large:
+            s, l = small.pop(), large[-1]
+            thresholds[s], aliases[s] = scaled[s], l
+            scaled[l] += scaled[s] - 1
+            if scaled[l] < 1:
+                small.append(large.pop())
+        # columns left over are full, but for rounding errors
+
+        self.choices = choices
+        self.weights = weights
+        self.size = size
+        self.thresholds = thresholds
+        self.aliases = tuple([choices[i] for i in aliases])
+        self.cum_weights = list(accumulate(weights))
+
+    def __repr__(self):
+        return 'WeightedChoices(%r, %r)' % (list(self.choices), self.weights)
+
+    def __len__(self):
+        return self.size
+
+    def draw_one(self, random):
+        """
+        Returns one choice, using the ``random`` float function as source.
+
+        """
+        x = random() * self.size
+        i = int(x)
+        return self.choices[i] if x - i < self.thresholds[i] else self.aliases[i]
+
+    def draw(self, random, n):
+        """
+        Returns a list of ``n`` choices, using the ``random`` float
+        function as source.
+
+        """
+        choices = self.choices
+
+        if self.size <= BISECT_SIZE:
+            cum_weights, total, hi = self.cum_weights, self.cum_weights[-1], self.size - 1
+            return [choices[bisect_right(cum_weights, random() * total, 0, hi)] for i in repeat(None, n)]
+
+        size, thresholds, aliases = self.size, self.thresholds, self.aliases
+        return [
+            choices[i] if x - i < thresholds[i] else aliases[i]
+            for x in [random() * size for j in repeat(None, n)]
+            for i in (int(x),)]
+
+
+__WEIGHTED_CHOICES = dict()
+
+
+def get_weighted_choices(choices, weights=None):
+    """
+    Returns the ``WeightedChoices`` of ``choices`` and ``weights``.
 
+    The last ones prepared are kept by identity of the ``choices`` and
+    ``weights`` objects, so repeated draws from the same lists prepare
+    them once; weights changed in place are not seen, prepare a new
+    ``WeightedChoices`` for them. A ``WeightedChoices`` given as
+    ``choices`` is returned as is.
     """
-    assert length > 0
-    assert length < 65
+    if isinstance(choices, WeightedChoices):
+        return choices
 
-    char_table = string.ascii_letters + string.digits + "!#$%&'*+-/=?^_`{|}~"
-    char_table_with_dot = char_table + "."
-    local_str = ""
-
-    for i in range(length):
-        if (i == 0) or (local_str[-1] == ".") or (i == length - 1):
-            local_str += random.choice(char_table)
-        else:
-            local_str += random.choice(char_table_with_dot)
+    key = (id(choices), id(weights))
+    cached = __WEIGHTED_CHOICES.get(key)
+    if cached is not None and cached[0] is choices and cached[1] is weights:
+        return cached[2]
 
-    return local_str
+    weighted = WeightedChoices(choices, weights)
+    if len(__WEIGHTED_CHOICES) >= WEIGHTED_CACHE_SIZE:
+        del __WEIGHTED_CHOICES[next(iter(__WEIGHTED_CHOICES))]
+    __WEIGHTED_CHOICES[key] = (choices, weights, weighted)
+    return weighted
 
 
-def make_email(local_length, domain_length):
+def unsigned(number):
     """
-    Creates an valid email address.
-    domain as ip address and local part between double quotes are ignored
+    Generates the corresponding unsigned integer for ``number``
 
-    See http://en.wikipedia.org/wiki/Email_address#Syntax
-    """
+    Arguments:
+    number -- some integer value
 
-    assert 0 < local_length <= 64
-    assert 0 < (local_length + domain_length) <= 255
+    """
+    return number * 2 + 1
 
-    local_part = make_email_local_part(local_length)
-    domain_part = make_hostname(domain_length)
-    return local_part + '@' + domain_part
 
+def digits_bound(digits, precision=None):
+    """
+    Returns the largest float of at most ``digits`` integer digits, and
+    ``precision`` decimal places when given.
 
-def make_url(max_length, safe=False, port_number=None, domains=('.com',)):
     """
-    Positional Arguments:
-        max_length  -- max length of new url
+    limit = 10 ** digits
+    bound = limit if precision is None else (limit * 10 ** precision - 1) / 10 ** precision
+    if bound >= limit:  # the float rounded up to the limit
+        bound = limit * (1 - 2 ** -52)
+    return float(bound)
+
 
-    Keyword Arguments:
-        safe        -- force https?
-        port_number -- use port number?
-        domains     -- list of acceptable domains
+class Factory(object):
     """
-    protocol = 'https://' if safe else 'http://'
-    port_str = '' if port_number is None else ":" + str(port_number)
-    extension_max_length = reduce(max, map(len, domains))
+    Random data generator backed by its own random number generator,
+    so that its output can be reproduced and does not share state with
+    other users of the ``random`` module.
 
-    min_length = len(protocol + port_str) + 1 + extension_max_length
+    Keyword arguments:
+    seed -- seed for a new ``random.Random`` instance
+    rng  -- object with the ``random.Random`` interface to use instead,
+            like ``random.SystemRandom()``
+    now  -- reference datetime of ``make_datetime`` and ``make_timestamp``;
+            by default the current time of each call
+
+    """
+    def __init__(self, seed=None, rng=None, now=None):
+        self.random = random.Random(seed) if rng is None else rng
+        self.now = now
+
+    def __reduce_ex__(self, protocol):
+        # default_factory holds the random module, so it is pickled by
+        # name, and so are the module level functions bound to it
+        if self is default_factory:
+            return 'default_factory'
+        return super(Factory, self).__reduce_ex__(protocol)
+
+    def __decimal_lengths(self, max_digits, decimal_length=None, precision_length=None):
+        """
+        Returns the number of digits of the integer and of the fractional
+        part of a decimal number with up to `max_digits` digits.
+
+        Arguments:
+        max_digits - max number of digits for the number
+        decimal_length - number of decimal places for the decimal part of the float
+        precision_length - number of decimal places for the precision part of the float
+        """
+
+        if decimal_length is None and precision_length is None:
+            decimal_length = self.random.randint(1, max_digits)
+            precision_length = self.random.randint(0, max_digits - decimal_length)
+        elif decimal_length is None and precision_length is not None:
+            assert precision_length >= 0
+            assert precision_length < max_digits
+            decimal_length = self.random.randint(1, max_digits - precision_length)
+        elif precision_length is None and decimal_length is not None:
+            assert decimal_length <= max_digits
+            assert decimal_length > 0
+            precision_length = self.random.randint(0, max_digits - decimal_length)
+        else:  # neither is none
+            assert (decimal_length + precision_length) < max_digits
+            assert decimal_length > 0
+            assert precision_length >= 0
+            assert precision_length < max_digits
+
+        return decimal_length, precision_length
+
+    def __make_mantissa(self, max_digits, decimal_length=None, precision_length=None):
+        """
+        Makes a signed decimal number with up to `max_digits` digits, as
+        ``(mantissa, precision_length)``: its value is ``mantissa`` times
+        ``10 ** -precision_length``. Digits are uniform, as if drawn one
+        by one, and the lowest bit of the draw gives the sign.
+
+        """
+        decimal_length, precision_length = self.__decimal_lengths(
+            max_digits, decimal_length, precision_length)
+
+        x = self.random.randrange(2 * 10 ** (decimal_length + precision_length))
+        return (-(x >> 1) if x & 1 else x >> 1), precision_length
+
+    def __make_mantissas(self, n, max_digits, decimal_length=None, precision_length=None):
+        """
+        Makes ``n`` signed decimal numbers, as ``__make_mantissa`` does,
+        validating arguments once. Returns the lists of mantissas and of
+        precision lengths.
+
+        """
+        if decimal_length is None and precision_length is None:
+            decimal_lengths = self.__randint_many(n, 1, max_digits)
+            precision_lengths = [
+                int(self.random.random() * (max_digits - length + 1))
+                for length in decimal_lengths]
+        elif decimal_length is None and precision_length is not None:
+            assert precision_length >= 0
+            assert precision_length < max_digits
+            decimal_lengths = self.__randint_many(n, 1, max_digits - precision_length)
+            precision_lengths = [precision_length] * n
+        elif precision_length is None and decimal_length is not None:
+            assert decimal_length <= max_digits
+            assert decimal_length > 0
+            decimal_lengths = [decimal_length] * n
+            precision_lengths = self.__randint_many(n, 0, max_digits - decimal_length)
+        else:  # neither is none
+            assert (decimal_length + precision_length) < max_digits
+            assert decimal_length > 0
+            assert precision_length >= 0
+            assert precision_length < max_digits
+            x = self.__randint_many(n, 0, 2 * 10 ** (decimal_length + precision_length) - 1)
+            return [-(v >> 1) if v & 1 else v >> 1 for v in x], [precision_length] * n
+
+        powers = [2 * 10 ** i for i in range(max_digits + 1)]
+        limits = [powers[d + p] for d, p in zip(decimal_lengths, precision_lengths)]
+
+        # scaled random() only below 2 ** 32, like __randint_many
+        rand, randrange = self.random.random, self.random.randrange
+        if limits and max(limits) < 2 ** 32:
+            x = [int(rand() * limit) for limit in limits]
+        else:
+            x = [int(rand() * limit) if limit < 2 ** 32 else randrange(limit) for limit in limits]
+        return [-(v >> 1) if v & 1 else v >> 1 for v in x], precision_lengths
+
+    def __distributed_integer(self, distribution, low, high):
+        """
+        Returns the floor of one value of ``distribution``, clamped
+        to [low, high].
+
+        """
+        value = distribution.draw_one(self.random)
+        return low if value < low else high if value > high else floor(value)
+
+    def __distributed_integers(self, distribution, n, low, high):
+        """
+        List version of ``__distributed_integer``.
+
+        """
+        return [
+            low if v < low else high if v > high else floor(v)
+            for v in distribution.draw(self.random, n)]
+
+    def __distributed_floats(self, distribution, n, max_digits, decimal_length, precision_length):
+        """
+        Returns a list of ``n`` values of ``distribution`` as floats,
+        rounded to ``precision_length`` decimal places when given and
+        clamped to the values of ``decimal_length`` integer digits.
+
+        """
+        values = distribution.draw(self.random, n)
+        if precision_length is not None:
+            values = [round(v, precision_length) for v in values]
+
+        bound = digits_bound(max_digits if decimal_length is None else decimal_length, precision_length)
+        return [-bound if v < -bound else bound if v > bound else float(v) for v in values]
+
+    def __randint_many(self, n, a, b):
+        """
+        Returns a list of ``n`` random integers in [a, b], like calling
+        ``randint(a, b)`` ``n`` times.
+
+        """
+        if b < a:
+            raise ValueError("empty range for randint (%d, %d)" % (a, b))
+
+        # choices() scales random(), which has 53 bits: ranges close to
+        # that are visibly skewed, larger ones are drawn by rejection
+        if b - a < 2 ** 32:
+            return self.random.choices(range(a, b + 1), k=n)
+        return [self.random.randint(a, b) for i in range(n)]
+
+    def __make_integers(self, n, size, signed):
+        """
+        Returns a list of ``n`` integers of ``size`` bytes taken from
+        a single call to ``getrandbits``.
+
+        """
+        if n < 1:
+            return []
+
+        bits = self.random.getrandbits(8 * size * n)
+        return array(INT_TYPECODES[signed, size], bits.to_bytes(size * n, 'little')).tolist()
+
+    def __make_char_sequences(self, table, lengths):
+        """
+        Returns one random string from ``table`` for each length in ``lengths``.
+        All characters are drawn at once and then sliced.
+
+        """
+        ends = list(accumulate(lengths))
+        if not ends:
+            return []
+
+        chars = self.__draw_chars(table, ends[-1])
+        return [chars[e - l:e] for l, e in zip(lengths, ends)]
+
+    def __draw_chars(self, table, length):
+        """
+        Returns ``length`` random characters of ``table``, drawn from
+        a single ``getrandbits`` call when the table allows it.
+
+        """
+        char_table = get_char_table(table)
+
+        if char_table is None:
+            return ''.join(self.random.choices(table, k=length))
+        return char_table.draw(self.random.getrandbits, length)
+
+    def choose(self, choices, weights=None):
+        """
+        Alias for random.choice, or a weighted choice if ``weights`` are
+        given. ``choices`` may also be a ``WeightedChoices``, prepared
+        once for repeated weighted draws, see ``get_weighted_choices``.
+
+        """
+        if weights is None and not isinstance(choices, WeightedChoices):
+            return self.random.choice(choices)
+        return get_weighted_choices(choices, weights).draw_one(self.random.random)
+
+    def choose_many(self, n, choices, weights=None):
+        """
+        Returns a list of ``n`` elements picked from ``choices``, see ``choose``.
+
+        """
+        if weights is None and not isinstance(choices, WeightedChoices):
+            return self.random.choices(choices, k=n)
+        return get_weighted_choices(choices, weights).draw(self.random.random, n)
+
+    def or_null(self, fnc, frequency=0.5):
+        """
+        Decorates a function so that it may return ``null``
+
+        Arguments:
+        fnc -- factory function
+
+        Keyword arguments:
+        frequency -- how often you should get a null value
+
+        """
+        def _fnc(*args, **kw):
+            if self.random.random() < frequency:
+                return None
+            else:
+                return fnc(*args, **kw)
+        return _fnc
+
+    def make_tiny_integer(self):
+        """
+        Returns a 8bits complement 2 signed integer.
+
+        """
+        return self.random.randint(MIN_TINY_INT, MAX_TINY_INT)
+
+    def make_tiny_integer_many(self, n):
+        """
+        Returns a list of ``n`` 8bits complement 2 signed integers.
+
+        """
+        return self.__make_integers(n, 1, True)
+
+    def make_small_integer(self):
+        """
+        Returns a 16bits complement 2 signed integer.
+
+        """
+        return self.random.randint(MIN_SMALL_INT, MAX_SMALL_INT)
+
+    def make_small_integer_many(self, n):
+        """
+        Returns a list of ``n`` 16bits complement 2 signed integers.
+
+        """
+        return self.__make_integers(n, 2, True)
+
+    def make_integer(self, distribution=None):
+        """
+        Returns a 32bits complement 2 signed integer.
+
+        Values are uniform, unless a ``distribution`` (see
+        ``data_factory.distributions``) is given: its values are then
+        rounded down and clamped to the 32bits range.
+        """
+        if distribution is not None:
+            return self.__distributed_integer(distribution, MIN_INT, MAX_INT)
+        return self.random.randint(MIN_INT, MAX_INT)
+
+    def make_integer_many(self, n, distribution=None):
+        """
+        Returns a list of ``n`` 32bits complement 2 signed integers.
+
+        """
+        if distribution is not None:
+            return self.__distributed_integers(distribution, n, MIN_INT, MAX_INT)
+        return self.__make_integers(n, 4, True)
+
+    def make_big_integer(self, distribution=None):
+        """
+        Returns a 64bits complement 2 signed integer.
+
+        Values are uniform, unless a ``distribution`` (see
+        ``data_factory.distributions``) is given: its values are then
+        rounded down and clamped to the 64bits range.
+        """
+        if distribution is not None:
+            return self.__distributed_integer(distribution, MIN_BIG_INT, MAX_BIG_INT)
+        return self.random.randint(MIN_BIG_INT, MAX_BIG_INT)
+
+    def make_big_integer_many(self, n, distribution=None):
+        """
+        Returns a list of ``n`` 64bits complement 2 signed integers.
+
+        """
+        if distribution is not None:
+            return self.__distributed_integers(distribution, n, MIN_BIG_INT, MAX_BIG_INT)
+        return self.__make_integers(n, 8, True)
+
+    def make_unsigned_tiny_integer(self):
+        """
+        Returns a 8bits complement 2 unsigned integer.
+
+        """
+        return self.random.randint(0, unsigned(MAX_TINY_INT))
 
-    assert max_length >= min_length, error_msgs["max_length"] % min_length
+    def make_unsigned_tiny_integer_many(self, n):
+        """
+        Returns a list of ``n`` 8bits complement 2 unsigned integers.
 
-    hostname_max_length = max_length - len(protocol) - len(port_str)
-    return protocol + make_hostname(hostname_max_length, domains=domains) + port_str
+        """
+        return self.__make_integers(n, 1, False)
 
+    def make_unsigned_small_integer(self):
+        """
+        Returns a 16bits complement 2 unsigned integer.
 
-def make_ip_address_str(*args, **kw):
-    """
-    Helper function that returns the ip_address in string format.
-    Accepts same parameters as make_ip_address.
+        """
+        return self.random.randint(0, unsigned(MAX_SMALL_INT))
+
+    def make_unsigned_small_integer_many(self, n):
+        """
+        Returns a list of ``n`` 16bits complement 2 unsigned integers.
+
+        """
+        return self.__make_integers(n, 2, False)
 
-    Keyword Arguments:
-        valid -- forces ip address to be valid
-        v -- ip address version 4|6
-    """
-    ip_address = make_ip_address(*args, **kw)
+    def make_unsigned_integer(self):
+        """
+        Returns a 32bits complement 2 unsigned integer.
+
+        """
+        return self.random.randint(0, unsigned(MAX_INT))
+
+    def make_unsigned_integer_many(self, n):
+        """
+        Returns a list of ``n`` 32bits complement 2 unsigned integers.
+
+        """
+        return self.__make_integers(n, 4, False)
+
+    def make_unsigned_big_integer(self):
+        """
+        Returns a 64bits complement 2 unsigned integer.
+
+        """
+        return self.random.randint(0, unsigned(MAX_BIG_INT))
+
+    def make_unsigned_big_integer_many(self, n):
+        """
+        Returns a list of ``n`` 64bits complement 2 unsigned integers.
+
+        """
+        return self.__make_integers(n, 8, False)
+
+    def make_real(self, digits=None, precision=None, distribution=None):
+        """
+        Returns a 4bytes floating point number.
+
+        Values are uniform, unless a ``distribution`` is given: its
+        values are then clamped to +/- ``10 ** digits`` and rounded to
+        ``precision`` decimal places when given.
+        """
+        if distribution is not None:
+            return self.__distributed_floats(distribution, 1, REAL_DIGITS, digits, precision)[0]
+
+        mantissa, precision = self.__make_mantissa(REAL_DIGITS, digits, precision)
+        return mantissa / 10 ** precision
 
-    if kw['v'] == 4:
-        return '.'.join(map(str, ip_address))
-    elif kw['v'] == 6:
-        return ':'.join(map(lambda v: v[2:], ip_address))
+    def make_real_many(self, n, digits=None, precision=None, distribution=None):
+        """
+        Returns a list of ``n`` 4bytes floating point numbers.
+
+        """
+        if distribution is not None:
+            return self.__distributed_floats(distribution, n, REAL_DIGITS, digits, precision)
+
+        mantissas, precisions = self.__make_mantissas(n, REAL_DIGITS, digits, precision)
+        return [m / 10 ** p for m, p in zip(mantissas, precisions)]
+
+    def make_double(self, digits=None, precision=None, distribution=None):
+        """
+        Returns a 8bytes floating point number.
+
+        Values are uniform, unless a ``distribution`` is given: its
+        values are then clamped to +/- ``10 ** digits`` and rounded to
+        ``precision`` decimal places when given.
+        """
+        if distribution is not None:
+            return self.__distributed_floats(distribution, 1, DOUBLE_DIGITS, digits, precision)[0]
+
+        mantissa, precision = self.__make_mantissa(DOUBLE_DIGITS, digits, precision)
+        return mantissa / 10 ** precision
+
+    def make_double_many(self, n, digits=None, precision=None, distribution=None):
+        """
+        Returns a list of ``n`` 8bytes floating point numbers.
+
+        """
+        if distribution is not None:
+            return self.__distributed_floats(distribution, n, DOUBLE_DIGITS, digits, precision)
+
+        mantissas, precisions = self.__make_mantissas(n, DOUBLE_DIGITS, digits, precision)
+        return [m / 10 ** p for m, p in zip(mantissas, precisions)]
+
+    def make_decimal(self, max_digits=None, decimal=None, precision=None):
+        """
+        Decimal with up to `digits` digits and `precision` decimal places.
 
+        """
+        mantissa, precision = self.__make_mantissa(max_digits, decimal, precision)
+        return Decimal(mantissa).scaleb(-precision, DECIMAL_CONTEXT)
+
+    def make_decimal_many(self, n, max_digits=None, decimal=None, precision=None):
+        """
+        Returns a list of ``n`` decimals, see ``make_decimal``.
+
+        """
+        mantissas, precisions = self.__make_mantissas(n, max_digits, decimal, precision)
+        return [Decimal(m).scaleb(-p, DECIMAL_CONTEXT) for m, p in zip(mantissas, precisions)]
+
+    def make_money(self, max_digits=MONEY_DIGITS, scale=MONEY_SCALE, negative=False):
+        """
+        Returns a Decimal with exactly `scale` decimal places and up to
+        `max_digits` digits, like a DECIMAL(max_digits, scale) column
+        holds. Amounts are uniform over the whole numbers of cents.
+
+        Keyword arguments:
+            max_digits  -- max number of digits, decimal places included
+            scale       -- number of decimal places
+            negative    -- allow negative amounts?
+        """
+        cents = self.make_money_cents(max_digits, scale, negative)
+        return Decimal(cents).scaleb(-scale, DECIMAL_CONTEXT)
+
+    def make_money_many(self, n, max_digits=MONEY_DIGITS, scale=MONEY_SCALE, negative=False):
+        """
+        Returns a list of ``n`` amounts, see ``make_money``.
+
+        """
+        cents = self.make_money_cents_many(n, max_digits, scale, negative)
+        return [Decimal(c).scaleb(-scale, DECIMAL_CONTEXT) for c in cents]
+
+    def make_money_cents(self, max_digits=MONEY_DIGITS, scale=MONEY_SCALE, negative=False):
+        """
+        Returns a ``make_money`` amount as an integer number of cents,
+        units of ``10 ** -scale``.
+
+        """
+        assert 0 <= scale <= max_digits
+
+        limit = 10 ** max_digits
+        return self.random.randrange(1 - limit if negative else 0, limit)
+
+    def make_money_cents_many(self, n, max_digits=MONEY_DIGITS, scale=MONEY_SCALE, negative=False):
+        """
+        Returns a list of ``n`` amounts in cents, see ``make_money_cents``.
+
+        """
+        assert 0 <= scale <= max_digits
+
+        limit = 10 ** max_digits
+        return self.__randint_many(n, 1 - limit if negative else 0, limit - 1)
+
+    def make_char_sequence(self, table, length):
+        """
+        Helper method that generates a random string from a char table.
+
+        @param table: possible characters for the generated string.
+        @param length: length for the given string.
+        @return: randomly generated str with given length.
+        """
+        if length < 2:  # not worth a table lookup
+            return self.random.choice(table) if length == 1 else ''
+        return self.__draw_chars(table, length)
+
+    def make_char_sequence_many(self, n, table, length):
+        """
+        Returns a list of ``n`` random strings from a char table.
+
+        @param n: number of strings to generate.
+        @param table: possible characters for the generated strings.
+        @param length: length for each string.
+        @return: list of randomly generated str with given length.
+        """
+        return self.__make_char_sequences(table, [length] * n)
+
+    def make_binary(self, length):
+        """
+        Returns a binary string with informed length.
+
+        @param length:
+        @return: string in the format '01000101...'
+        """
+        if length < 1:
+            raise ValueError('length too short for binary')
+
+        return self.make_char_sequence(BINARY_TABLE, length)
+
+    def make_binary_many(self, n, length):
+        """
+        Returns a list of ``n`` binary strings with informed length.
+
+        """
+        if length < 1:
+            raise ValueError('length too short for binary')
+
+        return self.make_char_sequence_many(n, BINARY_TABLE, length)
+
+    def make_ascii_string(self, max_length, empty=False):
+        """
+        Keyword arguments:
+            max_length  -- max length for string
+            empty       -- allow empty string?
+
+        """
+        return self.make_char_sequence(
+            ASCII_TABLE,
+            self.random.randint(int(not empty), max_length))
+
+    def make_ascii_string_many(self, n, max_length, empty=False):
+        """
+        Returns a list of ``n`` ascii strings, see ``make_ascii_string``.
+
+        """
+        return self.__make_char_sequences(
+            ASCII_TABLE,
+            self.__randint_many(n, int(not empty), max_length))
+
+    def make_string(self, max_length, empty=False):
+        """
+        Creates a random length non-empty string. If `empty` is set to True,
+        an empty string can be generated.
+
+        Keyword arguments:
+            max_length  -- max length for string
+            empty       -- allow empty string?
+
+        """
+        return self.make_char_sequence(
+            PRINTABLE_TABLE,
+            self.random.randint(int(not empty), max_length))
+
+    def make_string_many(self, n, max_length, empty=False):
+        """
+        Returns a list of ``n`` printable strings, see ``make_string``.
+
+        """
+        return self.__make_char_sequences(
+            PRINTABLE_TABLE,
+            self.__randint_many(n, int(not empty), max_length))
+
+    def make_unicode(self, max_length, empty=False, blocks='all'):
+        """
+        Gets you a unicode string. Character range depends in the UCS your python
+        was configured with (UCS2/UCS4). Surrogates are never generated, so the
+        result can always be encoded.
+
+        See http://pyref.infogami.com/unichr
+
+        Keyword arguments:
+            max_length  --
+            empty       --
+            blocks      -- a name of UNICODE_BLOCKS ('bmp', 'cjk', 'emoji'...),
+                           an inclusive (start, end) code point range or
+                           a sequence of those
+        @return: randomly generated unicode string
+        """
+        return get_code_points(blocks).draw(
+            self.random.getrandbits,
+            self.random.randint(int(not empty), max_length))
+
+    def make_unicode_many(self, n, max_length, empty=False, blocks='all'):
+        """
+        Returns a list of ``n`` unicode strings, see ``make_unicode``.
+
+        """
+        code_points = get_code_points(blocks)
+        lengths = self.__randint_many(n, int(not empty), max_length)
+        ends = list(accumulate(lengths))
+        if not ends:
+            return []
+
+        chars = code_points.draw(self.random.getrandbits, ends[-1])
+        return [chars[e - l:e] for l, e in zip(lengths, ends)]
+
+    def make_slug(self, max_length, empty=False):
+        """
+        @see: https://docs.djangoproject.com/en/1.3/ref/models/fields/#slugfield
+
+        @param max_length: max length for randomly generated slug.
+        @param empty: allow empty slugs?
+        @return:
+        """
+        return self.make_char_sequence(SLUG_TABLE, self.random.randint(int(not empty), max_length))
+
+    def make_slug_many(self, n, max_length, empty=False):
+        """
+        Returns a list of ``n`` slugs, see ``make_slug``.
+
+        """
+        return self.__make_char_sequences(SLUG_TABLE, self.__randint_many(n, int(not empty), max_length))
+
+    # TODO implement
+    #def get_xml(self):
+    #    pass
+
+    def make_boolean(self):
+        """
+        Returns True or False
+
+        """
+        return self.choose((True, False))
+
+    def make_boolean_many(self, n):
+        """
+        Returns a list of ``n`` booleans taken from a single random draw.
+
+        """
+        if n < 1:
+            return []
+
+        return list(map('1'.__eq__, format(self.random.getrandbits(n), '0%db' % n)))
+
+    def make_datetime(self, from_date=None, to_date=None, now=None, resolution='s', tz=None):
+        """
+        Creates a datetime in the past or in the future.
+
+        @param from_date: limit date in the past random datetime will be generated.
+        @param to_date: limit date in the future  random datetime will be
+        generated. If not informed, generated datetime will be in the past.
+        @param now: reference datetime; defaults to the factory ``now``, or
+        the current time.
+        @param resolution: step between datetimes, 's', 'ms' or 'us'.
+        @param tz: timezone of the datetime; naive dates are taken as local time.
+        @return: datetime between from_date and to_date
+        """
+        time_range = self.__time_range(from_date, to_date, now, resolution, tz)
+
+        # steps to the past and to the future; result can be negative or positive
+        rp = self.random.randint(0, time_range.past)
+        rf = self.random.randint(0, time_range.future)
+
+        return time_range.to_datetime(rf - rp)
+
+    def make_datetime_many(self, n, from_date=None, to_date=None, now=None, resolution='s', tz=None):
+        """
+        Returns a list of ``n`` datetimes, see ``make_datetime``. All
+        values share the same reference ``now``.
+
+        """
+        time_range = self.__time_range(from_date, to_date, now, resolution, tz)
+        return time_range.to_datetimes(self.__time_offsets(n, time_range))
+
+    def make_timestamp(self, from_date=None, to_date=None, now=None, resolution='s'):
+        """
+        Creates an epoch timestamp, as an integer number of ``resolution``
+        steps, like ``make_datetime``. Naive dates are taken as local time,
+        like ``datetime.timestamp`` does.
+
+        """
+        time_range = self.__time_range(from_date, to_date, now, resolution, timezone.utc)
+
+        rp = self.random.randint(0, time_range.past)
+        rf = self.random.randint(0, time_range.future)
+
+        return time_range.to_timestamps((rf - rp,))[0]
+
+    def make_timestamp_many(self, n, from_date=None, to_date=None, now=None, resolution='s'):
+        """
+        Returns a list of ``n`` epoch timestamps, see ``make_timestamp``.
 
-def make_ip_address(include_private=True, v=4):
-    """
-    Returns a IP address
+        """
+        time_range = self.__time_range(from_date, to_date, now, resolution, timezone.utc)
+        return time_range.to_timestamps(self.__time_offsets(n, time_range))
 
-    Private ip addresses for IPV4:
-     - [0] 10.x.x.x
-     - [1] 192.168.x.x
-     - [2] 172.16.0.0 to 172.31.255.255
+    def __time_range(self, from_date, to_date, now, resolution, tz):
+        return get_time_range(from_date, to_date, self.now if now is None else now, resolution, tz)
 
-    Keyword Arguments:
-        include_private -- include private ip addresses in result?
-        v               -- ip address version 4|6
+    def __time_offsets(self, n, time_range):
+        """
+        Returns ``n`` offsets, in steps, from the reference ``now``
+        of ``time_range``.
 
-    """
+        """
+        rp_offsets = self.__randint_many(n, 0, time_range.past)
+        rf_offsets = self.__randint_many(n, 0, time_range.future)
+        return [rf - rp for rp, rf in zip(rp_offsets, rf_offsets)]
 
-    if v == 4:
-        while True:
-            ad = [random.randint(0, 255) for i in range(4)]
+    def make_hostname_label(self, length):
+        """
+        A hostname is formed by a series of labels joined with dots. This
+        method should be used for that purpose.
 
-            if not include_private:
-                if ad[0] == 10:
-                    continue
-                if (ad[0], ad[1]) == (192, 168):
-                    continue
-                if [172, 16, 0, 0] <= ad <= [172, 31, 255, 255]:
-                    continue
-            return ad
+        @see http://en.wikipedia.org/wiki/Hostname#Restrictions_on_valid_host_names
+        @param length: length of the generated hostname
+        @return:
+        """
+        assert 0 < length < 64
 
-    elif v == 6:
-        return [hex(random.randint(0, 65535)) for i in range(8)]
+        return self.__make_hostname_labels([length])[0]
+
+    def __make_hostname_labels(self, lengths):
+        """
+        Returns one hostname label for each length in ``lengths``. Inner
+        characters may be hyphens, first and last characters may not.
+
+        """
+        n = len(lengths)
+        ends = self.__draw_chars(HOSTNAME_TABLE, 2 * n)
+        inners = self.__make_char_sequences(
+            HOSTNAME_HYPHEN_TABLE, [max(0, l - 2) for l in lengths])
+
+        return [
+            f if l == 1 else f + inner + e
+            for l, f, inner, e in zip(lengths, ends[:n], inners, ends[n:])]
+
+    def make_hostname_label_many(self, n, length):
+        """
+        Returns a list of ``n`` hostname labels, see ``make_hostname_label``.
+
+        """
+        assert 0 < length < 64
+
+        return self.__make_hostname_labels([length] * n)
+
+    def make_hostname(self, max_length, domains=catalogs.DEFAULT_TLDS):
+        """
+        Creates an hostname with length up to max_length using one of the
+        informed extensions.
+
+        Keyword Arguments:
+            max_length  -- max length for randomly generated hostname.
+            domains     -- iterable with possible extensions for hostname;
+                           ``catalogs.TLDS`` for a wider set of common ones
+        """
 
+        # verifies if max_length is in length range
+        assert 0 < max_length < 256  # up to 255
 
-def make_mime_type():
-    """
-    Returns a valid mime type
+        # complains if any len(ext) is less than max_length
+        domains, longest = get_suffixes(domains)
+        assert longest < max_length, error_msgs["max_length_ext"]
 
-    """
-    types_tuple = tuple(mimetypes.types_map.values())
-    return random.choice(types_tuple)
+        extension = self.random.choice(domains)
+
+        max_length -= len(extension)
+        label = self.make_hostname_label(self.random.randint(1, min(63, max_length)))
 
+        return label + extension
+
+    def make_hostname_many(self, n, max_length, domains=catalogs.DEFAULT_TLDS):
+        """
+        Returns a list of ``n`` hostnames, see ``make_hostname``.
+
+        """
+        assert 0 < max_length < 256  # up to 255
+        domains, longest = get_suffixes(domains)
+        assert longest < max_length, error_msgs["max_length_ext"]
 
-def make_filename(max_length, extensions=(".txt", ".odt", ".pdf")):
-    """
-    Returns a valid filename with one of the given extensions
+        rand = self.random.random
+        extensions = self.random.choices(domains, k=n)
+        labels = self.__make_hostname_labels([
+            int(rand() * min(63, max_length - len(e))) + 1
+            for e in extensions])
 
-    Positional Arguments:
-        max_length  -- max length for the new filename
+        return [l + e for l, e in zip(labels, extensions)]
 
-    Keyword Arguments:
-        extensions  -- list of possible filename extensions
+    def make_email_local_part(self, length):
+        """
+        Creates an email local part.
 
-    """
-    assert reduce(max, map(len, extensions)) < max_length, \
-        error_msgs["max_length_ext"]
+        See http://en.wikipedia.org/wiki/Email_address#Syntax
+
+        """
+        assert length > 0
+        assert length < 65
+
+        return self.__fix_local_part(self.__draw_chars(EMAIL_LOCAL_DOT_TABLE, length))
+
+    def __fix_local_part(self, chars):
+        """
+        Turns a random string of EMAIL_LOCAL_DOT_TABLE into a valid local part.
+
+        A dot may not be first, last or follow another dot; each such
+        dot is replaced by a character drawn from EMAIL_LOCAL_TABLE.
+        Every position then has the same distribution as drawing it from
+        EMAIL_LOCAL_TABLE when a dot is not allowed there, and from
+        EMAIL_LOCAL_DOT_TABLE otherwise.
+        """
+        if chars[0] != '.' and chars[-1] != '.' and '..' not in chars:
+            return chars
+
+        spare = self.__draw_chars(EMAIL_LOCAL_TABLE, len(chars))
+
+        if chars[0] == '.':
+            chars = spare[0] + chars[1:]
+        # pairs are replaced left to right without overlapping, so a run
+        # of dots becomes '.x.x...' as if drawn one character at a time
+        i = chars.find('..')
+        while i >= 0:
+            chars = chars[:i + 1] + spare[i + 1] + chars[i + 2:]
+            i = chars.find('..', i + 2)
+        if chars[-1] == '.':
+            chars = chars[:-1] + spare[-1]
+
+        return chars
+
+    def make_email_local_part_many(self, n, length):
+        """
+        Returns a list of ``n`` email local parts, see ``make_email_local_part``.
+
+        """
+        assert length > 0
+        assert length < 65
+
+        return [
+            self.__fix_local_part(chars)
+            for chars in self.make_char_sequence_many(n, EMAIL_LOCAL_DOT_TABLE, length)]
+
+    def make_email(self, local_length, domain_length):
+        """
+        Creates an valid email address.
+        domain as ip address and local part between double quotes are ignored
+
+        See http://en.wikipedia.org/wiki/Email_address#Syntax
+        """
+
+        assert 0 < local_length <= 64
+        assert 0 < (local_length + domain_length) <= 255
+
+        local_part = self.make_email_local_part(local_length)
+        domain_part = self.make_hostname(domain_length)
+        return local_part + '@' + domain_part
+
+    def make_email_many(self, n, local_length, domain_length):
+        """
+        Returns a list of ``n`` email addresses, see ``make_email``.
+
+        """
+        assert 0 < local_length <= 64
+        assert 0 < (local_length + domain_length) <= 255
+
+        local_parts = self.make_email_local_part_many(n, local_length)
+        domain_parts = self.make_hostname_many(n, domain_length)
+        return [l + '@' + d for l, d in zip(local_parts, domain_parts)]
+
+    def __url_parts(self, max_length, safe, port_number, domains):
+        """
+        Validates ``make_url`` arguments and returns the protocol,
+        port and hostname max length.
+
+        """
+        protocol = 'https://' if safe else 'http://'
+        port_str = '' if port_number is None else ":" + str(port_number)
+        extension_max_length = get_suffixes(domains)[1]
+
+        min_length = len(protocol + port_str) + 1 + extension_max_length
+
+        assert max_length >= min_length, error_msgs["max_length"] % min_length
+
+        hostname_max_length = max_length - len(protocol) - len(port_str)
+        return protocol, port_str, hostname_max_length
+
+    def make_url(self, max_length, safe=False, port_number=None, domains=('.com',)):
+        """
+        Positional Arguments:
+            max_length  -- max length of new url
+
+        Keyword Arguments:
+            safe        -- force https?
+            port_number -- use port number?
+            domains     -- list of acceptable domains
+        """
+        protocol, port_str, hostname_max_length = self.__url_parts(
+            max_length, safe, port_number, domains)
+        return protocol + self.make_hostname(hostname_max_length, domains=domains) + port_str
+
+    def make_url_many(self, n, max_length, safe=False, port_number=None, domains=('.com',)):
+        """
+        Returns a list of ``n`` urls, see ``make_url``.
+
+        """
+        protocol, port_str, hostname_max_length = self.__url_parts(
+            max_length, safe, port_number, domains)
+        return [
+            protocol + hostname + port_str
+            for hostname in self.make_hostname_many(n, hostname_max_length, domains=domains)]
+
+    def make_ip_address(self, include_private=True, v=4, networks=None):
+        """
+        Returns a IP address, as a list of 4 integers (IPV4) or
+        of 8 hex strings (IPV6)
+
+        Addresses are drawn from an ``AddressSpace``, see ``get_address_space``.
+
+        Keyword Arguments:
+            include_private -- include private and other special purpose
+                               ip addresses in result?
+            v               -- ip address version 4|6
+            networks        -- only make addresses in these networks,
+                               like ['10.0.0.0/8', '192.168.1.0/24']
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_list(space.draw_one(self.random.getrandbits))
+
+    def make_ip_address_many(self, n, include_private=True, v=4, networks=None):
+        """
+        Returns a list of ``n`` ip addresses, see ``make_ip_address``.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_lists(space.draw(self.random.getrandbits, n))
+
+    def make_ip_address_str(self, include_private=True, v=4, networks=None):
+        """
+        Helper function that returns the ip_address in string format.
+        Accepts same parameters as make_ip_address. IPV6 addresses are
+        in their compressed form, like '2001:db8::1'.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_string(space.draw_one(self.random.getrandbits))
+
+    def make_ip_address_str_many(self, n, include_private=True, v=4, networks=None):
+        """
+        Returns a list of ``n`` ip addresses in string format.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_strings(space.draw(self.random.getrandbits, n))
+
+    def make_ip_address_int(self, include_private=True, v=4, networks=None):
+        """
+        Returns an ip address as a 32 (IPV4) or 128 (IPV6) bits integer.
+        Accepts same parameters as make_ip_address.
+
+        """
+        return get_address_space(v, include_private, networks).draw_one(self.random.getrandbits)
 
-    char_table = re.sub(r'[/\?%*:|"<>]', '', string.printable)
-    extension = random.choice(extensions)
-    name = make_char_sequence(char_table, max_length - len(extension))
+    def make_ip_address_int_many(self, n, include_private=True, v=4, networks=None):
+        """
+        Returns a list of ``n`` ip addresses as integers.
 
-    return name + extension
\ No newline at end of file
+        """
+        return get_address_space(v, include_private, networks).draw(self.random.getrandbits, n)
+
+    def make_ip_address_packed(self, include_private=True, v=4, networks=None):
+        """
+        Returns an ip address as 4 (IPV4) or 16 (IPV6) big endian bytes.
+        Accepts same parameters as make_ip_address.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.draw_one(self.random.getrandbits).to_bytes(space.bits // 8, 'big')
+
+    def make_ip_address_packed_many(self, n, include_private=True, v=4, networks=None):
+        """
+        Returns a list of ``n`` packed ip addresses.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_packed(space.draw(self.random.getrandbits, n))
+
+    def make_ip_address_object(self, include_private=True, v=4, networks=None):
+        """
+        Returns an ip address as an ``ipaddress.IPv4Address`` or
+        ``ipaddress.IPv6Address``. Accepts same parameters as make_ip_address.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_objects((space.draw_one(self.random.getrandbits),))[0]
+
+    def make_ip_address_object_many(self, n, include_private=True, v=4, networks=None):
+        """
+        Returns a list of ``n`` ``ipaddress`` addresses.
+
+        """
+        space = get_address_space(v, include_private, networks)
+        return space.to_objects(space.draw(self.random.getrandbits, n))
+
+    def make_mime_type(self):
+        """
+        Returns a valid mime type
+
+        """
+        return self.random.choice(catalogs.mime_types())
+
+    def make_mime_type_many(self, n):
+        """
+        Returns a list of ``n`` valid mime types
+
+        """
+        return self.random.choices(catalogs.mime_types(), k=n)
+
+    def make_filename(self, max_length, extensions=(".txt", ".odt", ".pdf"), mime_type=None):
+        """
+        Returns a valid filename with one of the given extensions
+
+        Positional Arguments:
+            max_length  -- max length for the new filename
+
+        Keyword Arguments:
+            extensions  -- list of possible filename extensions
+            mime_type   -- use the extensions of this mime type instead,
+                           like one from ``make_mime_type``
+
+        """
+        if mime_type is not None:
+            extensions = catalogs.extensions_for(mime_type)
+
+        extensions, longest = get_suffixes(extensions)
+        assert longest < max_length, error_msgs["max_length_ext"]
+
+        extension = self.random.choice(extensions)
+        name = self.make_char_sequence(FILENAME_TABLE, max_length - len(extension))
+
+        return name + extension
+
+    def make_filename_many(self, n, max_length, extensions=(".txt", ".odt", ".pdf"), mime_type=None):
+        """
+        Returns a list of ``n`` filenames, see ``make_filename``.
+
+        """
+        if mime_type is not None:
+            extensions = catalogs.extensions_for(mime_type)
+
+        extensions, longest = get_suffixes(extensions)
+        assert longest < max_length, error_msgs["max_length_ext"]
+
+        extensions = self.random.choices(extensions, k=n)
+        names = self.__make_char_sequences(FILENAME_TABLE, [max_length - len(e) for e in extensions])
+
+        return [name + e for name, e in zip(names, extensions)]
+
+
+# module level functions use a default factory sharing the state of the
+# ``random`` module, so ``random.seed`` still applies to them
+default_factory = Factory(rng=random)
+
+choose = default_factory.choose
+choose_many = default_factory.choose_many
+or_null = default_factory.or_null
+make_tiny_integer = default_factory.make_tiny_integer
+make_tiny_integer_many = default_factory.make_tiny_integer_many
+make_small_integer = default_factory.make_small_integer
+make_small_integer_many = default_factory.make_small_integer_many
+make_integer = default_factory.make_integer
+make_integer_many = default_factory.make_integer_many
+make_big_integer = default_factory.make_big_integer
+make_big_integer_many = default_factory.make_big_integer_many
+make_unsigned_tiny_integer = default_factory.make_unsigned_tiny_integer
+make_unsigned_tiny_integer_many = default_factory.make_unsigned_tiny_integer_many
+make_unsigned_small_integer = default_factory.make_unsigned_small_integer
+make_unsigned_small_integer_many = default_factory.make_unsigned_small_integer_many
+make_unsigned_integer = default_factory.make_unsigned_integer
+make_unsigned_integer_many = default_factory.make_unsigned_integer_many
+make_unsigned_big_integer = default_factory.make_unsigned_big_integer
+make_unsigned_big_integer_many = default_factory.make_unsigned_big_integer_many
+make_real = default_factory.make_real
+make_real_many = default_factory.make_real_many
+make_double = default_factory.make_double
+make_double_many = default_factory.make_double_many
+make_decimal = default_factory.make_decimal
+make_decimal_many = default_factory.make_decimal_many
+make_money = default_factory.make_money
+make_money_many = default_factory.make_money_many
+make_money_cents = default_factory.make_money_cents
+make_money_cents_many = default_factory.make_money_cents_many
+make_char_sequence = default_factory.make_char_sequence
+make_char_sequence_many = default_factory.make_char_sequence_many
+make_binary = default_factory.make_binary
+make_binary_many = default_factory.make_binary_many
+make_ascii_string = default_factory.make_ascii_string
+make_ascii_string_many = default_factory.make_ascii_string_many
+make_string = default_factory.make_string
+make_string_many = default_factory.make_string_many
+make_unicode = default_factory.make_unicode
+make_unicode_many = default_factory.make_unicode_many
+make_slug = default_factory.make_slug
+make_slug_many = default_factory.make_slug_many
+make_boolean = default_factory.make_boolean
+make_boolean_many = default_factory.make_boolean_many
+make_datetime = default_factory.make_datetime
+make_datetime_many = default_factory.make_datetime_many
+make_timestamp = default_factory.make_timestamp
+make_timestamp_many = default_factory.make_timestamp_many
+make_hostname_label = default_factory.make_hostname_label
+make_hostname_label_many = default_factory.make_hostname_label_many
+make_hostname = default_factory.make_hostname
+make_hostname_many = default_factory.make_hostname_many
+make_email_local_part = default_factory.make_email_local_part
+make_email_local_part_many = default_factory.make_email_local_part_many
+make_email = default_factory.make_email
+make_email_many = default_factory.make_email_many
+make_url = default_factory.make_url
+make_url_many = default_factory.make_url_many
+make_ip_address_str = default_factory.make_ip_address_str
+make_ip_address_str_many = default_factory.make_ip_address_str_many
+make_ip_address_int = default_factory.make_ip_address_int
+make_ip_address_int_many = default_factory.make_ip_address_int_many
+make_ip_address_packed = default_factory.make_ip_address_packed
+make_ip_address_packed_many = default_factory.make_ip_address_packed_many
+make_ip_address_object = default_factory.make_ip_address_object
+make_ip_address_object_many = default_factory.make_ip_address_object_many
+make_ip_address = default_factory.make_ip_address
+make_ip_address_many = default_factory.make_ip_address_many
+make_mime_type = default_factory.make_mime_type
+make_mime_type_many = default_factory.make_mime_type_many
+make_filename = default_factory.make_filename
+make_filename_many = default_factory.make_filename_many
@@ -0,0 +1,287 @@
+# -*- coding:utf-8 -*-
+
+"""
+Opt-in statistics of the generators: calls, values, time and retries.
+
+Instrumentation replaces the generator methods of one ``Factory`` with
+counting wrappers for the duration of a ``with`` block, and puts the
+original methods back when it ends. Outside of it nothing is wrapped,
+so it costs nothing when unused::
+
+    >>> from data_factory.instrumentation import instrument, stats
+    >>> with instrument() as recorder:
+    ...     rows = users.tuples(10 ** 5)
+    >>> print(recorder.report())
+
+Times are inclusive: a generator calling another one, like
+``make_url`` calling ``make_hostname``, counts the time of both.
+Generators bound before the block starts, like names imported with
+``from data_factory import make_email``, and ``generate_parallel``
+workers are not counted.
+
+Rejection loops (zipf rejection-inversion, ``unique``) report their
+extra draws with ``add_retries``; they are counted as ``retries`` of
+the generator running at the time.
+"""
+
+import sys
+import time
+import threading
+
+from collections import Counter
+from contextlib import contextmanager
+
+
+__recorder = None
+__last = None
+__MISSING = object()
+
+
+class GeneratorStats(object):
+    """
+    Calls, values made, cumulative seconds and retries of a generator.
+
+    """
+    __slots__ = ('name', 'calls', 'values', 'seconds', 'retries')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.values = 0
+        self.seconds = 0.0
+        self.retries = 0
+
+    def __repr__(self):
+        return '<GeneratorStats %s calls=%d values=%d seconds=%.6f retries=%d>' % (
+            self.name, self.calls, self.values, self.seconds, self.retries)
+
+    @property
+    def ns_per_value(self):
+        return 1e9 * self.seconds / self.values if self.values else 0.0
+
+    def copy(self):
+        other = GeneratorStats(self.name)
+        other.calls, other.values = self.calls, self.values
+        other.seconds, other.retries = self.seconds, self.retries
+        return other
+
+
+class Recorder(object):
+    """
+    Statistics of the generators called during an ``instrument`` block.
+
+    """
+    def __init__(self):
+        self.generators = dict()
+        self.current = None  # stats of the generator running
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def __getitem__(self, name):
+        stats = self.generators.get(name)
+        if stats is None:
+            stats = self.generators[name] = GeneratorStats(name)
+        return stats
+
+    def stats(self):
+        """
+        Returns a snapshot of the statistics, as a dict of generator
+        name to ``GeneratorStats``, for the generators called.
+
+        """
+        return dict(
+            (name, stats.copy()) for name, stats in self.generators.items()
+            if stats.calls or stats.retries)
+
+    def report(self):
+        """
+        Returns the statistics as a text table, slowest generator first.
+
+        """
+        lines = ['%-30s %10s %12s %10s %10s %10s' % (
+            'generator', 'calls', 'values', 'seconds', 'ns/value', 'retries')]
+
+        for stats in sorted(self.stats().values(), key=lambda s: -s.seconds):
+            lines.append('%-30s %10d %12d %10.3f %10.0f %10d' % (
+                stats.name, stats.calls, stats.values, stats.seconds,
+                stats.ns_per_value, stats.retries))
+        return '\n'.join(lines)
+
+
+class SamplingProfiler(object):
+    """
+    Samples the stack of the thread that started it every ``interval``
+    seconds, and counts the ``data_factory`` functions seen, including
+    private helpers that ``instrument`` does not wrap.
+
+    ``self_samples`` counts the innermost ``data_factory`` function of
+    each sample, ``total_samples`` every one on the stack.
+    """
+    def __init__(self, interval=0.001):
+        import os
+
+        self.interval = interval
+        self.samples = 0
+        self.self_samples = Counter()
+        self.total_samples = Counter()
+        self.package = os.path.dirname(os.path.abspath(__file__))
+        self.__thread = self.__stop = None
+
+    def start(self):
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__sample, args=(threading.get_ident(),), daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop.set()
+        self.__thread.join()
+
+    def __sample(self, thread_id):
+        package, own = self.package, __file__
+
+        while not self.__stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            seen = []
+
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename.startswith(package) and code.co_filename != own:
+                    name = '%s.%s' % (
+                        code.co_filename[len(package) + 1:-3].replace('/', '.'), code.co_name)
+                    if name not in seen:
+                        seen.append(name)
+                frame = frame.f_back
+
+            self.samples += 1
+            if seen:
+                self.self_samples[seen[0]] += 1
+                self.total_samples.update(seen)
+
+    def report(self, limit=20):
+        """
+        Returns the most sampled functions as a text table.
+
+        """
+        lines = ['%-50s %8s %8s' % ('function', 'self %', 'total %')]
+        for name, count in self.total_samples.most_common(limit):
+            lines.append('%-50s %8.1f %8.1f' % (
+                name, 100.0 * self.self_samples[name] / max(self.samples, 1),
+                100.0 * count / max(self.samples, 1)))
+        return '\n'.join(lines)
+
+
+def add_retries(name, count):
+    """
+    Counts ``count`` retries of a rejection loop, for the generator
+    running if any, or as ``name`` otherwise. Does nothing when no
+    instrumentation is active.
+
+    """
+    recorder = __recorder
+    if recorder is not None:
+        (recorder.current or recorder[name]).retries += count
+
+
+def stats():
+    """
+    Returns a snapshot of the statistics of the active instrumentation,
+    or of the last one, as a dict of generator name to
+    ``GeneratorStats``.
+
+    """
+    recorder = __recorder or __last
+    return recorder.stats() if recorder is not None else dict()
+
+
+def __wrap(recorder, name, fnc, batch):
+    """
+    Returns ``fnc`` counting its calls in ``recorder[name]``.
+
+    """
+    stats, perf_counter = recorder[name], time.perf_counter
+
+    def wrapper(*args, **kw):
+        outer, recorder.current = recorder.current, stats
+        started = perf_counter()
+        try:
+            result = fnc(*args, **kw)
+        finally:
+            stats.seconds += perf_counter() - started
+            stats.calls += 1
+            recorder.current = outer
+
+        stats.values += len(result) if batch else 1  # n may be a keyword
+        return result
+
+    wrapper.__name__ = wrapper.__qualname__ = fnc.__name__
+    wrapper.__doc__ = fnc.__doc__
+    wrapper.__wrapped__ = fnc
+    return wrapper
+
+
+def __generators():
+    from .factory import Factory
+
+    return [
+        name for name in dir(Factory)
+        if name.startswith('make_') or name in ('choose', 'choose_many')]
+
+
+@contextmanager
+def instrument(factory=None, profiler=None):
+    """
+    Counts the calls of the generators of ``factory`` for the duration
+    of the block, and yields the ``Recorder``.
+
+    Keyword arguments:
+    factory     -- ``Factory`` to instrument; ``default_factory`` by
+                   default, in which case the module level functions of
+                   ``data_factory`` are instrumented too
+    profiler    -- started when the block starts and stopped when it
+                   ends; a ``SamplingProfiler``, or any object with
+                   ``start`` and ``stop`` (or ``enable`` and ``disable``,
+                   like ``cProfile.Profile``) methods
+    """
+    global __recorder, __last
+    from . import factory as module
+    import data_factory
+
+    if factory is None:
+        factory = module.default_factory
+
+    recorder, outer = Recorder(), __recorder
+    namespaces = [vars(factory)]
+    if factory is module.default_factory:
+        namespaces += [vars(module), vars(data_factory)]
+
+    replaced = []
+    for name in __generators():
+        batch = name.endswith('_many')
+        wrapper = __wrap(recorder, name[:-len('_many')] if batch else name, getattr(factory, name), batch)
+
+        # names of the package not resolved yet are set too, and
+        # removed on exit, or its __getattr__ would cache the wrappers
+        for namespace in namespaces:
+            replaced.append((namespace, name, namespace.get(name, __MISSING), wrapper))
+            namespace[name] = wrapper
+
+    __recorder = recorder
+    if profiler is not None:
+        (getattr(profiler, 'start', None) or profiler.enable)()
+
+    try:
+        yield recorder
+    finally:
+        if profiler is not None:
+            (getattr(profiler, 'stop', None) or profiler.disable)()
+
+        for namespace, name, original, wrapper in reversed(replaced):
+            if namespace.get(name) is wrapper:
+                if original is __MISSING:  # a method, or a name not resolved yet
+                    del namespace[name]
+                else:
+                    namespace[name] = original
+
+        recorder.seconds = time.perf_counter() - recorder.started
+        __recorder, __last = outer, recorder
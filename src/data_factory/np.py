@@ -0,0 +1,331 @@
+# -*- coding:utf-8 -*-
+
+"""
+NumPy backend for the numeric generators.
+
+Each function mirrors its ``make_*_many`` counterpart in
+``data_factory.factory`` but returns a single ``numpy.ndarray``
+with a matching dtype instead of a list of python objects.
+
+This module is not imported by ``data_factory``; import it
+explicitly when numpy is available::
+
+    >>> from data_factory import np as dnp
+    >>> ids = dnp.make_big_integer_many(10 ** 8)  # int64 array
+
+"""
+
+from datetime import timezone
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "data_factory.np requires numpy; install it with "
+        "`pip install data-factory[numpy]`")
+
+from .factory import (
+    MIN_TINY_INT, MAX_TINY_INT,
+    MIN_SMALL_INT, MAX_SMALL_INT,
+    MIN_INT, MAX_INT,
+    MIN_BIG_INT, MAX_BIG_INT,
+    REAL_DIGITS, DOUBLE_DIGITS, MONEY_DIGITS, MONEY_SCALE,
+    digits_bound, epoch_microseconds, get_address_space, get_time_range, unsigned,
+)
+from .uniqueness import GOLDEN, make_unique_integers
+
+
+default_rng = numpy.random.default_rng()
+
+
+def __make_integers(n, low, high, dtype, rng):
+    rng = default_rng if rng is None else rng
+    return rng.integers(low, high, size=n, dtype=dtype, endpoint=True)
+
+
+def __distributed_integers(n, distribution, low, high, dtype, rng):
+    """
+    Array version of ``__distributed_integers``: values of
+    ``distribution`` rounded down and clamped to [low, high].
+
+    """
+    rng = default_rng if rng is None else rng
+    values = distribution.draw_array(rng, n)
+
+    if values.dtype.kind in 'iu':
+        return numpy.clip(values, low, high).astype(dtype)
+
+    # float bounds of int64 round up to 2 ** 63, which does not fit
+    values = numpy.floor(values)
+    below, above = values < low, values >= high
+    values[below | above] = 0
+    integers = values.astype(dtype)
+    integers[below] = low
+    integers[above] = high
+    return integers
+
+
+def __distributed_floats(n, distribution, max_digits, decimal_length, precision_length, dtype, rng):
+    """
+    Array version of ``__distributed_floats``. Values are clamped once
+    converted to ``dtype``, which can round them up.
+
+    """
+    rng = default_rng if rng is None else rng
+    digits = max_digits if decimal_length is None else decimal_length
+
+    values = distribution.draw_array(rng, n).astype(numpy.float64)
+    if precision_length is not None:
+        values = numpy.round(values, precision_length)
+
+    limit = dtype(10 ** digits)
+    bound = dtype(digits_bound(digits, precision_length))
+    if bound >= limit:
+        bound = numpy.nextafter(limit, dtype(0))
+    return numpy.clip(values.astype(dtype), -bound, bound)
+
+
+def __make_floats(n, max_digits, decimal_length, precision_length, dtype, rng):
+    """
+    Array version of ``__make_mantissas`` divided by powers of ten.
+    Digit counts follow the same rules.
+
+    """
+    rng = default_rng if rng is None else rng
+
+    if decimal_length is None and precision_length is None:
+        decimal_length = rng.integers(1, max_digits, size=n, endpoint=True)
+        precision_length = numpy.floor(
+            rng.random(n) * (max_digits - decimal_length + 1))
+    elif decimal_length is None and precision_length is not None:
+        assert precision_length >= 0
+        assert precision_length < max_digits
+        decimal_length = rng.integers(
+            1, max_digits - precision_length, size=n, endpoint=True)
+    elif precision_length is None and decimal_length is not None:
+        assert decimal_length <= max_digits
+        assert decimal_length > 0
+        precision_length = rng.integers(
+            0, max_digits - decimal_length, size=n, endpoint=True)
+    else:  # neither is none
+        assert (decimal_length + precision_length) < max_digits
+        assert decimal_length > 0
+        assert precision_length >= 0
+        assert precision_length < max_digits
+
+    scale = numpy.power(10.0, precision_length)
+    values = numpy.floor(rng.random(n) * numpy.power(10.0, decimal_length))
+    values += numpy.floor(rng.random(n) * scale) / scale
+    values[rng.integers(0, 2, size=n, dtype=bool)] *= -1
+    return values.astype(dtype)
+
+
+def make_tiny_integer_many(n, rng=None):
+    """
+    Returns an int8 array of ``n`` 8bits complement 2 signed integers.
+
+    """
+    return __make_integers(n, MIN_TINY_INT, MAX_TINY_INT, numpy.int8, rng)
+
+
+def make_small_integer_many(n, rng=None):
+    """
+    Returns an int16 array of ``n`` 16bits complement 2 signed integers.
+
+    """
+    return __make_integers(n, MIN_SMALL_INT, MAX_SMALL_INT, numpy.int16, rng)
+
+
+def make_integer_many(n, distribution=None, rng=None):
+    """
+    Returns an int32 array of ``n`` 32bits complement 2 signed integers.
+
+    """
+    if distribution is not None:
+        return __distributed_integers(n, distribution, MIN_INT, MAX_INT, numpy.int32, rng)
+    return __make_integers(n, MIN_INT, MAX_INT, numpy.int32, rng)
+
+
+def make_big_integer_many(n, distribution=None, rng=None):
+    """
+    Returns an int64 array of ``n`` 64bits complement 2 signed integers.
+
+    """
+    if distribution is not None:
+        return __distributed_integers(n, distribution, MIN_BIG_INT, MAX_BIG_INT, numpy.int64, rng)
+    return __make_integers(n, MIN_BIG_INT, MAX_BIG_INT, numpy.int64, rng)
+
+
+def make_unsigned_tiny_integer_many(n, rng=None):
+    """
+    Returns an uint8 array of ``n`` 8bits unsigned integers.
+
+    """
+    return __make_integers(n, 0, unsigned(MAX_TINY_INT), numpy.uint8, rng)
+
+
+def make_unsigned_small_integer_many(n, rng=None):
+    """
+    Returns an uint16 array of ``n`` 16bits unsigned integers.
+
+    """
+    return __make_integers(n, 0, unsigned(MAX_SMALL_INT), numpy.uint16, rng)
+
+
+def make_unsigned_integer_many(n, rng=None):
+    """
+    Returns an uint32 array of ``n`` 32bits unsigned integers.
+
+    """
+    return __make_integers(n, 0, unsigned(MAX_INT), numpy.uint32, rng)
+
+
+def make_unsigned_big_integer_many(n, rng=None):
+    """
+    Returns an uint64 array of ``n`` 64bits unsigned integers.
+
+    """
+    return __make_integers(n, 0, unsigned(MAX_BIG_INT), numpy.uint64, rng)
+
+
+def make_real_many(n, digits=None, precision=None, distribution=None, rng=None):
+    """
+    Returns a float32 array of ``n`` numbers, see ``make_real``.
+
+    """
+    if distribution is not None:
+        return __distributed_floats(n, distribution, REAL_DIGITS, digits, precision, numpy.float32, rng)
+    return __make_floats(n, REAL_DIGITS, digits, precision, numpy.float32, rng)
+
+
+def make_double_many(n, digits=None, precision=None, distribution=None, rng=None):
+    """
+    Returns a float64 array of ``n`` numbers, see ``make_double``.
+
+    """
+    if distribution is not None:
+        return __distributed_floats(n, distribution, DOUBLE_DIGITS, digits, precision, numpy.float64, rng)
+    return __make_floats(n, DOUBLE_DIGITS, digits, precision, numpy.float64, rng)
+
+
+def make_money_cents_many(n, max_digits=MONEY_DIGITS, scale=MONEY_SCALE, negative=False, rng=None):
+    """
+    Returns an int64 array of ``n`` amounts in cents, see
+    ``make_money_cents``. Amounts of more than 18 digits do not fit.
+
+    """
+    assert 0 <= scale <= max_digits
+    if max_digits > 18:
+        raise ValueError("amounts of %d digits do not fit int64" % max_digits)
+
+    limit = 10 ** max_digits
+    return __make_integers(n, 1 - limit if negative else 0, limit - 1, numpy.int64, rng)
+
+
+def make_boolean_many(n, rng=None):
+    """
+    Returns a bool array of ``n`` values.
+
+    """
+    rng = default_rng if rng is None else rng
+    return rng.integers(0, 2, size=n, dtype=bool)
+
+
+def __make_timestamps(n, time_range, rng):
+    """
+    Returns an int64 array of ``n`` epoch integers, in steps, drawn
+    like ``TimeRange`` offsets.
+
+    """
+    rng = default_rng if rng is None else rng
+    past = rng.integers(0, time_range.past, size=n, dtype=numpy.int64, endpoint=True)
+    future = rng.integers(0, time_range.future, size=n, dtype=numpy.int64, endpoint=True)
+    return (epoch_microseconds(time_range.now) // time_range.unit) + future - past
+
+
+def make_datetime_many(n, from_date=None, to_date=None, now=None, resolution='s', tz=None, rng=None):
+    """
+    Returns a datetime64 array of ``n`` datetimes, see ``make_datetime``,
+    in units of ``resolution``. Numpy datetimes have no timezone: naive
+    datetimes keep their wall clock time, aware ones are stored as UTC.
+
+    """
+    time_range = get_time_range(from_date, to_date, now, resolution, tz)
+    return __make_timestamps(n, time_range, rng).astype('datetime64[%s]' % resolution)
+
+
+def make_timestamp_many(n, from_date=None, to_date=None, now=None, resolution='s', rng=None):
+    """
+    Returns an int64 array of ``n`` epoch timestamps, see ``make_timestamp``.
+
+    """
+    time_range = get_time_range(from_date, to_date, now, resolution, timezone.utc)
+    return __make_timestamps(n, time_range, rng)
+
+
+def make_ip_address_int_many(n, include_private=True, v=4, networks=None, rng=None):
+    """
+    Returns a uint32 array of ``n`` IPv4 addresses, see
+    ``make_ip_address_int``. Numpy has no 128 bits integers, so
+    IPv6 is not supported.
+
+    """
+    if v != 4:
+        raise ValueError("only IPv4 addresses fit numpy integers")
+
+    rng = default_rng if rng is None else rng
+    space = get_address_space(v, include_private, networks)
+    indexes = rng.integers(0, space.size, size=n, dtype=numpy.uint64)
+
+    if len(space.deltas) > 1:
+        ranges = numpy.searchsorted(numpy.array(space.offsets, dtype=numpy.uint64), indexes, 'right') - 1
+        indexes += numpy.array(space.deltas, dtype=numpy.uint64)[ranges]
+    else:
+        indexes += numpy.uint64(space.deltas[0])
+    return indexes.astype(numpy.uint32)
+
+
+def __feistel(x, permutation):
+    """
+    Array version of ``IntegerPermutation.__encrypt``, in wrapping
+    uint64 arithmetic.
+
+    """
+    half, mask = numpy.uint64(permutation.half), numpy.uint64(permutation.mask)
+    shift, golden = numpy.uint64(permutation.shift), numpy.uint64(GOLDEN)
+    left, right = x >> half, x & mask
+
+    for key in permutation.keys:
+        left, right = right, left ^ (((right ^ numpy.uint64(key)) * golden) >> shift)
+    return (left << half) | right
+
+
+def make_unique_integers_many(n, lo=MIN_INT, hi=MAX_INT, seed=None, start=0):
+    """
+    Returns the ``n`` values from index ``start`` of
+    ``make_unique_integers(lo, hi, seed)``, as an int64 array, or
+    uint64 when ``hi`` is over MAX_BIG_INT.
+
+    """
+    permutation = make_unique_integers(lo, hi, seed)
+
+    if start < 0 or start + n > permutation.size:
+        raise IndexError("permutation index out of range")
+    if MIN_BIG_INT <= lo and hi <= MAX_BIG_INT:
+        dtype = numpy.int64
+    elif 0 <= lo and hi < 1 << 64:
+        dtype = numpy.uint64
+    else:
+        raise ValueError("integers from %d to %d do not fit a numpy integer type" % (lo, hi))
+
+    values = numpy.arange(n, dtype=numpy.uint64) + numpy.uint64(start)
+    walking = numpy.arange(n)
+
+    while walking.size:
+        values[walking] = __feistel(values[walking], permutation)
+        if permutation.size == 1 << 64:
+            break
+        walking = walking[values[walking] >= numpy.uint64(permutation.size)]
+
+    values += numpy.uint64(lo % (1 << 64))  # wraps around for negative lo
+    return values.view(dtype)
@@ -0,0 +1,101 @@
+# -*- coding:utf-8 -*-
+
+"""
+Generates large datasets across a process pool.
+
+Rows are produced in fixed size blocks and each block gets its own
+``Factory`` seeded from the master seed and the block index, so the
+result for a given seed does not depend on the number of workers.
+"""
+
+import os
+import random
+
+from datetime import datetime
+from collections import deque
+
+from .factory import Factory
+from .schema import Schema
+
+
+BLOCK_SIZE = 10000
+
+
+def derive_seed(seed, index):
+    """
+    Derives the seed of the ``index``-th sub stream of ``seed``.
+
+    Seeds are taken from a hash of both values, so sub streams of
+    the same master seed are unrelated to each other.
+    """
+    import hashlib
+
+    digest = hashlib.sha512(("%d:%d" % (seed, index)).encode('ascii')).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def make_block(spec, seed, index, size, now=None):
+    """
+    Makes the ``index``-th block of rows of ``size`` rows.
+
+    """
+    factory = Factory(seed=derive_seed(seed, index), now=now)
+
+    if isinstance(spec, Schema):  # columnar fast path
+        return spec.tuples(size, factory)
+    return [spec(factory) for i in range(size)]
+
+
+def generate_parallel(spec, rows, workers=None, seed=None, block_size=BLOCK_SIZE, now=None):
+    """
+    Generates ``rows`` rows with ``spec`` using a pool of processes.
+    Rows are yielded in order, while at most two blocks per worker
+    are kept in memory.
+
+    Arguments:
+    spec -- a ``Schema``, or a picklable callable that receives a
+            ``Factory`` and returns a row
+    rows -- number of rows to generate
+
+    Keyword arguments:
+    workers     -- number of processes; defaults to the number of cpus.
+                   With 1 no pool is used.
+    seed        -- master seed; same seed and block_size, same rows
+    block_size  -- rows generated by a worker per task
+    now         -- reference datetime of all blocks; defaults to the
+                   current time when generation starts
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    if now is None:
+        now = datetime.now()
+
+    workers = workers or os.cpu_count() or 1
+
+    tasks = (
+        (spec, seed, index, min(block_size, rows - start), now)
+        for index, start in enumerate(range(0, rows, block_size)))
+
+    if workers == 1:
+        for task in tasks:
+            for row in make_block(*task):
+                yield row
+        return
+
+    # the pool machinery is costly to import and unused in workers
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        window = 2 * workers
+
+        for task in tasks:
+            pending.append(executor.submit(make_block, *task))
+
+            if len(pending) >= window:
+                for row in pending.popleft().result():
+                    yield row
+
+        while pending:
+            for row in pending.popleft().result():
+                yield row
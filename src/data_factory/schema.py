@@ -0,0 +1,320 @@
+# -*- coding:utf-8 -*-
+
+"""
+Declarative record schemas.
+
+A ``Schema`` maps column names to columns, each one standing for a
+``make_*`` function and its arguments::
+
+    >>> users = Schema(id=BigInteger(), email=Email(20, 30), bio=String(200, null=0.1))
+    >>> rows = users.tuples(1000)
+
+Schemas are compiled for a ``Factory`` into a function making columnar
+chunks with the ``make_*_many`` methods, so arguments are validated and
+randomness is drawn once per chunk instead of once per value.
+"""
+
+from datetime import datetime, timezone
+
+from .factory import default_factory
+
+
+class Column(object):
+    """
+    Base column. Subclasses set ``method`` to the name of the
+    factory method making its values.
+
+    Positional and keyword arguments are given to that method,
+    except for ``null``, the frequency of ``None`` values.
+    """
+    method = None
+
+    def __init__(self, *args, **kw):
+        self.null = kw.pop('null', 0)
+        self.args = args
+        self.kw = kw
+
+        assert 0 <= self.null <= 1
+
+    def __repr__(self):
+        args = [repr(a) for a in self.args]
+        args += ['%s=%r' % item for item in sorted(self.kw.items())]
+        if self.null:
+            args.append('null=%r' % self.null)
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(args))
+
+    def arguments(self, factory):
+        """
+        Returns the positional and keyword arguments given to the
+        factory method when compiled for ``factory``.
+
+        """
+        return self.args, self.kw
+
+    def compile(self, factory):
+        """
+        Returns a function making a list of ``n`` values for this
+        column. Arguments are validated here, once.
+
+        """
+        many = getattr(factory, self.method + '_many')
+        args, kw = self.arguments(factory)
+        null = self.null
+
+        many(0, *args, **kw)  # validates arguments
+
+        if not null:
+            return lambda n: many(n, *args, **kw)
+
+        rand = factory.random.random
+
+        def make_values(n):
+            return [
+                None if rand() < null else value
+                for value in many(n, *args, **kw)]
+        return make_values
+
+
+class TinyInteger(Column):
+    method = 'make_tiny_integer'
+
+
+class SmallInteger(Column):
+    method = 'make_small_integer'
+
+
+class Integer(Column):
+    method = 'make_integer'
+
+
+class BigInteger(Column):
+    method = 'make_big_integer'
+
+
+class UnsignedTinyInteger(Column):
+    method = 'make_unsigned_tiny_integer'
+
+
+class UnsignedSmallInteger(Column):
+    method = 'make_unsigned_small_integer'
+
+
+class UnsignedInteger(Column):
+    method = 'make_unsigned_integer'
+
+
+class UnsignedBigInteger(Column):
+    method = 'make_unsigned_big_integer'
+
+
+class Real(Column):
+    method = 'make_real'
+
+
+class Double(Column):
+    method = 'make_double'
+
+
+class Decimal(Column):
+    method = 'make_decimal'
+
+
+class Money(Column):
+    method = 'make_money'
+
+
+class MoneyCents(Column):
+    method = 'make_money_cents'
+
+
+class Boolean(Column):
+    method = 'make_boolean'
+
+
+class Choice(Column):
+    method = 'choose'
+
+
+class CharSequence(Column):
+    method = 'make_char_sequence'
+
+
+class Binary(Column):
+    method = 'make_binary'
+
+
+class ASCIIString(Column):
+    method = 'make_ascii_string'
+
+
+class String(Column):
+    method = 'make_string'
+
+
+class Unicode(Column):
+    method = 'make_unicode'
+
+
+class Slug(Column):
+    method = 'make_slug'
+
+
+class DateTime(Column):
+    """
+    Unless given, ``now`` is the one of the factory, or else pinned when
+    the column is compiled, so that all chunks share one reference
+    instant. It is always passed on, as numpy generators do not know
+    the factory.
+
+    """
+    method = 'make_datetime'
+
+    def reference(self):
+        return datetime.now(self.kw.get('tz'))
+
+    def arguments(self, factory):
+        if len(self.args) > 2 or self.kw.get('now') is not None:
+            return self.args, self.kw
+        now = self.reference() if factory.now is None else factory.now
+        return self.args, dict(self.kw, now=now)
+
+
+class Timestamp(DateTime):
+    method = 'make_timestamp'
+
+    def reference(self):
+        return datetime.now(timezone.utc)
+
+
+class HostnameLabel(Column):
+    method = 'make_hostname_label'
+
+
+class Hostname(Column):
+    method = 'make_hostname'
+
+
+class EmailLocalPart(Column):
+    method = 'make_email_local_part'
+
+
+class Email(Column):
+    method = 'make_email'
+
+
+class URL(Column):
+    method = 'make_url'
+
+
+class IPAddress(Column):
+    method = 'make_ip_address'
+
+
+class IPAddressStr(Column):
+    method = 'make_ip_address_str'
+
+
+class IPAddressInt(Column):
+    method = 'make_ip_address_int'
+
+
+class IPAddressPacked(Column):
+    method = 'make_ip_address_packed'
+
+
+class MimeType(Column):
+    method = 'make_mime_type'
+
+
+class Filename(Column):
+    method = 'make_filename'
+
+
+class Schema(object):
+    """
+    Ordered mapping of column names to columns.
+
+    Keyword arguments:
+    columns -- name=Column pairs, in column order
+    """
+    def __init__(self, **columns):
+        for name, column in columns.items():
+            if not isinstance(column, Column):
+                raise TypeError("column %s is not a Column: %r" % (name, column))
+
+        self.columns = columns
+
+    def __repr__(self):
+        return 'Schema(%s)' % ', '.join(
+            '%s=%r' % item for item in self.columns.items())
+
+    def __call__(self, factory):
+        """
+        Makes a single row tuple. Allows schemas to be used as
+        ``generate_parallel`` specs.
+
+        """
+        return self.tuples(1, factory)[0]
+
+    @property
+    def names(self):
+        return list(self.columns)
+
+    def compile(self, factory=None):
+        """
+        Returns a function making a chunk of ``n`` rows as a list with
+        one list of values per column.
+
+        """
+        factory = default_factory if factory is None else factory
+        makers = [column.compile(factory) for column in self.columns.values()]
+
+        def make_columns(n):
+            return [make_values(n) for make_values in makers]
+        return make_columns
+
+    def columnar(self, n, factory=None):
+        """
+        Returns ``n`` rows as a dict of column name to list of values.
+
+        """
+        return dict(zip(self.columns, self.compile(factory)(n)))
+
+    def tuples(self, n, factory=None):
+        """
+        Returns a list of ``n`` row tuples.
+
+        """
+        return list(zip(*self.compile(factory)(n))) if n > 0 else []
+
+    def dicts(self, n, factory=None):
+        """
+        Returns a list of ``n`` row dicts.
+
+        """
+        names = self.names
+        return [dict(zip(names, row)) for row in self.tuples(n, factory)]
+
+    def chunks(self, rows, chunk_size=10000, factory=None, format='tuples'):
+        """
+        Yields ``rows`` rows in chunks of up to ``chunk_size`` rows. The
+        schema is compiled once for all chunks.
+
+        Keyword arguments:
+        format -- 'tuples' or 'dicts' for lists of rows, or 'columns'
+                  for a dict of column name to list of values
+        """
+        assert format in ('tuples', 'dicts', 'columns')
+
+        names = self.names
+        make_columns = self.compile(factory)
+
+        for start in range(0, rows, chunk_size):
+            columns = make_columns(min(chunk_size, rows - start))
+
+            if format == 'columns':
+                yield dict(zip(names, columns))
+            elif format == 'dicts':
+                yield [dict(zip(names, row)) for row in zip(*columns)]
+            else:
+                yield list(zip(*columns))
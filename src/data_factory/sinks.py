@@ -0,0 +1,155 @@
+# -*- coding:utf-8 -*-
+
+"""
+Streaming sinks for generated rows.
+
+Rows are consumed ``chunk_size`` at a time, formatted into an in
+memory buffer and written with a single call, so memory use does not
+grow with the number of rows.
+"""
+
+import io
+import sys
+import csv
+import time
+
+from itertools import islice
+
+
+CHUNK_SIZE = 10000
+# csv.reader fails on "line contains NUL" before Python 3.11
+CSV_NUL = sys.version_info >= (3, 11)
+
+
+class SinkStats(object):
+    """
+    Rows and bytes written by a sink, and the time it took.
+
+    """
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+        self.chunks = 0
+        self.started = time.time()
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return '<SinkStats rows=%d bytes=%d seconds=%.3f rows/s=%d bytes/s=%d>' % (
+            self.rows, self.bytes, self.seconds,
+            self.rows_per_second, self.bytes_per_second)
+
+    def update(self, rows, size):
+        self.rows += rows
+        self.bytes += size
+        self.chunks += 1
+        self.seconds = time.time() - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+def chunked(rows, chunk_size=CHUNK_SIZE):
+    """
+    Yields lists of up to ``chunk_size`` rows from the ``rows`` iterable.
+
+    """
+    rows = iter(rows)
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def __open(target):
+    """
+    Returns ``(fileobj, binary, should_close)`` for a path or file object.
+
+    """
+    if hasattr(target, 'write'):
+        return target, not isinstance(target, io.TextIOBase), False
+    return open(target, 'wb'), True, True
+
+
+def write_csv(rows, target, header=None, chunk_size=CHUNK_SIZE,
+              encoding='utf-8', progress=None, **fmtparams):
+    """
+    Streams ``rows`` to ``target`` as csv, ``chunk_size`` rows per write.
+
+    Fields are quoted whenever they contain the delimiter, quote or
+    line break characters, so every character ``make_string``,
+    ``make_ascii_string`` and ``make_filename`` emit, control
+    characters included, reads back unchanged with ``csv.reader``.
+    NUL characters only do from Python 3.11; before it, ``csv.reader``
+    can not read them, so a ``ValueError`` is raised instead of writing
+    them. ``None`` is written as an empty field.
+
+    Arguments:
+    rows    -- iterable of row sequences
+    target  -- path, binary file object or text file object opened
+               with ``newline=''``
+
+    Keyword arguments:
+    header      -- sequence of column names written first
+    chunk_size  -- rows formatted per write
+    encoding    -- encoding used for paths and binary file objects
+    progress    -- callable receiving the ``SinkStats`` after each chunk
+    fmtparams   -- ``csv.writer`` formatting parameters, like ``dialect``
+                   or ``delimiter``
+
+    Returns a ``SinkStats``.
+    """
+    fileobj, binary, should_close = __open(target)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, **fmtparams)
+    stats = SinkStats()
+
+    def flush(rows_count):
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+        if not CSV_NUL and '\0' in data:
+            raise ValueError("csv can not hold NUL characters before Python 3.11")
+
+        if binary:
+            data = data.encode(encoding)
+            fileobj.write(data)
+            stats.update(rows_count, len(data))
+        else:
+            fileobj.write(data)
+            stats.update(rows_count, len(data.encode(encoding)))
+
+        if progress is not None:
+            progress(stats)
+
+    try:
+        if header is not None:
+            writer.writerow(header)
+
+        for chunk in chunked(rows, chunk_size):
+            writer.writerows(chunk)
+            flush(len(chunk))
+
+        if buffer.tell():  # header only
+            flush(0)
+    finally:
+        if should_close:
+            fileobj.close()
+
+    return stats
+
+
+def write_tsv(rows, target, **kw):
+    """
+    Same as ``write_csv``, with tab separated fields.
+
+    """
+    kw.setdefault('dialect', 'excel-tab')
+    return write_csv(rows, target, **kw)
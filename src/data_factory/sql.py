@@ -0,0 +1,224 @@
+# -*- coding:utf-8 -*-
+
+"""
+Bulk loading of generated rows into databases.
+
+ - ``insert_statements`` makes multi-row INSERT statements
+ - ``copy_chunks`` makes PostgreSQL COPY text format chunks
+ - ``load_sqlite`` inserts rows with ``executemany`` in batches,
+   committing once per transaction sized group of batches
+"""
+
+import math
+import sqlite3
+
+from decimal import Decimal
+from datetime import datetime
+
+from .sinks import SinkStats, chunked
+
+
+BATCH_SIZE = 1000
+TRANSACTION_SIZE = 100000
+DIALECTS = ('sqlite', 'postgresql')
+
+# PostgreSQL spelling of non-finite floats, by str(float(...))
+NON_FINITE = {'nan': 'NaN', 'inf': 'Infinity', '-inf': '-Infinity'}
+
+# characters escaped by the COPY text format
+COPY_ESCAPES = {
+    ord('\\'): '\\\\',
+    ord('\t'): '\\t',
+    ord('\n'): '\\n',
+    ord('\r'): '\\r',
+    ord('\b'): '\\b',
+    ord('\f'): '\\f',
+    ord('\v'): '\\v',
+}
+
+
+def quote_name(name):
+    """
+    Quotes a table or column name.
+
+    """
+    return '"%s"' % name.replace('"', '""')
+
+
+def __non_finite(value):
+    """
+    Returns the PostgreSQL spelling of ``value`` if it is a NaN or an
+    infinite float or ``Decimal``, None otherwise.
+
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return NON_FINITE[str(value)]
+    if isinstance(value, Decimal) and not value.is_finite():
+        return NON_FINITE[str(float(value))]
+    return None
+
+
+def sql_literal(value, dialect='sqlite'):
+    """
+    Returns ``value`` as a SQL literal of ``dialect``, ``'sqlite'`` or
+    ``'postgresql'``.
+
+    Strings are quoted by doubling single quotes, and bytes are
+    ``X'..'`` blobs or ``'\\x..'::bytea`` values. NaN and infinite floats
+    are quoted for PostgreSQL, and rejected with a ``ValueError`` for
+    sqlite, which has no such literals. Neither PostgreSQL nor sqlite3
+    accept NUL characters in statements, which ``make_ascii_string``
+    may emit; use ``load_sqlite`` parameters for those.
+    """
+    if value is None:
+        return 'NULL'
+    if value is True:
+        return 'TRUE'
+    if value is False:
+        return 'FALSE'
+    if isinstance(value, (int, float, Decimal)):
+        non_finite = __non_finite(value)
+        if non_finite is None:
+            return str(value)
+        if dialect != 'postgresql':
+            raise ValueError("%r has no %s literal" % (value, dialect))
+        return "'%s'" % non_finite
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        if dialect == 'postgresql':
+            return "'\\x%s'::bytea" % bytes(value).hex()
+        return "X'%s'" % bytes(value).hex()
+    if isinstance(value, datetime):
+        value = value.isoformat(' ')
+    return "'%s'" % str(value).replace("'", "''")
+
+
+def insert_statements(table, columns, rows, batch_size=BATCH_SIZE, dialect='sqlite'):
+    """
+    Yields one INSERT statement per ``batch_size`` rows.
+
+    Arguments:
+    table   -- table name
+    columns -- column names, in row order
+    rows    -- iterable of row sequences
+
+    Keyword arguments:
+    batch_size  -- rows per statement
+    dialect     -- ``'sqlite'`` or ``'postgresql'``, see ``sql_literal``
+    """
+    if dialect not in DIALECTS:
+        raise ValueError("unknown dialect %r" % dialect)
+
+    head = 'INSERT INTO %s (%s) VALUES\n' % (
+        quote_name(table), ', '.join(map(quote_name, columns)))
+
+    for batch in chunked(rows, batch_size):
+        yield head + ',\n'.join(
+            '(%s)' % ', '.join([sql_literal(value, dialect) for value in row]) for row in batch) + ';\n'
+
+
+def copy_value(value):
+    """
+    Returns ``value`` in PostgreSQL COPY text format.
+
+    """
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, datetime):
+        return value.isoformat(' ')
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\\\x' + bytes(value).hex()  # bytea hex format, backslash escaped
+    if isinstance(value, (float, Decimal)):
+        return __non_finite(value) or str(value)
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_chunks(rows, chunk_size=BATCH_SIZE):
+    """
+    Yields PostgreSQL COPY text format data, ``chunk_size`` rows per
+    string, to be given to ``COPY table FROM STDIN``.
+
+    """
+    for batch in chunked(rows, chunk_size):
+        yield ''.join(
+            '\t'.join(map(copy_value, row)) + '\n' for row in batch)
+
+
+def __sqlite_value(value):
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat(' ')
+    return str(value)
+
+
+def __sqlite_rows(batch):
+    """
+    Converts values sqlite3 does not take as is, like ``Decimal`` and
+    ``datetime``, to strings. Rows are left alone when not needed.
+
+    """
+    plain = (type(None), int, float, str, bytes)
+
+    for row in batch:
+        for value in row:
+            if not isinstance(value, plain):
+                return [tuple(map(__sqlite_value, row)) for row in batch]
+    return batch
+
+
+def load_sqlite(database, table, rows, columns=None, batch_size=BATCH_SIZE,
+                transaction_size=TRANSACTION_SIZE, progress=None):
+    """
+    Inserts ``rows`` into a sqlite table with ``executemany``.
+
+    Arguments:
+    database    -- path or ``sqlite3.Connection``
+    table       -- existing table name
+    rows        -- iterable of row sequences
+
+    Keyword arguments:
+    columns             -- column names, in row order; by default all
+                           table columns
+    batch_size          -- rows per ``executemany`` call
+    transaction_size    -- rows per transaction
+    progress            -- callable receiving the ``SinkStats`` after each batch
+
+    Returns a ``SinkStats``; ``bytes`` is always 0.
+    """
+    should_close = not isinstance(database, sqlite3.Connection)
+    connection = sqlite3.connect(database) if should_close else database
+    stats = SinkStats()
+
+    try:
+        if columns is None:
+            cursor = connection.execute('SELECT * FROM %s LIMIT 0' % quote_name(table))
+            columns = [d[0] for d in cursor.description]
+
+        sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+            quote_name(table),
+            ', '.join(map(quote_name, columns)),
+            ', '.join('?' * len(columns)))
+
+        uncommitted = 0
+        for batch in chunked(rows, batch_size):
+            connection.executemany(sql, __sqlite_rows(batch))
+            uncommitted += len(batch)
+
+            if uncommitted >= transaction_size:
+                connection.commit()
+                uncommitted = 0
+
+            stats.update(len(batch), 0)
+            if progress is not None:
+                progress(stats)
+
+        connection.commit()
+    finally:
+        if should_close:
+            connection.close()
+
+    return stats
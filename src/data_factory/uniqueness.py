@@ -0,0 +1,571 @@
+# -*- coding:utf-8 -*-
+
+"""
+Unique values from any generator, with bounded memory.
+
+``unique`` wraps a generator so that it never returns the same value
+twice, as needed for columns with a unique constraint. Values seen are
+kept in a set while few are expected, and as hash fingerprints in a
+``FingerprintFilter`` otherwise, which takes a few bytes per value
+instead of the hundred or so of a set of strings.
+
+Unique integers need no memory at all: ``make_unique_integers`` maps
+indexes to the integers of a range with a keyed permutation.
+
+A filter may take a new value for one it has seen (a false positive),
+never the other way round: such a value is dropped and drawn again, so
+uniqueness always holds, only a few draws are lost. Which values are
+dropped depends on the interpreter hash seed (``PYTHONHASHSEED``).
+"""
+
+import sys
+import random
+import warnings
+
+from array import array
+
+from . import catalogs
+from .factory import (
+    MIN_INT, MAX_INT, INT_TYPECODES, SLUG_TABLE, ASCII_TABLE, PRINTABLE_TABLE, BINARY_TABLE,
+    HOSTNAME_TABLE, HOSTNAME_HYPHEN_TABLE, EMAIL_LOCAL_TABLE,
+    get_suffixes, get_address_space)
+from .instrumentation import add_retries
+
+
+# expected values up to which seen values are kept in a set
+EXACT_THRESHOLD = 10 ** 5
+FP_RATE = 1e-6
+# consecutive draws of seen values before giving up
+MAX_RETRIES = 100
+# fraction of the value space over which a warning is issued
+EXHAUSTION = 0.5
+# draws over which the share of seen values is measured
+WINDOW = 1000
+
+LOAD_FACTOR = 0.75
+FINGERPRINT_BITS = (16, 32, 64)
+MASK64 = (1 << 64) - 1
+# odd 64 bits multiplier, spreads the bits of small integer hashes
+GOLDEN = 0x9E3779B97F4A7C15
+# feistel rounds of IntegerPermutation
+ROUNDS = 6
+
+
+def probes(load):
+    """
+    Expected slots compared by a lookup of a new value in a linear
+    probing table filled up to ``load``.
+
+    """
+    return 0.5 * (1 + 1 / (1 - load) ** 2)
+
+
+class FingerprintFilter(object):
+    """
+    Approximate set of hashable values, for up to ``capacity`` values.
+
+    Each value is stored as the high bits of its 64 bits hash in a linear
+    probing table of 16, 32 or 64 bits integers, the smallest whose
+    false positive rate at ``LOAD_FACTOR`` does not exceed ``fp_rate``.
+    A new value is taken for a seen one when a fingerprint compared on
+    its lookup is equal to its own.
+    """
+    def __init__(self, capacity, fp_rate=FP_RATE):
+        if capacity < 1:
+            raise ValueError("capacity must be positive, not %r" % (capacity,))
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1, not %r" % (fp_rate,))
+
+        for bits in FINGERPRINT_BITS:
+            if probes(LOAD_FACTOR) / 2 ** bits <= fp_rate:
+                break
+
+        typecode = INT_TYPECODES[(False, bits // 8)]
+
+        self.capacity = capacity
+        self.count = 0
+        self.bits = bits
+        self.shift = 64 - bits
+        self.size = int(capacity / LOAD_FACTOR) + 1
+        self.table = array(typecode, bytes(self.size * array(typecode).itemsize))
+
+    def __len__(self):
+        return self.count
+
+    def __lookup(self, value):
+        """
+        Returns ``(slot, fingerprint)``, where slot holds the fingerprint
+        of value, or is empty if value was not seen.
+
+        """
+        h = (hash(value) * GOLDEN) & MASK64
+        fingerprint = (h >> self.shift) or 1  # 0 marks empty slots
+        table, size = self.table, self.size
+        slot = h % size
+
+        while True:
+            found = table[slot]
+            if not found or found == fingerprint:
+                return slot, fingerprint
+            slot += 1
+            if slot == size:
+                slot = 0
+
+    def __contains__(self, value):
+        slot, fingerprint = self.__lookup(value)
+        return self.table[slot] != 0
+
+    def add(self, value):
+        """
+        Adds ``value`` to the filter. Returns False if it was (probably)
+        seen before, True otherwise.
+
+        """
+        slot, fingerprint = self.__lookup(value)
+        if self.table[slot]:
+            return False
+        if self.count >= self.capacity:
+            raise ValueError("filter is full, it holds %d values" % self.capacity)
+
+        self.table[slot] = fingerprint
+        self.count += 1
+        return True
+
+    @property
+    def nbytes(self):
+        return self.table.itemsize * self.size
+
+    @property
+    def fp_rate(self):
+        """
+        Estimated false positive rate of a lookup at the current load.
+
+        """
+        return min(1.0, probes(self.count / self.size) / 2 ** self.bits)
+
+
+class UniqueStats(object):
+    """
+    Draws made by a ``Unique`` generator and the values returned.
+
+    ``collisions`` counts the draws dropped for having been seen before,
+    either really or as filter false positives, ``retries`` the extra
+    generator calls made to replace them and ``longest`` the most draws
+    dropped for a single value, or a single batch. ``bytes`` is the
+    memory taken by the seen values, updated every ``WINDOW`` draws.
+    """
+    def __init__(self):
+        self.values = 0
+        self.draws = 0
+        self.collisions = 0
+        self.retries = 0
+        self.longest = 0
+        self.bytes = 0
+
+    def __repr__(self):
+        return '<UniqueStats values=%d draws=%d collisions=%d retries=%d longest=%d bytes=%d>' % (
+            self.values, self.draws, self.collisions, self.retries, self.longest, self.bytes)
+
+    @property
+    def collision_rate(self):
+        return self.collisions / self.draws if self.draws else 0.0
+
+
+class Unique(object):
+    """
+    Callable returning the values of ``generator`` that it did not return
+    before. See ``unique``.
+
+    """
+    def __init__(self, generator, expected_n, fp_rate=FP_RATE, space=None,
+                 max_retries=MAX_RETRIES, exact_threshold=EXACT_THRESHOLD, many=None):
+        if expected_n < 1:
+            raise ValueError("expected_n must be positive, not %r" % (expected_n,))
+
+        self.generator = generator
+        self.many_generator = many or self.__companion(generator)
+        self.expected_n = expected_n
+        self.fp_rate = fp_rate
+        self.max_retries = max_retries
+        self.exact = expected_n <= exact_threshold
+        self.space = None
+        self.stats = UniqueStats()
+        self.filters = []
+        self.__seen = set()
+        self.__window = (0, 0)
+        self.__warned = set()
+
+        if self.exact:
+            self.__add = self.__add_exact
+        else:
+            self.__add = self.__add_filter
+            self.filters.append(FingerprintFilter(expected_n, fp_rate))
+
+        if space is not None:
+            self.__check_space(space)
+        self.stats.bytes = self.nbytes
+
+    @staticmethod
+    def __companion(generator):
+        """
+        Returns the ``_many`` version of a factory method, if any.
+
+        """
+        owner = getattr(generator, '__self__', None)
+        return getattr(owner, getattr(generator, '__name__', '') + '_many', None)
+
+    def __warn(self, key, message):
+        if key not in self.__warned:
+            self.__warned.add(key)
+            warnings.warn(message, RuntimeWarning)
+
+    def __check_space(self, space):
+        self.space = space
+
+        if self.expected_n > space:
+            raise ValueError(
+                "%d unique values are expected, but only %d can be generated"
+                % (self.expected_n, space))
+        if self.expected_n > EXHAUSTION * space:
+            self.__warn('space', (
+                "%d unique values are expected out of %d possible ones: the last ones "
+                "take about %d draws each" % (
+                    self.expected_n, space, space // (space - self.expected_n + 1))))
+
+    def __start(self, args, kw):
+        """
+        Checks the value space for the arguments of the first call.
+
+        """
+        if self.space is None:
+            space = value_space(self.generator, *args, **kw)
+            if space is not None:
+                self.__check_space(space)
+
+    def __add_exact(self, value):
+        seen = self.__seen
+        if value in seen:
+            return False
+        seen.add(value)
+        return True
+
+    def __add_filter(self, value):
+        filters = self.filters
+        last = filters[-1]
+
+        if len(filters) > 1 and any(value in f for f in filters[:-1]):
+            return False
+        if last.count >= last.capacity:
+            self.__warn('capacity', (
+                "more than %d unique values were generated, filters are added "
+                "as needed, using more memory" % self.expected_n))
+            if value in last:
+                return False
+            last = FingerprintFilter(2 * last.capacity, self.fp_rate)
+            filters.append(last)
+            self.stats.bytes = self.nbytes
+        return last.add(value)
+
+    def __update(self, values, draws, retries, longest):
+        stats = self.stats
+        stats.values += values
+        stats.draws += draws
+        stats.collisions += draws - values
+        stats.retries += retries
+        stats.longest = max(stats.longest, longest)
+
+        if draws > values:
+            add_retries('unique', draws - values)
+
+        if stats.draws - self.__window[0] >= WINDOW:
+            draws, collisions = stats.draws - self.__window[0], stats.collisions - self.__window[1]
+            self.__window = (stats.draws, stats.collisions)
+            stats.bytes = self.nbytes
+
+            if collisions > EXHAUSTION * draws:
+                self.__warn('exhaustion', (
+                    "%d%% of the last %d draws were values seen before, the value space "
+                    "is close to exhausted" % (100 * collisions // draws, draws)))
+
+    def __exhausted(self):
+        return ValueError(
+            "no new value in %d draws, the value space is probably exhausted"
+            % (self.max_retries + 1))
+
+    def __call__(self, *args, **kw):
+        if not self.stats.draws:
+            self.__start(args, kw)
+
+        generator, add = self.generator, self.__add
+        collisions = 0
+
+        value = generator(*args, **kw)
+        while not add(value):
+            collisions += 1
+            if collisions > self.max_retries:
+                self.__update(0, collisions, collisions - 1, collisions)
+                raise self.__exhausted()
+            value = generator(*args, **kw)
+
+        self.__update(1, collisions + 1, collisions, collisions)
+        return value
+
+    def many(self, n, *args, **kw):
+        """
+        Returns a list of ``n`` unique values, drawn in batches with the
+        ``_many`` version of the generator when there is one.
+
+        """
+        if not self.stats.draws:
+            self.__start(args, kw)
+
+        generator, add = self.generator, self.__add
+        values = []
+        draws = retries = longest = failures = 0
+
+        while len(values) < n:
+            missing = n - len(values)
+            if self.many_generator is not None:
+                batch = self.many_generator(missing, *args, **kw)
+            else:
+                batch = [generator(*args, **kw) for i in range(missing)]
+
+            found = len(values)
+            values.extend([v for v in batch if add(v)])
+            draws += missing
+
+            if len(values) == found:
+                failures += 1
+                if failures > self.max_retries:
+                    self.__update(len(values), draws, retries, longest)
+                    raise self.__exhausted()
+            else:
+                failures = 0
+            longest = max(longest, missing - (len(values) - found))
+            if len(values) < n:
+                retries += 1
+
+        self.__update(n, draws, retries, longest)
+        return values
+
+    @property
+    def nbytes(self):
+        """
+        Memory taken by the values seen, not counting the values
+        themselves in exact mode.
+
+        """
+        if self.exact:
+            return sys.getsizeof(self.__seen)
+        return sum(f.nbytes for f in self.filters)
+
+
+def unique(generator, expected_n, fp_rate=FP_RATE, space=None,
+           max_retries=MAX_RETRIES, exact_threshold=EXACT_THRESHOLD, many=None):
+    """
+    Wraps ``generator`` so that it returns each value at most once.
+
+    Keyword arguments:
+        generator       -- callable returning a hashable value
+        expected_n      -- number of unique values that will be asked for
+        fp_rate         -- accepted filter false positive rate, the share of
+                           new values dropped as seen
+        space           -- number of values ``generator`` can return, found
+                           from the first call arguments by ``value_space``
+                           by default
+        max_retries     -- consecutive seen values before ValueError is raised
+        exact_threshold -- up to this ``expected_n``, seen values are kept in a set
+        many            -- batch version of generator, taking the number of values
+                           as first argument; found for factory methods
+
+    The returned ``Unique`` is called with the arguments of ``generator``;
+    its ``many(n, ...)`` method returns a list and its ``stats`` attribute
+    counts draws, collisions and retries. A RuntimeWarning is issued when
+    ``expected_n`` or the share of seen values drawn shows that the value
+    space is close to exhausted.
+    """
+    return Unique(generator, expected_n, fp_rate, space, max_retries, exact_threshold, many)
+
+
+def sequence_space(table_size, max_length, min_length=1):
+    """
+    Number of strings of ``min_length`` to ``max_length`` characters of
+    a table of ``table_size`` characters.
+
+    """
+    return sum(table_size ** length for length in range(min_length, max_length + 1))
+
+
+def __label_space(length):
+    if length == 1:
+        return len(HOSTNAME_TABLE)
+    return len(HOSTNAME_TABLE) ** 2 * len(HOSTNAME_HYPHEN_TABLE) ** (length - 2)
+
+
+def __hostname_space(max_length, domains=catalogs.DEFAULT_TLDS):
+    domains = get_suffixes(domains)[0]
+    return sum(
+        sum(__label_space(l) for l in range(1, min(63, max_length - len(d)) + 1))
+        for d in set(domains))
+
+
+def __local_part_space(length):
+    # strings of EMAIL_LOCAL_DOT_TABLE with no dot first, last or after a dot
+    ends_in_char, ends_in_dot = len(EMAIL_LOCAL_TABLE), 0
+    for i in range(length - 1):
+        ends_in_char, ends_in_dot = len(EMAIL_LOCAL_TABLE) * (ends_in_char + ends_in_dot), ends_in_char
+    return ends_in_char
+
+
+def __ip_space(include_private=True, v=4, networks=None):
+    return get_address_space(v, include_private, networks).size
+
+
+__SPACES = dict(
+    make_char_sequence=lambda table, length: len(set(table)) ** length,
+    make_binary=lambda length: len(BINARY_TABLE) ** length,
+    make_slug=lambda max_length, empty=False: sequence_space(
+        len(SLUG_TABLE), max_length, int(not empty)),
+    make_ascii_string=lambda max_length, empty=False: sequence_space(
+        len(ASCII_TABLE), max_length, int(not empty)),
+    make_string=lambda max_length, empty=False: sequence_space(
+        len(set(PRINTABLE_TABLE)), max_length, int(not empty)),
+    make_hostname_label=__label_space,
+    make_hostname=__hostname_space,
+    make_email_local_part=__local_part_space,
+    make_email=lambda local_length, domain_length: (
+        __local_part_space(local_length) * __hostname_space(domain_length)),
+    make_ip_address=__ip_space,
+    make_ip_address_str=__ip_space,
+    make_ip_address_int=__ip_space,
+    make_ip_address_packed=__ip_space,
+    make_ip_address_object=__ip_space,
+)
+
+
+def value_space(generator, *args, **kw):
+    """
+    Returns the number of distinct values a factory method, given as
+    method or name, returns for these arguments, or None if unknown.
+
+    """
+    name = generator if isinstance(generator, str) else getattr(generator, '__name__', None)
+    if name in __SPACES:
+        return __SPACES[name](*args, **kw)
+
+
+class IntegerPermutation(object):
+    """
+    Pseudo-random permutation of the integers from ``lo`` to ``hi``,
+    keyed by ``seed``, in constant memory.
+
+    Index ``i`` is mapped to a value by a balanced Feistel network over
+    the smallest even number of bits covering the range, applied again
+    while the result falls outside of it (cycle walking), which takes
+    less than 4 rounds of the network on average. Ranges of up to
+    2 ** 64 integers are supported. Indexes and slices are computed
+    independently, so shards of a job can take disjoint slices.
+
+    ``size`` is the number of integers; ``len()`` only works up to
+    ``sys.maxsize`` of them, so use ``size`` for 64 bits ranges.
+    """
+    def __init__(self, lo, hi, seed=None):
+        size = hi - lo + 1
+        if size < 1:
+            raise ValueError("empty range of integers (%d, %d)" % (lo, hi))
+        if size > 1 << 64:
+            raise ValueError("ranges of more than 2 ** 64 integers are not supported")
+
+        self.lo = lo
+        self.hi = hi
+        self.size = size
+        self.half = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half) - 1
+        self.shift = 64 - self.half
+        rng = random.Random(seed)
+        self.keys = tuple([rng.getrandbits(64) for i in range(ROUNDS)])
+
+    def __repr__(self):
+        return '<IntegerPermutation lo=%d hi=%d>' % (self.lo, self.hi)
+
+    def __len__(self):
+        if self.size > sys.maxsize:
+            raise ValueError("%d integers do not fit len(), use .size instead" % self.size)
+        return self.size
+
+    def __reversed__(self):
+        value = self.__value
+        for i in range(self.size - 1, -1, -1):
+            yield value(i)
+
+    def __contains__(self, value):
+        return self.lo <= value <= self.hi
+
+    def __encrypt(self, x):
+        half, mask, shift = self.half, self.mask, self.shift
+        left, right = x >> half, x & mask
+
+        for key in self.keys:
+            left, right = right, left ^ ((((right ^ key) * GOLDEN) & MASK64) >> shift)
+        return (left << half) | right
+
+    def __decrypt(self, x):
+        half, mask, shift = self.half, self.mask, self.shift
+        left, right = x >> half, x & mask
+
+        for key in reversed(self.keys):
+            left, right = right ^ ((((left ^ key) * GOLDEN) & MASK64) >> shift), left
+        return (left << half) | right
+
+    def __value(self, index):
+        size, encrypt = self.size, self.__encrypt
+
+        x = encrypt(index)
+        while x >= size:
+            x = encrypt(x)
+        return self.lo + x
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.__value(i) for i in range(self.size)[index]]
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("permutation index out of range")
+        return self.__value(index)
+
+    def __iter__(self):
+        value = self.__value
+        for i in range(self.size):
+            yield value(i)
+
+    def index(self, value):
+        """
+        Returns the index of ``value`` in the permutation.
+
+        """
+        if value not in self:
+            raise ValueError("%r is not in range (%d, %d)" % (value, self.lo, self.hi))
+
+        size, decrypt = self.size, self.__decrypt
+
+        x = decrypt(value - self.lo)
+        while x >= size:
+            x = decrypt(x)
+        return x
+
+
+def make_unique_integers(lo=MIN_INT, hi=MAX_INT, seed=None):
+    """
+    Returns an ``IntegerPermutation`` of the integers from ``lo`` to
+    ``hi``: each of them exactly once, in a pseudo-random order fixed by
+    ``seed``. It is a sequence, so ``ids[i]`` and ``ids[start:stop]``
+    give the values at these indexes and iterating gives them all.
+
+    Keyword arguments:
+        lo   -- smallest integer, like MIN_INT or 1
+        hi   -- largest integer, like MAX_INT or MAX_BIG_INT
+        seed -- key of the permutation, random if None
+    """
+    return IntegerPermutation(lo, hi, seed)
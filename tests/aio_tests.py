@@ -0,0 +1,127 @@
+# coding:utf-8
+
+import asyncio
+import threading
+import unittest
+
+
+def make_row(factory):
+    return (factory.make_big_integer(), factory.make_slug(10))
+
+
+class CountingSpec(object):
+    """
+    Row spec counting the rows made so far.
+
+    """
+    def __init__(self):
+        self.made = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, factory):
+        with self.lock:
+            self.made += 1
+        return make_row(factory)
+
+
+class FakeSink(object):
+    """
+    In process async sink, awaiting ``delay`` seconds per insert like
+    a database round trip.
+
+    """
+    def __init__(self, delay=0.0, fail_at=None):
+        self.rows = []
+        self.delay = delay
+        self.fail_at = fail_at
+
+    async def insert(self, chunk):
+        await asyncio.sleep(self.delay)
+        if self.fail_at is not None and len(self.rows) >= self.fail_at:
+            raise IOError('connection lost')
+        self.rows.extend(chunk)
+
+
+class TestAgenerate(unittest.TestCase):
+    def collect(self, spec, rows, **kw):
+        from data_factory.aio import agenerate
+
+        async def run():
+            return [chunk async for chunk in agenerate(spec, rows, **kw)]
+        return asyncio.run(run())
+
+    def test_same_rows_as_generate_parallel(self):
+        from data_factory.parallel import generate_parallel
+
+        chunks = self.collect(make_row, 250, chunk_size=64, seed=42)
+
+        self.assertEqual([len(c) for c in chunks], [64, 64, 64, 58])
+        self.assertEqual(
+            [row for chunk in chunks for row in chunk],
+            list(generate_parallel(make_row, 250, workers=1, seed=42, block_size=64)))
+
+    def test_schema(self):
+        from data_factory.schema import Schema, Integer, Slug
+
+        schema = Schema(id=Integer(), slug=Slug(10))
+        chunks = self.collect(schema, 30, chunk_size=10, seed=1)
+        self.assertEqual(chunks, self.collect(schema, 30, chunk_size=10, seed=1))
+        self.assertEqual(sum(len(c) for c in chunks), 30)
+
+    def test_no_rows(self):
+        self.assertEqual(self.collect(make_row, 0), [])
+
+    def test_errors_are_raised(self):
+        def broken(factory):
+            raise KeyError('broken')
+
+        self.assertRaises(KeyError, self.collect, broken, 10)
+
+    def test_break_stops_the_producer(self):
+        from data_factory.aio import agenerate
+
+        spec = CountingSpec()
+
+        async def run():
+            chunks = agenerate(spec, 10 ** 6, chunk_size=10, max_pending=1)
+            async for chunk in chunks:
+                break
+            await chunks.aclose()
+            await asyncio.sleep(0.05)
+            return spec.made
+
+        made = asyncio.run(run())
+        self.assertLessEqual(made, 40)
+
+
+class TestAload(unittest.TestCase):
+    def test_loads_all_rows(self):
+        from data_factory.aio import aload
+        from data_factory.parallel import generate_parallel
+
+        sink = FakeSink()
+        stats = asyncio.run(aload(sink.insert, make_row, 100, chunk_size=30, seed=3))
+
+        self.assertEqual(stats.rows, 100)
+        self.assertEqual(stats.chunks, 4)
+        self.assertEqual(sink.rows, list(generate_parallel(make_row, 100, workers=1, seed=3, block_size=30)))
+
+    def test_backpressure(self):
+        from data_factory.aio import aload
+
+        spec, sink, ahead = CountingSpec(), FakeSink(delay=0.01), []
+
+        def progress(stats):
+            ahead.append(spec.made - stats.rows)
+
+        asyncio.run(aload(sink.insert, spec, 400, chunk_size=20, max_pending=2, progress=progress))
+
+        self.assertEqual(len(sink.rows), 400)
+        self.assertLessEqual(max(ahead), (2 + 2) * 20)
+
+    def test_insert_errors_are_raised(self):
+        from data_factory.aio import aload
+
+        sink = FakeSink(fail_at=50)
+        self.assertRaises(IOError, asyncio.run, aload(sink.insert, make_row, 200, chunk_size=25))
+        self.assertEqual(len(sink.rows), 50)
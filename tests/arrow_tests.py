@@ -0,0 +1,176 @@
+# coding:utf-8
+
+import os
+import tempfile
+import unittest
+
+from datetime import datetime, timedelta, timezone
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def make_schema():
+    from data_factory.schema import (
+        Schema, TinyInteger, BigInteger, UnsignedInteger, Double,
+        Decimal, DateTime, Email, Boolean, Choice)
+
+    return Schema(
+        id=BigInteger(),
+        age=TinyInteger(null=0.5),
+        hits=UnsignedInteger(),
+        score=Double(4, 2),
+        price=Decimal(10, None, 2),
+        created=DateTime(),
+        email=Email(8, 12),
+        active=Boolean(),
+        status=Choice(('new', 'closed')),
+    )
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class TestArrow(unittest.TestCase):
+    def test_column_types(self):
+        from data_factory.arrow import compile_batches
+
+        batch = compile_batches(make_schema())(10)
+        types = dict(zip(batch.schema.names, batch.schema.types))
+
+        self.assertEqual(batch.num_rows, 10)
+        self.assertEqual(types['id'], pyarrow.int64())
+        self.assertEqual(types['age'], pyarrow.int8())
+        self.assertEqual(types['hits'], pyarrow.uint32())
+        self.assertEqual(types['score'], pyarrow.float64())
+        self.assertEqual(types['price'], pyarrow.decimal128(12, 2))
+        self.assertEqual(types['created'], pyarrow.timestamp('us'))
+        self.assertEqual(types['email'], pyarrow.string())
+        self.assertEqual(types['active'], pyarrow.bool_())
+        self.assertEqual(types['status'], pyarrow.string())
+
+    def test_nulls(self):
+        from data_factory.arrow import compile_batches
+
+        batch = compile_batches(make_schema())(200)
+        # may give false negative, but very unlikely
+        self.assertGreater(batch.column(1).null_count, 0)
+        self.assertEqual(batch.column(0).null_count, 0)
+
+    def test_decimal_type_holds_every_value(self):
+        from data_factory.arrow import decimal_type
+        from data_factory.factory import make_decimal_many
+
+        for args in [(10,), (10, 3), (10, None, 4), (10, 3, 4), (30,)]:
+            values = make_decimal_many(100, *args)
+            pyarrow.array(values, type=decimal_type(*args))  # raises on data loss
+
+        self.assertEqual(decimal_type(30), pyarrow.decimal256(59, 29))
+
+    def test_money_types(self):
+        from decimal import Decimal
+        from data_factory.arrow import compile_batches
+        from data_factory.factory import Factory
+        from data_factory.schema import Schema, Money, MoneyCents
+
+        schema = Schema(price=Money(), amount=Money(6, 3, True, null=0.5), wide=Money(30, 4), cents=MoneyCents())
+        batch = compile_batches(schema, Factory(2))(200)
+        types = dict(zip(batch.schema.names, batch.schema.types))
+
+        self.assertEqual(types['price'], pyarrow.decimal128(12, 2))
+        self.assertEqual(types['amount'], pyarrow.decimal128(6, 3))
+        self.assertEqual(types['wide'], pyarrow.decimal128(30, 4))
+        self.assertEqual(types['cents'], pyarrow.int64())
+
+        amounts = batch.column('amount')
+        self.assertGreater(amounts.null_count, 0)
+        self.assertTrue(any(a is not None and a < 0 for a in amounts.to_pylist()))
+        self.assertTrue(all(a is None or -1000 < a < 1000 for a in amounts.to_pylist()))
+        self.assertTrue(all(Decimal(0) <= p < 10 ** 10 for p in batch.column('price').to_pylist()))
+
+    def test_record_batches(self):
+        from data_factory.arrow import record_batches
+
+        sizes = [b.num_rows for b in record_batches(make_schema(), 25, batch_size=10)]
+        self.assertEqual(sizes, [10, 10, 5])
+
+    def test_seeded_factory_is_reproducible(self):
+        from data_factory.arrow import compile_batches
+        from data_factory.factory import Factory
+
+        a = compile_batches(make_schema(), Factory(seed=5))(20).drop_columns(['created'])
+        b = compile_batches(make_schema(), Factory(seed=5))(20).drop_columns(['created'])
+        self.assertTrue(a.equals(b))
+
+        now = datetime(2024, 1, 1)
+        a = compile_batches(make_schema(), Factory(seed=5, now=now))(20)
+        b = compile_batches(make_schema(), Factory(seed=5, now=now))(20)
+        self.assertTrue(a.equals(b))
+
+    def test_datetime_types(self):
+        from data_factory.arrow import compile_batches
+        from data_factory.schema import Schema, DateTime, Timestamp
+
+        schema = Schema(
+            utc=DateTime(datetime(2020, 1, 1, tzinfo=timezone.utc), tz=timezone.utc),
+            brt=DateTime(tz=timezone(timedelta(hours=-3))),
+            epoch=Timestamp(datetime(2020, 1, 1), resolution='ms'))
+        batch = compile_batches(schema)(10)
+        types = dict(zip(batch.schema.names, batch.schema.types))
+
+        self.assertEqual(types['utc'], pyarrow.timestamp('us', tz='+00:00'))
+        self.assertEqual(types['brt'], pyarrow.timestamp('us', tz='-03:00'))
+        self.assertEqual(types['epoch'], pyarrow.int64())
+        self.assertEqual(len(set(batch.column('brt').to_pylist())), 1)
+
+    def test_factory_now_is_the_reference(self):
+        from data_factory.arrow import compile_batches
+        from data_factory.factory import Factory
+        from data_factory.schema import Schema, DateTime, Timestamp
+
+        now = datetime(2024, 1, 1)
+        schema = Schema(created=DateTime(now - timedelta(days=30)), epoch=Timestamp(now - timedelta(days=30)))
+        batch = compile_batches(schema, Factory(seed=1, now=now))(1000)
+
+        created = batch.column('created').to_pylist()
+        self.assertGreaterEqual(min(created), now - timedelta(days=30))
+        self.assertLessEqual(max(created), now)
+
+        epoch = batch.column('epoch').to_pylist()
+        self.assertGreaterEqual(min(epoch), (now - timedelta(days=30)).timestamp())
+        self.assertLessEqual(max(epoch), now.timestamp())
+
+    def test_ip_address_types(self):
+        from data_factory.arrow import compile_batches
+        from data_factory.schema import Schema, IPAddressInt, IPAddressPacked, IPAddressStr
+
+        schema = Schema(
+            number=IPAddressInt(False),
+            packed=IPAddressPacked(v=6),
+            text=IPAddressStr(networks=['10.0.0.0/8']))
+        batch = compile_batches(schema)(10)
+        types = dict(zip(batch.schema.names, batch.schema.types))
+
+        self.assertEqual(types['number'], pyarrow.uint32())
+        self.assertEqual(types['packed'], pyarrow.binary())
+        self.assertEqual(types['text'], pyarrow.string())
+        self.assertTrue(all(len(v) == 16 for v in batch.column('packed').to_pylist()))
+
+    def test_write_parquet(self):
+        from data_factory.arrow import write_parquet
+
+        fd, path = tempfile.mkstemp(suffix='.parquet')
+        os.close(fd)
+
+        try:
+            reports = []
+            stats = write_parquet(make_schema(), 250, path, batch_size=100, progress=reports.append)
+            table = pyarrow.parquet.read_table(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(stats.rows, 250)
+        self.assertEqual(len(reports), 3)
+        self.assertEqual(table.num_rows, 250)
+        self.assertEqual(table.schema.names, make_schema().names)
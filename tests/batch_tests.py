@@ -0,0 +1,360 @@
+# coding:utf-8
+
+import sys
+import string
+import unittest
+
+
+class BatchMixin(object):
+    n = 50
+
+    def make(self, n):
+        raise NotImplemented()
+
+    def check(self, value):
+        raise NotImplemented()
+
+    def test_makes_n_values(self):
+        self.assertEqual(len(self.make(self.n)), self.n)
+
+    def test_makes_no_values(self):
+        self.assertEqual(self.make(0), [])
+
+    def test_values_are_valid(self):
+        for value in self.make(self.n):
+            self.check(value)
+
+
+class IntegerBatchMixin(BatchMixin):
+    signed = True
+    bits = None
+
+    def check(self, value):
+        self.assertIs(type(value), int)
+
+        if self.signed:
+            self.assertGreaterEqual(value, -2 ** (self.bits - 1))
+            self.assertLess(value, 2 ** (self.bits - 1))
+        else:
+            self.assertGreaterEqual(value, 0)
+            self.assertLess(value, 2 ** self.bits)
+
+    def test_covers_sign(self):
+        values = self.make(200)
+        self.assertTrue(any(v < 0 for v in values) == self.signed)
+
+
+class TestMakeTinyIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 8
+
+    def make(self, n):
+        from data_factory.factory import make_tiny_integer_many
+        return make_tiny_integer_many(n)
+
+
+class TestMakeSmallIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 16
+
+    def make(self, n):
+        from data_factory.factory import make_small_integer_many
+        return make_small_integer_many(n)
+
+
+class TestMakeIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 32
+
+    def make(self, n):
+        from data_factory.factory import make_integer_many
+        return make_integer_many(n)
+
+
+class TestMakeBigIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 64
+
+    def make(self, n):
+        from data_factory.factory import make_big_integer_many
+        return make_big_integer_many(n)
+
+
+class TestMakeUnsignedTinyIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 8
+    signed = False
+
+    def make(self, n):
+        from data_factory.factory import make_unsigned_tiny_integer_many
+        return make_unsigned_tiny_integer_many(n)
+
+
+class TestMakeUnsignedSmallIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 16
+    signed = False
+
+    def make(self, n):
+        from data_factory.factory import make_unsigned_small_integer_many
+        return make_unsigned_small_integer_many(n)
+
+
+class TestMakeUnsignedIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 32
+    signed = False
+
+    def make(self, n):
+        from data_factory.factory import make_unsigned_integer_many
+        return make_unsigned_integer_many(n)
+
+
+class TestMakeUnsignedBigIntegerMany(unittest.TestCase, IntegerBatchMixin):
+    bits = 64
+    signed = False
+
+    def make(self, n):
+        from data_factory.factory import make_unsigned_big_integer_many
+        return make_unsigned_big_integer_many(n)
+
+
+class TestMakeBooleanMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_boolean_many
+        return make_boolean_many(n)
+
+    def check(self, value):
+        self.assertTrue(isinstance(value, bool))
+
+    def test_makes_true_and_false(self):
+        # may give false positive in rare occasions
+        self.assertEqual(set(self.make(self.n)), set([True, False]))
+
+
+class TestMakeRealMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_real_many
+        return make_real_many(n)
+
+    def check(self, value):
+        self.assertEqual(type(value), float)
+
+
+class TestMakeDecimalMany(unittest.TestCase, BatchMixin):
+    def make(self, n, max_digits=10, decimal=None, precision=None):
+        from data_factory.factory import make_decimal_many
+        return make_decimal_many(n, max_digits, decimal, precision)
+
+    def check(self, value):
+        from decimal import Decimal
+        self.assertTrue(isinstance(value, Decimal))
+        self.assertLessEqual(len(str(abs(value))), 10 + 1)  # accounting the dot
+
+    def test_fraction_length_parameter_works(self):
+        for value in self.make(self.n, 10, None, 3):
+            self.assertEqual(len(str(abs(value)).split('.')[1]), 3)
+
+    def test_wide_digits_are_evenly_signed(self):
+        for decimal, max_digits in ((13, 15), (18, 20)):
+            values = self.make(20000, max_digits, decimal, None)
+            negative = sum(value < 0 for value in values) / 20000.0
+            self.assertAlmostEqual(negative, 0.5, delta=0.02)
+
+
+class TestMakeMoneyMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_money_many
+        return make_money_many(n, 6, 2, True)
+
+    def check(self, value):
+        from decimal import Decimal
+        self.assertTrue(isinstance(value, Decimal))
+        self.assertEqual(value.as_tuple().exponent, -2)
+        self.assertTrue(-10 ** 4 < value < 10 ** 4)
+
+
+class TestMakeMoneyCentsMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_money_cents_many
+        return make_money_cents_many(n, 4)
+
+    def check(self, value):
+        self.assertIs(type(value), int)
+        self.assertTrue(0 <= value < 10 ** 4)
+
+
+class TestMakeCharSequenceMany(unittest.TestCase, BatchMixin):
+    def make(self, n, length=12):
+        from data_factory.factory import make_char_sequence_many
+        return make_char_sequence_many(n, 'abc123', length)
+
+    def check(self, value):
+        self.assertEqual(len(value), 12)
+        for c in value:
+            self.assertIn(c, 'abc123')
+
+    def test_makes_empty_sequences(self):
+        self.assertEqual(self.make(3, 0), ['', '', ''])
+
+
+class TestMakeBinaryMany(unittest.TestCase, BatchMixin):
+    def make(self, n, length=8):
+        from data_factory.factory import make_binary_many
+        return make_binary_many(n, length)
+
+    def check(self, value):
+        self.assertEqual(len(value), 8)
+        for c in value:
+            self.assertIn(c, '01')
+
+    def test_binary_does_not_accepts_length_zero(self):
+        self.assertRaises(ValueError, self.make, 1, 0)
+
+
+class TestMakeStringMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_string_many
+        return make_string_many(n, 12)
+
+    def check(self, value):
+        self.assertTrue(isinstance(value, str))
+        self.assertTrue(0 < len(value) <= 12)
+        for c in value:
+            self.assertIn(c, string.printable)
+
+
+class TestMakeASCIIStringMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_ascii_string_many
+        return make_ascii_string_many(n, 12)
+
+    def check(self, value):
+        from data_factory.factory import ASCII_TABLE
+        self.assertTrue(0 < len(value) <= 12)
+        for c in value:
+            self.assertIn(c, ASCII_TABLE)
+
+
+class TestMakeUnicodeMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_unicode_many
+        return make_unicode_many(n, 12)
+
+    def check(self, value):
+        self.assertTrue(0 < len(value) <= 12)
+        for c in value:
+            self.assertTrue(0 <= ord(c) <= sys.maxunicode)
+
+
+class TestMakeSlugMany(unittest.TestCase, BatchMixin):
+    def make(self, n, empty=False):
+        from data_factory.factory import make_slug_many
+        return make_slug_many(n, 12, empty)
+
+    def check(self, value):
+        from data_factory.factory import SLUG_TABLE
+        self.assertTrue(0 < len(value) <= 12)
+        for c in value:
+            self.assertIn(c, SLUG_TABLE)
+
+    def test_makes_empty_slugs_if_allowed(self):
+        from data_factory.factory import make_slug_many
+        # may give false negative, but very unlikely
+        self.assertIn('', make_slug_many(200, 2, True))
+
+
+class TestMakeDatetimeMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from datetime import datetime, timedelta
+        from data_factory.factory import make_datetime_many
+
+        self.now = datetime.now()
+        self.from_date = self.now - timedelta(weeks=1)
+        return make_datetime_many(n, from_date=self.from_date)
+
+    def check(self, value):
+        from datetime import datetime
+        self.assertTrue(isinstance(value, datetime))
+        self.assertGreaterEqual(value, self.from_date)
+        self.assertLessEqual(value, datetime.now())
+
+
+class TestMakeHostnameMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_hostname_many
+        return make_hostname_many(n, 12)
+
+    def check(self, value):
+        charset = string.ascii_letters + string.digits + '-'
+        label, ext = value.rsplit('.', 1)
+
+        self.assertLessEqual(len(value), 12)
+        self.assertIn('.' + ext, (".com", ".org", ".net"))
+        self.assertFalse(label.startswith('-') or label.endswith('-'))
+        for c in label:
+            self.assertIn(c, charset)
+
+    def test_complains_if_length_is_too_small(self):
+        from data_factory.factory import make_hostname_many
+        self.assertRaises(AssertionError, make_hostname_many, 1, 2, ['.com.br'])
+
+
+class TestMakeEmailMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_email_many
+        return make_email_many(n, 6, 10)
+
+    def check(self, value):
+        local_part, domain_part = value.split('@')
+        self.assertEqual(len(local_part), 6)
+        self.assertNotIn('..', local_part)
+        self.assertLessEqual(len(domain_part), 10)
+
+
+class TestMakeUrlMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_url_many
+        return make_url_many(n, 20, safe=True)
+
+    def check(self, value):
+        self.assertTrue(value.startswith('https://'))
+        self.assertTrue(value.endswith('.com'))
+        self.assertLessEqual(len(value), 20)
+
+
+class TestMakeIPMany(unittest.TestCase, BatchMixin):
+    def make(self, n, include_private=True, v=4):
+        from data_factory.factory import make_ip_address_many
+        return make_ip_address_many(n, include_private=include_private, v=v)
+
+    def check(self, value):
+        self.assertEqual(len(value), 4)
+        for bit in value:
+            self.assertTrue(0 <= bit <= 255)
+
+    def test_makes_non_private_ipv4(self):
+        for ad in self.make(200, include_private=False):
+            self.assertNotEqual(ad[0], 10)
+            self.assertFalse(ad[0] == 192 and ad[1] == 168)
+            self.assertTrue(ad < [172, 16, 0, 0] or ad > [172, 31, 255, 255])
+
+    def test_makes_ipv6(self):
+        for ad in self.make(self.n, v=6):
+            self.assertEqual(len(ad), 8)
+            for bit in ad:
+                self.assertTrue(0 <= int(bit, 16) <= 65535)
+
+
+class TestMakeMimeTypeMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_mime_type_many
+        return make_mime_type_many(n)
+
+    def check(self, value):
+        import mimetypes
+        self.assertIn(value, mimetypes.types_map.values())
+
+
+class TestMakeFilenameMany(unittest.TestCase, BatchMixin):
+    def make(self, n):
+        from data_factory.factory import make_filename_many
+        return make_filename_many(n, 12)
+
+    def check(self, value):
+        from os.path import splitext
+        self.assertEqual(len(value), 12)
+        self.assertIn(splitext(value)[1], (".txt", ".odt", ".pdf"))
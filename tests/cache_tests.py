@@ -0,0 +1,184 @@
+# coding:utf-8
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import datetime, timezone
+
+NOW = datetime(2024, 3, 15, 12, 30)
+
+
+def make_schema():
+    from data_factory.schema import (
+        Schema, BigInteger, Boolean, DateTime, Double, Email, Integer, IPAddressPacked,
+        String, UnsignedBigInteger, Decimal)
+
+    return Schema(
+        id=BigInteger(), score=Integer(null=0.3), active=Boolean(null=0.1), ratio=Double(),
+        big=UnsignedBigInteger(), email=Email(12, 20), name=String(10, null=0.5),
+        ip=IPAddressPacked(), created=DateTime(), aware=DateTime(tz=timezone.utc),
+        price=Decimal(8, 5, 2))
+
+
+def generate(schema, rows, seed, chunk_size):
+    from data_factory.factory import Factory
+
+    columns = dict((name, []) for name in schema.names)
+    for chunk in schema.chunks(rows, chunk_size, Factory(seed=seed, now=NOW), format='columns'):
+        for name in schema.names:
+            columns[name].extend(chunk[name])
+    return columns
+
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_cache(self, **kw):
+        from data_factory.cache import DatasetCache
+        return DatasetCache(self.directory, **kw)
+
+    def test_values_round_trip(self):
+        schema = make_schema()
+        expected = generate(schema, 250, 42, 100)
+
+        with self.make_cache().get(schema, 250, 42, NOW, chunk_size=100) as dataset:
+            self.assertEqual(len(dataset), 250)
+            for name in schema.names:
+                self.assertEqual(list(dataset.columns[name]), expected[name], name)
+
+            self.assertEqual(dataset.columns['email'][-1], expected['email'][-1])
+            self.assertEqual(dataset.columns['score'][10:20], expected['score'][10:20])
+            self.assertEqual(dataset.columns['created'][3], expected['created'][3])
+            self.assertEqual(dataset.tuples()[7], tuple(expected[name][7] for name in schema.names))
+
+    def test_aware_datetimes(self):
+        from data_factory.schema import Schema, DateTime
+
+        utc = timezone.utc
+        now = datetime(2024, 1, 1, tzinfo=utc)
+        schema = Schema(
+            d=DateTime(datetime(2023, 1, 1, tzinfo=utc)), nulls=DateTime(datetime(2023, 1, 1, tzinfo=utc), null=0.99))
+
+        with self.make_cache().get(schema, 500, 2, now, chunk_size=10) as dataset:
+            values = list(dataset.columns['d'])
+            self.assertTrue(all(v.tzinfo is utc for v in values))
+            self.assertTrue(datetime(2023, 1, 1, tzinfo=utc) <= min(values) <= max(values) <= now)
+
+            nulls = list(dataset.columns['nulls'])  # the first chunks have no value
+            self.assertEqual(len(nulls), 500)
+            self.assertIsNone(nulls[0])
+            self.assertTrue(all(v is None or v.tzinfo is utc for v in nulls))
+            self.assertTrue(any(v is not None for v in nulls))
+
+    def test_columns_are_memory_mapped(self):
+        from data_factory.cache import BlobColumn, DatetimeColumn, MaskedColumn
+
+        with self.make_cache().get(make_schema(), 50, 1, NOW) as dataset:
+            self.assertIsInstance(dataset.columns['id'], memoryview)
+            self.assertIsInstance(dataset.columns['score'], MaskedColumn)
+            self.assertIsInstance(dataset.columns['email'], BlobColumn)
+            self.assertIsInstance(dataset.columns['created'], DatetimeColumn)
+            self.assertIsInstance(dataset.columns['price'], list)
+
+    def test_second_get_loads(self):
+        cache, schema = self.make_cache(), make_schema()
+
+        first = cache.get(schema, 100, 7, NOW)
+        first.close()
+        self.assertIsNotNone(cache.load(schema, 100, 7, NOW))
+        self.assertIsNone(cache.load(schema, 100, 8, NOW))
+        self.assertEqual(len(cache.entries()), 1)
+
+    def test_key(self):
+        from data_factory.schema import Schema, Integer
+
+        cache, schema = self.make_cache(), make_schema()
+        key = cache.key(schema, 100, 1, NOW)
+
+        self.assertEqual(key, cache.key(make_schema(), 100, 1, NOW))
+        self.assertNotEqual(key, cache.key(schema, 101, 1, NOW))
+        self.assertNotEqual(key, cache.key(schema, 100, 2, NOW))
+        self.assertNotEqual(key, cache.key(schema, 100, 1, datetime(2024, 3, 16)))
+        self.assertNotEqual(key, cache.key(schema, 100, 1, NOW, chunk_size=10))
+        self.assertNotEqual(
+            cache.key(Schema(a=Integer()), 100, 1), cache.key(Schema(a=Integer(null=0.5)), 100, 1))
+        self.assertRaises(ValueError, cache.key, schema, 100, None, NOW)
+
+    def test_dates_need_a_pinned_now(self):
+        from data_factory.schema import Schema, DateTime, Timestamp
+
+        cache = self.make_cache()
+        self.assertRaises(ValueError, cache.key, Schema(a=DateTime()), 100, 1)
+        self.assertRaises(ValueError, cache.get, Schema(a=Timestamp(NOW)), 100, 1)
+        cache.key(Schema(a=DateTime(now=NOW)), 100, 1)
+        cache.key(Schema(a=DateTime(NOW, NOW, NOW)), 100, 1)
+
+    def test_weighted_choices(self):
+        from data_factory.factory import WeightedChoices
+        from data_factory.schema import Schema, Choice
+
+        def schema(weights):
+            return Schema(plan=Choice(WeightedChoices(['free', 'pro'], weights)))
+
+        cache = self.make_cache()
+        self.assertEqual(cache.key(schema([9, 1]), 100, 1), cache.key(schema([9, 1]), 100, 1))
+        self.assertNotEqual(cache.key(schema([9, 1]), 100, 1), cache.key(schema([8, 2]), 100, 1))
+
+        cache.get(schema([9, 1]), 100, 1).close()
+        dataset = cache.load(schema([9, 1]), 100, 1)
+        self.assertIsNotNone(dataset)
+        dataset.close()
+
+    def test_lru_eviction(self):
+        import time
+        from data_factory.schema import Schema, BigInteger
+
+        cache = self.make_cache(max_bytes=20000)
+        schema = Schema(id=BigInteger())
+
+        for seed in range(3):
+            cache.get(schema, 1000, seed).close()  # a bit over 8000 bytes each
+            time.sleep(0.01)
+        keys = [cache.key(schema, 1000, seed) for seed in range(3)]
+
+        self.assertEqual([entry[0] for entry in cache.entries()], keys[1:])
+        self.assertLessEqual(sum(entry[1] for entry in cache.entries()), 20000)
+
+        cache.load(schema, 1000, 1).close()  # 1 becomes the most recently used
+        time.sleep(0.01)
+        cache.get(schema, 1000, 3).close()
+        self.assertEqual(
+            set(entry[0] for entry in cache.entries()), set([keys[1], cache.key(schema, 1000, 3)]))
+
+    def test_stale_versions_are_evicted(self):
+        import json
+
+        cache, schema = self.make_cache(), make_schema()
+        cache.get(schema, 10, 1, NOW).close()
+
+        key = cache.entries()[0][0]
+        meta = os.path.join(self.directory, key, 'meta.json')
+        with open(meta) as f:
+            data = json.load(f)
+        with open(meta, 'w') as f:
+            json.dump(dict(data, version='0.0:old'), f)
+
+        self.assertEqual(cache.evict(), [key])
+        self.assertEqual(cache.entries(), [])
+
+    def test_clear(self):
+        cache = self.make_cache()
+        cache.get(make_schema(), 10, 1, NOW).close()
+        cache.clear()
+        self.assertEqual(cache.entries(), [])
+
+    def test_empty_dataset(self):
+        with self.make_cache().get(make_schema(), 0, 1, NOW) as dataset:
+            self.assertEqual(len(dataset), 0)
+            self.assertEqual(dataset.tuples(), [])
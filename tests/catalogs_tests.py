@@ -0,0 +1,84 @@
+# coding:utf-8
+
+import unittest
+
+
+class TestCatalogs(unittest.TestCase):
+    def test_mime_types_are_unique(self):
+        from data_factory.catalogs import mime_types
+
+        types = mime_types()
+        self.assertTrue(isinstance(types, tuple))
+        self.assertEqual(len(types), len(set(types)))
+        self.assertIn('text/plain', types)
+
+    def test_catalogs_are_cached(self):
+        from data_factory.catalogs import mime_types, extensions, mime_extension_pairs
+
+        self.assertIs(mime_types(), mime_types())
+        self.assertIs(extensions(), extensions())
+        self.assertIs(mime_extension_pairs(), mime_extension_pairs())
+
+    def test_pairs_agree_with_mimetypes(self):
+        import mimetypes
+        from data_factory.catalogs import mime_extension_pairs
+
+        for mime, ext in mime_extension_pairs():
+            self.assertEqual(mimetypes.types_map[ext], mime)
+
+    def test_keeps_added_types(self):
+        import mimetypes
+        from data_factory import catalogs
+
+        def clear_caches():
+            for value in list(vars(catalogs).values()):
+                getattr(value, 'cache_clear', lambda: None)()
+
+        mimetypes.init()
+        mimetypes.add_type('application/x-data-factory', '.dfx')
+        clear_caches()
+        try:
+            self.assertIn('application/x-data-factory', catalogs.mime_types())
+            self.assertEqual(mimetypes.types_map.get('.dfx'), 'application/x-data-factory')
+        finally:
+            mimetypes.types_map.pop('.dfx', None)
+            clear_caches()
+
+    def test_extensions_for(self):
+        from data_factory.catalogs import extensions_for
+
+        self.assertIn('.txt', extensions_for('text/plain'))
+        self.assertRaises(ValueError, extensions_for, 'no/such-type')
+
+
+class TestCatalogGenerators(unittest.TestCase):
+    def test_filename_agrees_with_mime_type(self):
+        from data_factory.catalogs import extensions_for
+        from data_factory.factory import make_mime_type, make_filename
+
+        for i in range(20):
+            mime_type = make_mime_type()
+            filename = make_filename(30, mime_type=mime_type)
+
+            self.assertEqual(len(filename), 30)
+            self.assertTrue(any(filename.endswith(ext) for ext in extensions_for(mime_type)))
+
+    def test_filename_many_agrees_with_mime_type(self):
+        from data_factory.factory import make_filename_many
+
+        for filename in make_filename_many(20, 12, mime_type='application/pdf'):
+            self.assertTrue(filename.endswith('.pdf'))
+
+    def test_hostname_default_domains(self):
+        from data_factory.catalogs import DEFAULT_TLDS
+        from data_factory.factory import make_hostname_many
+
+        for hostname in make_hostname_many(50, 30):
+            self.assertTrue(any(hostname.endswith(tld) for tld in DEFAULT_TLDS))
+
+    def test_hostname_from_tlds(self):
+        from data_factory.catalogs import TLDS
+        from data_factory.factory import make_hostname_many
+
+        for hostname in make_hostname_many(50, 30, domains=TLDS):
+            self.assertTrue(any(hostname.endswith(tld) for tld in TLDS))
@@ -0,0 +1,57 @@
+# coding:utf-8
+
+import string
+import unittest
+
+from collections import Counter
+
+
+class TestCharTable(unittest.TestCase):
+    def assertUniform(self, table, length=200000):
+        from data_factory.factory import Factory
+
+        counts = Counter(Factory(seed=1).make_char_sequence(table, length))
+        expected = float(length) / len(table)
+
+        self.assertEqual(set(counts), set(table))
+        for char, count in counts.items():
+            self.assertAlmostEqual(count / expected, 1, delta=0.15)
+
+    def test_power_of_two_table_is_uniform(self):
+        from data_factory.factory import SLUG_TABLE
+        self.assertUniform(SLUG_TABLE)
+
+    def test_table_with_rejected_bytes_is_uniform(self):
+        self.assertUniform(string.printable)
+
+    def test_unicode_table_is_uniform(self):
+        self.assertUniform(u'αβγδεζηθικλμνξοπρστυφχψω')
+
+    def test_repeated_characters_keep_their_weight(self):
+        from data_factory.factory import Factory
+
+        counts = Counter(Factory(seed=2).make_char_sequence('aab', 30000))
+        self.assertAlmostEqual(counts['a'] / 30000.0, 2 / 3.0, delta=0.02)
+
+    def test_tables_are_cached(self):
+        from data_factory.factory import get_char_table, ASCII_TABLE
+
+        self.assertIs(get_char_table(ASCII_TABLE), get_char_table(ASCII_TABLE))
+        self.assertIs(get_char_table('xyz'), get_char_table('xyz'))
+
+    def test_unsupported_tables(self):
+        from data_factory.factory import get_char_table, make_char_sequence
+
+        long_table = u''.join(map(chr, range(1000, 1300)))
+        self.assertIsNone(get_char_table(long_table))
+        self.assertIsNone(get_char_table(['ab', 'cd']))
+
+        for c in make_char_sequence(long_table, 50):
+            self.assertIn(c, long_table)
+        self.assertEqual(len(make_char_sequence(['ab', 'cd'], 5)), 10)
+
+    def test_lengths(self):
+        from data_factory.factory import make_char_sequence
+
+        for length in (0, 1, 2, 7, 1000):
+            self.assertEqual(len(make_char_sequence(string.digits, length)), length)
@@ -0,0 +1,91 @@
+# coding:utf-8
+
+import unittest
+
+from collections import Counter
+
+
+def frequencies(values, choices):
+    counts = Counter(values)
+    return [counts[c] / float(len(values)) for c in choices]
+
+
+class TestWeightedChoices(unittest.TestCase):
+    def check_distribution(self, size, n=100000):
+        import random
+        from data_factory.factory import WeightedChoices
+
+        rng = random.Random(size)
+        choices = ['c%d' % i for i in range(size)]
+        weights = [rng.random() ** 3 for i in range(size)]
+        weights[0] = 0
+        total = sum(weights)
+
+        table = WeightedChoices(choices, weights)
+        batch = frequencies(table.draw(rng.random, n), choices)
+        single = frequencies([table.draw_one(rng.random) for i in range(n)], choices)
+
+        for got in (batch, single):
+            self.assertEqual(got[0], 0)
+            for g, w in zip(got, weights):
+                self.assertAlmostEqual(g, w / total, delta=0.01)
+
+    def test_small_table(self):
+        self.check_distribution(5)
+
+    def test_alias_table(self):
+        from data_factory.factory import BISECT_SIZE
+        self.check_distribution(2 * BISECT_SIZE)
+
+    def test_invalid_weights(self):
+        from data_factory.factory import WeightedChoices
+
+        self.assertRaises(ValueError, WeightedChoices, 'ab', [1])
+        self.assertRaises(ValueError, WeightedChoices, 'ab', [1, -1])
+        self.assertRaises(ValueError, WeightedChoices, 'ab', [0, 0])
+        self.assertRaises(ValueError, WeightedChoices, 'ab', [1, float('inf')])
+
+    def test_prepared_once(self):
+        from data_factory.factory import get_weighted_choices
+
+        choices, weights = ['a', 'b'], [1, 3]
+        table = get_weighted_choices(choices, weights)
+
+        self.assertIs(get_weighted_choices(choices, weights), table)
+        self.assertIs(get_weighted_choices(table), table)
+        self.assertIsNot(get_weighted_choices(choices, [1, 3]), table)
+
+
+class TestChoose(unittest.TestCase):
+    def test_weighted(self):
+        from data_factory.factory import Factory
+
+        factory = Factory(1)
+        values = factory.choose_many(20000, 'abc', [0, 1, 3])
+        values += [factory.choose('abc', [0, 1, 3]) for i in range(20000)]
+
+        self.assertEqual(set(values), {'b', 'c'})
+        self.assertAlmostEqual(values.count('c') / 40000.0, 0.75, delta=0.02)
+
+    def test_prepared_choices(self):
+        from data_factory.factory import Factory, WeightedChoices
+
+        plans = WeightedChoices(('free', 'pro', 'team'), (90, 9, 1))
+        self.assertIn(Factory(1).choose(plans), plans.choices)
+        self.assertEqual(Factory(2).choose_many(50, plans), Factory(2).choose_many(50, plans))
+        self.assertEqual(Factory(2).choose_many(0, plans), [])
+
+    def test_uniform_is_unchanged(self):
+        import random
+        from data_factory.factory import Factory
+
+        self.assertEqual(Factory(3).choose('abc'), random.Random(3).choice('abc'))
+        self.assertEqual(Factory(3).choose_many(5, 'abc'), random.Random(3).choices('abc', k=5))
+
+    def test_schema_column(self):
+        from data_factory.factory import Factory
+        from data_factory.schema import Schema, Choice
+
+        schema = Schema(status=Choice(('new', 'paid', 'void'), weights=(1, 1, 0)))
+        values = [row[0] for row in schema.tuples(200, Factory(1))]
+        self.assertEqual(set(values), {'new', 'paid'})
@@ -0,0 +1,113 @@
+# coding:utf-8
+
+import pickle
+import random
+import unittest
+
+from datetime import datetime
+
+NOW = datetime(2024, 3, 15, 12, 30)
+
+
+def make_schema():
+    from data_factory.schema import Schema, BigInteger, Email, DateTime, Integer, Slug
+
+    return Schema(
+        id=BigInteger(), email=Email(12, 20), created=DateTime(), score=Integer(null=0.3), slug=Slug(20))
+
+
+def make_row(factory):
+    return (factory.make_integer(), factory.make_slug(10))
+
+
+class TestCounterRandom(unittest.TestCase):
+    def test_cells_are_pure(self):
+        from data_factory.counter import CounterRandom
+
+        rng = CounterRandom(42)
+        first = [rng.at('users', 7, 'id').random() for i in range(3)]
+        rng.at('users', 8, 'id').getrandbits(1000)
+
+        self.assertEqual(first[0], first[1])
+        self.assertEqual(rng.at('users', 7, 'id').random(), first[0])
+        self.assertEqual(CounterRandom(42).at('users', 7, 'id').random(), first[0])
+
+    def test_cells_differ(self):
+        from data_factory.counter import CounterRandom
+
+        rng = CounterRandom(42)
+        values = set(rng.at('users', row, column).getrandbits(64)
+                     for row in range(100) for column in ('id', 'email'))
+        self.assertEqual(len(values), 200)
+        self.assertNotEqual(CounterRandom(1).random(), CounterRandom(2).random())
+
+    def test_random_interface(self):
+        from data_factory.counter import CounterRandom
+
+        rng = CounterRandom('seed')
+        values = [rng.random() for i in range(10000)]
+        self.assertTrue(all(0 <= v < 1 for v in values))
+        self.assertAlmostEqual(sum(values) / len(values), 0.5, delta=0.02)
+
+        self.assertTrue(1 <= rng.randint(1, 6) <= 6)
+        self.assertIn(rng.choice('abc'), 'abc')
+        if hasattr(random.Random, 'randbytes'):  # Python 3.9
+            self.assertEqual(len(rng.randbytes(100)), 100)
+        self.assertEqual(rng.getrandbits(0), 0)
+        self.assertLess(rng.getrandbits(100000), 2 ** 100000)
+        self.assertRaises(ValueError, rng.getrandbits, -1)
+
+    def test_state(self):
+        from data_factory.counter import CounterRandom
+
+        rng = CounterRandom(3).at('t', 1)
+        rng.random()
+        state = rng.getstate()
+        expected = [rng.random() for i in range(20)]
+
+        rng.setstate(state)
+        self.assertEqual([rng.random() for i in range(20)], expected)
+
+        copy = pickle.loads(pickle.dumps(rng))
+        self.assertEqual(copy.random(), rng.random())
+
+
+class TestRowsAt(unittest.TestCase):
+    def test_rows_do_not_depend_on_the_range(self):
+        from data_factory.counter import rows_at, row_at
+
+        schema = make_schema()
+        rows = rows_at(schema, 0, 100, 42, 'users', NOW)
+
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(rows_at(schema, 40, 60, 42, 'users', NOW), rows[40:60])
+        self.assertEqual(row_at(schema, 99, 42, 'users', NOW), rows[99])
+
+    def test_columns_are_independent(self):
+        from data_factory.counter import rows_at
+        from data_factory.schema import Schema, BigInteger, Slug
+
+        wide = rows_at(Schema(id=BigInteger(), slug=Slug(20)), 0, 10, 1, now=NOW)
+        narrow = rows_at(Schema(id=BigInteger()), 0, 10, 1, now=NOW)
+        self.assertEqual([r[0] for r in wide], [r[0] for r in narrow])
+
+    def test_seed_and_table(self):
+        from data_factory.counter import rows_at
+
+        schema = make_schema()
+        rows = rows_at(schema, 0, 10, 1, 'a', NOW)
+        self.assertNotEqual(rows, rows_at(schema, 0, 10, 2, 'a', NOW))
+        self.assertNotEqual(rows, rows_at(schema, 0, 10, 1, 'b', NOW))
+
+    def test_nulls(self):
+        from data_factory.counter import rows_at
+
+        scores = [row[3] for row in rows_at(make_schema(), 0, 300, 5, now=NOW)]
+        self.assertTrue(40 < scores.count(None) < 140)
+
+    def test_row_callables(self):
+        from data_factory.counter import rows_at, row_at
+
+        rows = rows_at(make_row, 1000, 1010, 9)
+        self.assertEqual(row_at(make_row, 1005, 9), rows[5])
+        self.assertEqual(len(set(rows)), 10)
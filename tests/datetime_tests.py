@@ -0,0 +1,204 @@
+# coding:utf-8
+
+import unittest
+
+from datetime import datetime, timedelta, timezone
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from zoneinfo import ZoneInfo
+    ZoneInfo('Europe/Paris')
+except Exception:
+    ZoneInfo = None
+
+NOW = datetime(2024, 3, 15, 12, 30, 45, 123456)
+FROM_DATE = datetime(2020, 1, 1)
+TO_DATE = datetime(2030, 1, 1)
+
+
+class TestPinnedNow(unittest.TestCase):
+    def test_factory_now_is_the_reference(self):
+        from data_factory.factory import Factory
+
+        factory = Factory(now=NOW)
+        self.assertEqual(factory.make_datetime(), NOW)
+        self.assertEqual(factory.make_datetime_many(3), [NOW] * 3)
+
+    def test_now_argument_overrides_factory(self):
+        from data_factory.factory import Factory
+
+        other = datetime(2000, 1, 1)
+        self.assertEqual(Factory(now=NOW).make_datetime(now=other), other)
+
+    def test_bounds(self):
+        from data_factory.factory import Factory
+
+        factory = Factory(1, now=NOW)
+        for value in factory.make_datetime_many(1000, FROM_DATE, TO_DATE):
+            self.assertTrue(FROM_DATE <= value <= TO_DATE)
+        self.assertTrue(FROM_DATE <= factory.make_datetime(FROM_DATE, TO_DATE) <= TO_DATE)
+
+    def test_is_reproducible(self):
+        from data_factory.factory import Factory
+
+        self.assertEqual(
+            Factory(7, now=NOW).make_datetime_many(10, FROM_DATE, TO_DATE),
+            Factory(7, now=NOW).make_datetime_many(10, FROM_DATE, TO_DATE))
+
+    def test_rejects_reversed_bounds(self):
+        from data_factory.factory import Factory
+
+        factory = Factory(now=NOW)
+        self.assertRaises(ValueError, factory.make_datetime, TO_DATE)
+        self.assertRaises(ValueError, factory.make_datetime_many, 5, None, FROM_DATE)
+
+    def test_rejects_mixed_naive_and_aware(self):
+        from data_factory.factory import Factory
+
+        factory = Factory(now=NOW)
+        self.assertRaises(TypeError, factory.make_datetime, FROM_DATE.replace(tzinfo=timezone.utc))
+
+
+class TestResolution(unittest.TestCase):
+    def test_seconds(self):
+        from data_factory.factory import Factory
+
+        for value in Factory(now=NOW).make_datetime_many(100, FROM_DATE):
+            self.assertEqual(value.microsecond, NOW.microsecond)
+
+    def test_sub_second(self):
+        from data_factory.factory import Factory
+
+        values = Factory(now=NOW).make_datetime_many(100, NOW - timedelta(seconds=1), resolution='us')
+        self.assertGreater(len(set(v.microsecond for v in values)), 1)
+
+        for value in Factory(now=NOW).make_datetime_many(100, FROM_DATE, resolution='ms'):
+            self.assertEqual(value.microsecond % 1000, NOW.microsecond % 1000)
+
+    def test_wide_ranges_are_uniform(self):
+        from data_factory.factory import Factory
+
+        # 3 * 2 ** 51 steps: scaling random() makes 1 in 8 offsets, not 1 in 6, end in 5 mod 6
+        now = datetime(2300, 1, 1)
+        from_date = now - timedelta(microseconds=3 * 2 ** 51 - 1)
+        values = Factory(1, now=now).make_datetime_many(6000, from_date, resolution='us')
+
+        offsets = [(now - v) // timedelta(microseconds=1) for v in values]
+        self.assertAlmostEqual(sum(o % 6 == 5 for o in offsets) / 6000.0, 1 / 6.0, delta=0.02)
+
+    def test_unknown_resolution(self):
+        from data_factory.factory import make_datetime, make_timestamp_many
+
+        self.assertRaises(ValueError, make_datetime, resolution='ns')
+        self.assertRaises(ValueError, make_timestamp_many, 5, resolution='m')
+
+
+class TestTimezones(unittest.TestCase):
+    def test_fixed_offset(self):
+        from data_factory.factory import Factory
+
+        tz = timezone(timedelta(hours=-3))
+        now = NOW.replace(tzinfo=timezone.utc)
+        values = Factory(now=now).make_datetime_many(100, now - timedelta(days=10), tz=tz)
+
+        for value in values:
+            self.assertIs(value.tzinfo, tz)
+            self.assertTrue(now - timedelta(days=10) <= value <= now)
+
+    @unittest.skipIf(ZoneInfo is None, 'zoneinfo database is not available')
+    def test_daylight_saving_time(self):
+        from data_factory.factory import Factory
+
+        tz = ZoneInfo('Europe/Paris')
+        now = datetime(2024, 4, 1, tzinfo=tz)  # after the march change
+        from_date = datetime(2024, 3, 1, tzinfo=tz)
+
+        for value in Factory(3, now=now).make_datetime_many(500, from_date, tz=tz):
+            self.assertEqual(value.tzinfo, tz)
+            self.assertEqual(value.utcoffset(), tz.utcoffset(value.replace(tzinfo=None)))
+            self.assertTrue(from_date <= value <= now)
+
+    def test_naive_dates_are_local_time(self):
+        from data_factory.factory import Factory
+
+        value = Factory(now=NOW).make_datetime(tz=timezone.utc)
+        self.assertEqual(value, NOW.astimezone(timezone.utc))
+
+
+class TestTimestamps(unittest.TestCase):
+    def test_epoch_of_now(self):
+        from data_factory.factory import Factory
+
+        now = NOW.replace(tzinfo=timezone.utc)
+        factory = Factory(now=now)
+
+        self.assertEqual(factory.make_timestamp(), int(now.timestamp()))
+        self.assertEqual(factory.make_timestamp(resolution='ms'), int(now.timestamp() * 1000))
+        self.assertEqual(
+            factory.make_timestamp(resolution='us'),
+            (now - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1))
+
+    def test_bounds(self):
+        from data_factory.factory import Factory
+
+        values = Factory(now=NOW).make_timestamp_many(1000, FROM_DATE, TO_DATE)
+        self.assertTrue(all(isinstance(v, int) for v in values))
+        self.assertGreaterEqual(min(values), int(FROM_DATE.timestamp()))
+        self.assertLessEqual(max(values), int(TO_DATE.timestamp()))
+
+    def test_default_is_current_time(self):
+        import time
+        from data_factory.factory import make_timestamp
+
+        before = int(time.time())
+        self.assertTrue(before <= make_timestamp() <= time.time())
+
+
+class TestPinnedInSchemas(unittest.TestCase):
+    def test_chunks_share_now(self):
+        from data_factory.schema import Schema, DateTime, Timestamp
+
+        schema = Schema(created=DateTime(), seen=Timestamp(resolution='us'))
+        chunks = list(schema.chunks(30, 10, format='columns'))
+
+        self.assertEqual(len(set(v for c in chunks for v in c['created'])), 1)
+        self.assertEqual(len(set(v for c in chunks for v in c['seen'])), 1)
+
+    def test_parallel_blocks_share_now(self):
+        from data_factory.schema import Schema, DateTime
+        from data_factory.parallel import generate_parallel
+
+        rows = list(generate_parallel(Schema(created=DateTime()), 50, workers=1, block_size=10))
+        self.assertEqual(len(set(rows)), 1)
+
+    def test_pinned_parallel_rows_are_reproducible(self):
+        from data_factory.schema import Schema, DateTime
+        from data_factory.parallel import generate_parallel
+
+        schema = Schema(created=DateTime(FROM_DATE))
+        self.assertEqual(
+            list(generate_parallel(schema, 30, workers=1, seed=1, block_size=7, now=NOW)),
+            list(generate_parallel(schema, 30, workers=2, seed=1, block_size=7, now=NOW)))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumpyDatetimes(unittest.TestCase):
+    def test_datetime64(self):
+        from data_factory import np as dnp
+
+        values = dnp.make_datetime_many(1000, FROM_DATE, TO_DATE, now=NOW, resolution='ms')
+        self.assertEqual(values.dtype, numpy.dtype('datetime64[ms]'))
+        self.assertGreaterEqual(values.min(), numpy.datetime64(FROM_DATE))
+        self.assertLessEqual(values.max(), numpy.datetime64(TO_DATE))
+
+    def test_timestamps(self):
+        from data_factory import np as dnp
+
+        now = NOW.replace(tzinfo=timezone.utc)
+        values = dnp.make_timestamp_many(100, now=now)
+        self.assertEqual(values.dtype, numpy.dtype('int64'))
+        self.assertEqual(set(values.tolist()), {int(now.timestamp())})
@@ -0,0 +1,186 @@
+# coding:utf-8
+
+import unittest
+
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def zipf_frequencies(s, n, ranks):
+    """
+    Returns the probabilities of ``ranks`` for a zipf distribution.
+
+    """
+    total = sum(k ** -s for k in range(1, n + 1))
+    return [k ** -s / total for k in ranks]
+
+
+class TestZipf(unittest.TestCase):
+    def test_table_frequencies(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Zipf
+
+        values = Counter(Factory(1).make_integer_many(100000, distribution=Zipf(1.2, 100)))
+
+        self.assertEqual(min(values), 1)
+        self.assertLessEqual(max(values), 100)
+        for rank, p in zip((1, 2, 10), zipf_frequencies(1.2, 100, (1, 2, 10))):
+            self.assertAlmostEqual(values[rank] / 100000, p, delta=0.01)
+
+    def test_rejection_inversion_frequencies(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Zipf, ZIPF_TABLE_SIZE
+
+        n = ZIPF_TABLE_SIZE + 1
+        zipf = Zipf(1.1, n)
+        self.assertIsNone(zipf._table)
+
+        values = Counter(Factory(2).make_big_integer_many(100000, distribution=zipf))
+
+        self.assertGreaterEqual(min(values), 1)
+        self.assertLessEqual(max(values), n)
+        for rank, p in zip((1, 2, 3), zipf_frequencies(1.1, n, (1, 2, 3))):
+            self.assertAlmostEqual(values[rank] / 100000, p, delta=0.01)
+
+    def test_rejects_bad_parameters(self):
+        from data_factory.distributions import Zipf
+
+        self.assertRaises(ValueError, Zipf, 0, 10)
+        self.assertRaises(ValueError, Zipf, 1.1, 0)
+
+
+class TestContinuous(unittest.TestCase):
+    def test_means(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Exponential, Normal, Pareto
+
+        factory = Factory(3)
+        for distribution, mean in ((Normal(50, 5), 50), (Exponential(0.1), 10), (Pareto(3, 2), 3)):
+            values = factory.make_double_many(20000, distribution=distribution)
+            self.assertAlmostEqual(sum(values) / len(values), mean, delta=mean * 0.05)
+
+    def test_rejects_bad_parameters(self):
+        from data_factory.distributions import Exponential, Normal, Pareto
+
+        self.assertRaises(ValueError, Normal, 0, 0)
+        self.assertRaises(ValueError, Exponential, -1)
+        self.assertRaises(ValueError, Pareto, 0)
+
+
+class TestFactory(unittest.TestCase):
+    def test_integers_are_clamped(self):
+        from data_factory.factory import Factory, MIN_INT, MAX_INT, MAX_BIG_INT
+        from data_factory.distributions import Normal, Pareto
+
+        factory = Factory(4)
+        values = factory.make_integer_many(1000, distribution=Normal(0, 1e12))
+        self.assertEqual(min(values), MIN_INT)
+        self.assertEqual(max(values), MAX_INT)
+        self.assertTrue(all(isinstance(v, int) for v in values))
+
+        self.assertEqual(factory.make_big_integer(distribution=Pareto(1, 1e30)), MAX_BIG_INT)
+        self.assertIsInstance(factory.make_integer(distribution=Normal()), int)
+
+    def test_doubles_are_clamped_and_rounded(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Normal, Zipf
+
+        factory = Factory(5)
+        values = factory.make_double_many(1000, 2, 1, distribution=Normal(0, 1000))
+        self.assertEqual(max(values), 99.9)
+        self.assertEqual(min(values), -99.9)
+        self.assertTrue(all(round(v, 1) == v for v in values))
+
+        self.assertIsInstance(factory.make_real(distribution=Zipf(1, 10)), float)
+
+    def test_clamped_values_keep_their_digits(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Normal
+
+        factory = Factory(5)
+        self.assertEqual(abs(factory.make_double(4, 2, distribution=Normal(0, 1e9))), 9999.99)
+        self.assertEqual(factory.make_double_many(1, 4, 2, distribution=Normal(-1e9, 1)), [-9999.99])
+
+        for value in factory.make_double_many(100, 4, distribution=Normal(0, 1e9)):
+            self.assertLess(abs(value), 10 ** 4)
+        for value in factory.make_real_many(100, 20, 2, distribution=Normal(0, 1e30)):
+            self.assertLess(abs(value), 10 ** 20)
+
+    def test_is_reproducible(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Zipf
+
+        zipf = Zipf(1.1, 10 ** 6)
+        self.assertEqual(
+            Factory(6).make_big_integer_many(100, distribution=zipf),
+            Factory(6).make_big_integer_many(100, distribution=zipf))
+
+    def test_schema_column(self):
+        from data_factory.schema import Schema, Integer
+        from data_factory.distributions import Zipf
+
+        schema = Schema(product=Integer(distribution=Zipf(1.1, 50)))
+        self.assertTrue(all(1 <= v <= 50 for v in schema.columnar(1000)['product']))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumpy(unittest.TestCase):
+    def test_zipf(self):
+        from data_factory import np as dnp
+        from data_factory.distributions import Zipf, ZIPF_TABLE_SIZE
+
+        rng = numpy.random.default_rng(7)
+        for n in (100, ZIPF_TABLE_SIZE + 1):
+            values = dnp.make_big_integer_many(100000, distribution=Zipf(1.1, n), rng=rng)
+            self.assertEqual(values.dtype, numpy.int64)
+            self.assertGreaterEqual(values.min(), 1)
+            self.assertLessEqual(values.max(), n)
+
+            p, = zipf_frequencies(1.1, n, (1,))
+            self.assertAlmostEqual((values == 1).mean(), p, delta=0.01)
+
+    def test_clamps(self):
+        from data_factory import np as dnp
+        from data_factory.factory import MIN_BIG_INT, MAX_BIG_INT
+        from data_factory.distributions import Normal
+
+        values = dnp.make_big_integer_many(1000, distribution=Normal(0, 1e20))
+        self.assertEqual(values.min(), MIN_BIG_INT)
+        self.assertEqual(values.max(), MAX_BIG_INT)
+
+        values = dnp.make_double_many(1000, 2, 1, distribution=Normal(0, 1000))
+        self.assertEqual(values.max(), 99.9)
+        self.assertEqual(values.min(), -99.9)
+        self.assertTrue((numpy.round(values, 1) == values).all())
+
+        for make in (dnp.make_double_many, dnp.make_real_many):
+            for digits, precision in ((4, 2), (4, None), (7, None)):
+                values = make(1000, digits, precision, distribution=Normal(0, 1e30))
+                self.assertLess(numpy.abs(values).max(), 10 ** digits)
+
+    def test_means(self):
+        from data_factory import np as dnp
+        from data_factory.distributions import Exponential, Pareto
+
+        for distribution, mean in ((Exponential(0.1), 10), (Pareto(3, 2), 3)):
+            values = dnp.make_double_many(100000, distribution=distribution)
+            self.assertAlmostEqual(values.mean(), mean, delta=mean * 0.05)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_column(self):
+        from data_factory.arrow import compile_batches
+        from data_factory.schema import Schema, Integer
+        from data_factory.distributions import Zipf
+
+        batch = compile_batches(Schema(product=Integer(distribution=Zipf(1.1, 50))))(1000)
+        self.assertEqual(batch.column(0).type, pyarrow.int32())
+        self.assertLessEqual(max(batch.column(0).to_pylist()), 50)
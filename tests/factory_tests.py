@@ -0,0 +1,84 @@
+# coding:utf-8
+
+import random
+import unittest
+
+
+def make_row(factory):
+    return [
+        factory.make_integer(),
+        factory.make_big_integer_many(3),
+        factory.make_decimal(10),
+        factory.make_string(12),
+        factory.make_email(8, 12),
+        factory.make_ip_address(include_private=False),
+        factory.make_filename(12),
+    ]
+
+
+class TestFactory(unittest.TestCase):
+    def test_same_seed_reproduces_values(self):
+        from data_factory.factory import Factory
+        self.assertEqual(make_row(Factory(seed=42)), make_row(Factory(seed=42)))
+
+    def test_different_seeds_give_different_values(self):
+        from data_factory.factory import Factory
+        self.assertNotEqual(make_row(Factory(seed=1)), make_row(Factory(seed=2)))
+
+    def test_does_not_use_global_random_state(self):
+        from data_factory.factory import Factory
+
+        state = random.getstate()
+        make_row(Factory(seed=42))
+        self.assertEqual(random.getstate(), state)
+
+    def test_streams_are_independent(self):
+        from data_factory.factory import Factory
+
+        a, b = Factory(seed=7), Factory(seed=7)
+        a.make_integer()  # advances a only
+        b.make_integer()
+        self.assertEqual(a.make_slug(20), b.make_slug(20))
+
+    def test_accepts_custom_rng(self):
+        from data_factory.factory import Factory
+
+        factory = Factory(rng=random.SystemRandom())
+        self.assertTrue(isinstance(factory.make_integer(), int))
+        self.assertEqual(len(factory.make_integer_many(10)), 10)
+
+    def test_or_null_uses_factory_rng(self):
+        from data_factory.factory import Factory
+
+        results = []
+        for i in range(2):
+            maybe = Factory(seed=3).or_null(lambda: 1)
+            results.append([maybe() for j in range(20)])
+        self.assertEqual(results[0], results[1])
+
+
+class TestDefaultFactory(unittest.TestCase):
+    def test_module_functions_follow_random_seed(self):
+        from data_factory import factory
+
+        random.seed(42)
+        first = make_row(factory)
+        random.seed(42)
+        self.assertEqual(make_row(factory), first)
+
+    def test_module_functions_are_exported(self):
+        import data_factory
+        self.assertIs(data_factory.make_integer.__self__, data_factory.default_factory)
+
+    def test_module_functions_pickle(self):
+        import pickle
+        import data_factory
+        from data_factory.factory import Factory
+
+        make_email = pickle.loads(pickle.dumps(data_factory.make_email))
+        self.assertIs(make_email.__self__, data_factory.default_factory)
+        self.assertIn('@', make_email(12, 20))
+        self.assertIs(pickle.loads(pickle.dumps(data_factory.default_factory)), data_factory.default_factory)
+
+        factory = pickle.loads(pickle.dumps(Factory(3)))
+        self.assertEqual(factory.make_integer(), Factory(3).make_integer())
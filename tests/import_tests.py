@@ -0,0 +1,67 @@
+# coding:utf-8
+
+import unittest
+
+
+def run_python(code):
+    """
+    Runs ``code`` in a fresh interpreter and returns its output.
+
+    """
+    import os
+    import sys
+    import subprocess
+    import data_factory
+
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.abspath(data_factory.__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [src, env.get('PYTHONPATH')]))
+
+    return subprocess.check_output([sys.executable, '-c', code], env=env).decode('utf-8')
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_is_lazy(self):
+        output = run_python(
+            "import sys, data_factory\n"
+            "print(' '.join(sorted(sys.modules)))")
+        modules = output.split()
+
+        for name in ('data_factory.factory', 'data_factory.parallel', 're', 'decimal',
+                     'datetime', 'mimetypes', 'hashlib', 'concurrent.futures'):
+            self.assertNotIn(name, modules)
+
+    def test_attribute_loads_factory(self):
+        output = run_python(
+            "import sys, data_factory\n"
+            "data_factory.make_integer()\n"
+            "print('concurrent.futures' in sys.modules, 'data_factory.factory' in sys.modules)")
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_public_api(self):
+        import data_factory
+        from data_factory import factory, parallel
+
+        self.assertIs(data_factory.Factory, factory.Factory)
+        self.assertIs(data_factory.generate_parallel, parallel.generate_parallel)
+        self.assertEqual(data_factory.MAX_INT, factory.MAX_INT)
+        self.assertIs(data_factory.schema, __import__('data_factory.schema').schema)
+
+        for name in vars(factory):
+            if name.startswith('make_') or name == 'default_factory':
+                self.assertIn(name, data_factory.__all__)
+                self.assertIn(name, dir(data_factory))
+
+    def test_star_import(self):
+        namespace = dict()
+        exec('from data_factory import *', namespace)
+
+        self.assertIn('make_email', namespace)
+        self.assertIn('generate_parallel', namespace)
+        self.assertIn('Factory', namespace)
+
+    def test_unknown_attribute(self):
+        import data_factory
+
+        self.assertRaises(AttributeError, getattr, data_factory, 'no_such_name')
+        self.assertRaises(AttributeError, getattr, data_factory, '__no_such_name__')
@@ -0,0 +1,156 @@
+# coding:utf-8
+
+import unittest
+import warnings
+
+
+class TestInstrument(unittest.TestCase):
+    def test_counts_calls_and_values(self):
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(1)
+        with instrument(factory) as recorder:
+            factory.make_integer()
+            factory.make_integer_many(100)
+            factory.make_email(12, 20)
+
+        stats = recorder.stats()
+        self.assertEqual(stats['make_integer'].calls, 2)
+        self.assertEqual(stats['make_integer'].values, 101)
+        self.assertGreater(stats['make_integer'].seconds, 0)
+        self.assertEqual(stats['make_email'].values, 1)
+        self.assertNotIn('make_boolean', stats)
+        self.assertIn('make_email', recorder.report())
+
+    def test_keyword_n_and_errors(self):
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(1)
+        with instrument(factory) as recorder:
+            self.assertEqual(len(factory.make_integer_many(n=3)), 3)
+            self.assertRaises(AssertionError, factory.make_hostname_many, 5, 2, ['.com.br'])
+
+        stats = recorder.stats()
+        self.assertEqual(stats['make_integer'].values, 3)
+        self.assertEqual(stats['make_hostname'].calls, 1)
+        self.assertEqual(stats['make_hostname'].values, 0)
+
+    def test_methods_are_restored(self):
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(1)
+        with instrument(factory):
+            self.assertIn('make_integer', vars(factory))
+        self.assertNotIn('make_integer', vars(factory))
+        self.assertEqual(factory.make_integer.__func__, Factory.make_integer)
+
+    def test_values_do_not_change(self):
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(2)
+        with instrument(factory):
+            values = factory.make_slug_many(10, 8)
+        self.assertEqual(values, Factory(2).make_slug_many(10, 8))
+
+    def test_schemas(self):
+        from data_factory.factory import Factory
+        from data_factory.schema import Schema, Integer, Slug
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(3)
+        with instrument(factory) as recorder:
+            Schema(id=Integer(), slug=Slug(10)).tuples(50, factory)
+
+        self.assertEqual(recorder.stats()['make_slug'].values, 50)
+
+    def test_module_functions(self):
+        import data_factory
+        from data_factory import factory
+        from data_factory.instrumentation import instrument, stats
+
+        data_factory.make_boolean  # cached in the package namespace
+        original = factory.make_boolean
+
+        with instrument():
+            factory.make_boolean()
+            data_factory.make_boolean_many(5)
+
+        self.assertEqual(stats()['make_boolean'].values, 6)
+        self.assertIs(factory.make_boolean, original)
+        self.assertIs(data_factory.make_boolean, original)
+
+    def test_names_resolved_in_the_block(self):
+        import data_factory
+        from data_factory import factory
+        from data_factory.instrumentation import instrument
+
+        vars(data_factory).pop('make_email', None)  # not resolved yet
+
+        with instrument() as recorder:
+            data_factory.make_email(12, 20)
+        data_factory.make_email(12, 20)
+
+        self.assertEqual(recorder.stats()['make_email'].calls, 1)
+        self.assertIs(data_factory.make_email, factory.make_email)
+        self.assertEqual(factory.make_email.__func__, factory.Factory.make_email)
+
+    def test_retries(self):
+        from data_factory.factory import Factory
+        from data_factory.distributions import Zipf, ZIPF_TABLE_SIZE
+        from data_factory.uniqueness import unique
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(4)
+        with instrument(factory) as recorder:
+            factory.make_big_integer_many(10000, distribution=Zipf(1.1, 10 * ZIPF_TABLE_SIZE))
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                unique(factory.make_slug, 50).many(50, 1)
+
+        stats = recorder.stats()
+        self.assertGreater(stats['make_big_integer'].retries, 0)
+        self.assertGreater(stats['unique'].retries, 0)
+
+    def test_nested(self):
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument
+
+        factory = Factory(5)
+        with instrument(factory) as outer:
+            with instrument(factory) as inner:
+                factory.make_boolean()
+            factory.make_boolean()
+
+        self.assertEqual(inner.stats()['make_boolean'].calls, 1)
+        self.assertEqual(outer.stats()['make_boolean'].calls, 2)
+        self.assertNotIn('make_boolean', vars(factory))
+
+
+class TestProfiler(unittest.TestCase):
+    def test_sampling_profiler(self):
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument, SamplingProfiler
+
+        factory, profiler = Factory(6), SamplingProfiler(interval=0.0005)
+        with instrument(factory, profiler=profiler):
+            for i in range(20):
+                factory.make_email_many(2000, 12, 20)
+
+        self.assertGreater(profiler.samples, 0)
+        self.assertTrue(any(name.startswith('factory.') for name in profiler.total_samples))
+        self.assertIn('function', profiler.report())
+
+    def test_cprofile(self):
+        import cProfile
+        from data_factory.factory import Factory
+        from data_factory.instrumentation import instrument
+
+        factory, profiler = Factory(7), cProfile.Profile()
+        with instrument(factory, profiler=profiler):
+            factory.make_slug_many(100, 8)
+        self.assertTrue(profiler.getstats())
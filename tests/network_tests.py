@@ -0,0 +1,171 @@
+# coding:utf-8
+
+import unittest
+
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestEmailLocalPartEngine(unittest.TestCase):
+    def make(self, n, length):
+        from data_factory.factory import Factory
+        return Factory(seed=11).make_email_local_part_many(n, length)
+
+    def test_dots_are_never_first_last_or_doubled(self):
+        from data_factory.factory import make_email_local_part
+
+        for value in self.make(20000, 6) + [make_email_local_part(6) for i in range(2000)]:
+            self.assertNotEqual(value[0], '.')
+            self.assertNotEqual(value[-1], '.')
+            self.assertNotIn('..', value)
+
+    def test_dot_frequency_matches_char_by_char_draws(self):
+        from data_factory.factory import EMAIL_LOCAL_DOT_TABLE
+
+        size = len(EMAIL_LOCAL_DOT_TABLE)
+        values = self.make(100000, 4)
+        dots = Counter(i for value in values for i, c in enumerate(value) if c == '.')
+
+        # after a first character that is never a dot
+        self.assertAlmostEqual(dots[1] / (100000.0 / size), 1, delta=0.15)
+        # only if the previous character is not a dot
+        self.assertAlmostEqual(dots[2] / (100000.0 * (size - 1) / size ** 2), 1, delta=0.15)
+
+    def test_first_character_is_uniform(self):
+        from data_factory.factory import EMAIL_LOCAL_TABLE
+
+        counts = Counter(value[0] for value in self.make(82000, 3))
+        self.assertEqual(set(counts), set(EMAIL_LOCAL_TABLE))
+        for count in counts.values():
+            self.assertAlmostEqual(count / 1000.0, 1, delta=0.2)
+
+
+class TestHostnameLabelEngine(unittest.TestCase):
+    def test_hyphens_are_inner_only(self):
+        from data_factory.factory import make_hostname_label_many
+
+        for length in (1, 2, 3, 63):
+            for label in make_hostname_label_many(200, length):
+                self.assertEqual(len(label), length)
+                self.assertFalse(label.startswith('-') or label.endswith('-'))
+
+    def test_inner_hyphens_are_made(self):
+        from data_factory.factory import make_hostname_label_many
+        self.assertTrue(any('-' in label for label in make_hostname_label_many(200, 10)))
+
+
+class TestDomains(unittest.TestCase):
+    def test_suffixes_are_cached(self):
+        from data_factory.catalogs import get_suffixes
+
+        self.assertEqual(get_suffixes(['.com', '.com.br']), (('.com', '.com.br'), 7))
+        self.assertIs(get_suffixes(['.io']), get_suffixes(('.io',)))
+
+    def test_url_many_obeys_lengths(self):
+        from data_factory.factory import make_url_many
+
+        for url in make_url_many(100, 30, port_number=8080, domains=['.com.br', '.io']):
+            self.assertLessEqual(len(url), 30)
+            self.assertTrue(url.startswith('http://'))
+            self.assertTrue(url.endswith(':8080'))
+
+
+class TestAddressSpace(unittest.TestCase):
+    def special_networks(self, v):
+        import ipaddress
+        from data_factory.catalogs import IPV4_SPECIAL_NETWORKS, IPV6_SPECIAL_NETWORKS
+
+        networks = IPV4_SPECIAL_NETWORKS if v == 4 else IPV6_SPECIAL_NETWORKS
+        return [ipaddress.ip_network(n) for n in networks]
+
+    def test_non_private_ipv4_avoids_special_networks(self):
+        from data_factory.factory import Factory
+
+        special = self.special_networks(4)
+        for address in Factory(seed=1).make_ip_address_object_many(5000, include_private=False):
+            self.assertFalse(any(address in network for network in special), address)
+
+    def test_non_private_ipv6_is_global_unicast(self):
+        import ipaddress
+        from data_factory.factory import Factory
+
+        special = self.special_networks(6)
+        for address in Factory(seed=1).make_ip_address_object_many(5000, False, 6):
+            self.assertIn(address, ipaddress.ip_network('2000::/3'))
+            self.assertFalse(any(address in network for network in special), address)
+
+    def test_networks_are_sampled_uniformly(self):
+        from data_factory.factory import Factory
+
+        networks = ['10.0.0.0/31', '192.168.1.0/30', '10.0.0.1/32']
+        counts = Counter(Factory(seed=2).make_ip_address_str_many(60000, networks=networks))
+
+        self.assertEqual(set(counts), {
+            '10.0.0.0', '10.0.0.1', '192.168.1.0', '192.168.1.1', '192.168.1.2', '192.168.1.3'})
+        for count in counts.values():
+            self.assertAlmostEqual(count / 10000.0, 1, delta=0.1)
+
+    def test_networks_without_private_addresses(self):
+        from data_factory.factory import make_ip_address_str_many
+
+        values = set(make_ip_address_str_many(200, False, 4, ['10.0.0.0/8', '8.8.8.8/32']))
+        self.assertEqual(values, {'8.8.8.8'})
+        self.assertRaises(ValueError, make_ip_address_str_many, 5, False, 4, ['10.0.0.0/8'])
+
+    def test_rejects_bad_arguments(self):
+        from data_factory.factory import make_ip_address, make_ip_address_many
+
+        self.assertRaises(ValueError, make_ip_address, v=5)
+        self.assertRaises(ValueError, make_ip_address_many, 5, True, 6, ['10.0.0.0/8'])
+
+    def test_formats_agree_with_ipaddress(self):
+        import ipaddress
+        from data_factory.factory import Factory
+
+        for v in (4, 6):
+            for n in (1, 100):
+                numbers = Factory(seed=v).make_ip_address_int_many(n, v=v)
+                objects = [ipaddress.ip_address(number) for number in numbers]
+                factory = Factory(seed=v)
+
+                self.assertEqual(factory.make_ip_address_str_many(n, v=v), [str(o) for o in objects])
+                factory = Factory(seed=v)
+                self.assertEqual(factory.make_ip_address_packed_many(n, v=v), [o.packed for o in objects])
+                factory = Factory(seed=v)
+                self.assertEqual(factory.make_ip_address_object_many(n, v=v), objects)
+
+    def test_single_values(self):
+        import ipaddress
+        from data_factory.factory import Factory
+
+        for v in (4, 6):
+            number = Factory(seed=v).make_ip_address_int(v=v)
+            address = ipaddress.ip_address(number)
+
+            self.assertEqual(Factory(seed=v).make_ip_address_str(True, v), str(address))
+            self.assertEqual(Factory(seed=v).make_ip_address_packed(v=v), address.packed)
+            self.assertEqual(Factory(seed=v).make_ip_address_object(v=v), address)
+            self.assertEqual(
+                Factory(seed=v).make_ip_address(v=v),
+                Factory(seed=v).make_ip_address_many(1, v=v)[0])
+
+    def test_str_takes_positional_arguments(self):
+        from data_factory.factory import make_ip_address_str
+
+        self.assertEqual(make_ip_address_str(True, 4).count('.'), 3)
+        self.assertIn(':', make_ip_address_str(False, 6))
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumpyAddresses(unittest.TestCase):
+    def test_uint32_addresses(self):
+        from data_factory import np as dnp
+
+        values = dnp.make_ip_address_int_many(1000, networks=['10.0.0.0/31', '1.2.3.4/32'])
+        self.assertEqual(values.dtype, numpy.dtype('uint32'))
+        self.assertEqual(set(values.tolist()), {0x0A000000, 0x0A000001, 0x01020304})
+        self.assertRaises(ValueError, dnp.make_ip_address_int_many, 10, v=6)
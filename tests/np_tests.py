@@ -0,0 +1,145 @@
+# coding:utf-8
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class NumpyBatchMixin(object):
+    n = 1000
+    dtype = None
+
+    def make(self, n):
+        raise NotImplemented()
+
+    def test_makes_array_with_dtype(self):
+        result = self.make(self.n)
+        self.assertTrue(isinstance(result, numpy.ndarray))
+        self.assertEqual(result.dtype, numpy.dtype(self.dtype))
+        self.assertEqual(result.shape, (self.n,))
+
+
+class NumpyIntegerMixin(NumpyBatchMixin):
+    def get_bounds(self):
+        raise NotImplemented()
+
+    def test_bounds(self):
+        lower, upper = self.get_bounds()
+        result = self.make(self.n)
+        self.assertGreaterEqual(int(result.min()), lower)
+        self.assertLessEqual(int(result.max()), upper)
+
+
+class TestMakeTinyIntegerArray(unittest.TestCase, NumpyIntegerMixin):
+    dtype = 'int8'
+
+    def make(self, n):
+        from data_factory.np import make_tiny_integer_many
+        return make_tiny_integer_many(n)
+
+    def get_bounds(self):
+        from data_factory.factory import MIN_TINY_INT, MAX_TINY_INT
+        return MIN_TINY_INT, MAX_TINY_INT
+
+
+class TestMakeIntegerArray(unittest.TestCase, NumpyIntegerMixin):
+    dtype = 'int32'
+
+    def make(self, n):
+        from data_factory.np import make_integer_many
+        return make_integer_many(n)
+
+    def get_bounds(self):
+        from data_factory.factory import MIN_INT, MAX_INT
+        return MIN_INT, MAX_INT
+
+
+class TestMakeBigIntegerArray(unittest.TestCase, NumpyIntegerMixin):
+    dtype = 'int64'
+
+    def make(self, n):
+        from data_factory.np import make_big_integer_many
+        return make_big_integer_many(n)
+
+    def get_bounds(self):
+        from data_factory.factory import MIN_BIG_INT, MAX_BIG_INT
+        return MIN_BIG_INT, MAX_BIG_INT
+
+
+class TestMakeUnsignedSmallIntegerArray(unittest.TestCase, NumpyIntegerMixin):
+    dtype = 'uint16'
+
+    def make(self, n):
+        from data_factory.np import make_unsigned_small_integer_many
+        return make_unsigned_small_integer_many(n)
+
+    def get_bounds(self):
+        from data_factory.factory import MAX_SMALL_INT, unsigned
+        return 0, unsigned(MAX_SMALL_INT)
+
+
+class TestMakeUnsignedBigIntegerArray(unittest.TestCase, NumpyIntegerMixin):
+    dtype = 'uint64'
+
+    def make(self, n):
+        from data_factory.np import make_unsigned_big_integer_many
+        return make_unsigned_big_integer_many(n)
+
+    def get_bounds(self):
+        from data_factory.factory import MAX_BIG_INT, unsigned
+        return 0, unsigned(MAX_BIG_INT)
+
+
+class TestMakeRealArray(unittest.TestCase, NumpyBatchMixin):
+    dtype = 'float32'
+
+    def make(self, n, digits=None, precision=None):
+        from data_factory.np import make_real_many
+        return make_real_many(n, digits, precision)
+
+    def test_obeys_digits(self):
+        result = self.make(self.n, 3)
+        self.assertTrue((abs(result) < 1000).all())
+
+
+class TestMakeDoubleArray(unittest.TestCase, NumpyBatchMixin):
+    dtype = 'float64'
+
+    def make(self, n, digits=None, precision=None):
+        from data_factory.np import make_double_many
+        return make_double_many(n, digits, precision)
+
+    def test_obeys_precision(self):
+        result = abs(self.make(self.n, 4, 2)) * 100
+        self.assertTrue(numpy.allclose(result, numpy.round(result)))
+
+
+class TestMakeMoneyCentsArray(unittest.TestCase, NumpyIntegerMixin):
+    dtype = 'int64'
+
+    def make(self, n):
+        from data_factory.np import make_money_cents_many
+        return make_money_cents_many(n, 6, 2, True)
+
+    def get_bounds(self):
+        return -999999, 999999
+
+    def test_too_many_digits(self):
+        from data_factory.np import make_money_cents_many
+        self.assertRaises(ValueError, make_money_cents_many, 10, 19)
+
+
+class TestMakeBooleanArray(unittest.TestCase, NumpyBatchMixin):
+    dtype = 'bool'
+
+    def make(self, n):
+        from data_factory.np import make_boolean_many
+        return make_boolean_many(n)
+
+    def test_makes_true_and_false(self):
+        result = self.make(self.n)
+        self.assertTrue(result.any() and not result.all())
@@ -0,0 +1,43 @@
+# coding:utf-8
+
+import unittest
+
+
+def make_row(factory):
+    return (factory.make_big_integer(), factory.make_slug(10), factory.make_double())
+
+
+class TestGenerateParallel(unittest.TestCase):
+    def make(self, rows=250, workers=1, seed=42, block_size=64):
+        from data_factory.parallel import generate_parallel
+        return list(generate_parallel(make_row, rows, workers=workers, seed=seed, block_size=block_size))
+
+    def test_makes_requested_rows(self):
+        self.assertEqual(len(self.make(rows=250)), 250)
+        self.assertEqual(self.make(rows=0), [])
+
+    def test_same_seed_same_rows(self):
+        self.assertEqual(self.make(), self.make())
+
+    def test_different_seed_different_rows(self):
+        self.assertNotEqual(self.make(seed=1), self.make(seed=2))
+
+    def test_rows_do_not_depend_on_workers(self):
+        expected = self.make(workers=1)
+        self.assertEqual(self.make(workers=2), expected)
+        self.assertEqual(self.make(workers=3), expected)
+
+    def test_blocks_have_independent_streams(self):
+        rows = self.make(rows=128, block_size=64)
+        self.assertNotEqual(rows[:64], rows[64:])
+
+
+class TestDeriveSeed(unittest.TestCase):
+    def test_is_deterministic(self):
+        from data_factory.parallel import derive_seed
+        self.assertEqual(derive_seed(1, 2), derive_seed(1, 2))
+
+    def test_sub_seeds_differ(self):
+        from data_factory.parallel import derive_seed
+        seeds = set(derive_seed(s, i) for s in range(10) for i in range(10))
+        self.assertEqual(len(seeds), 100)
@@ -0,0 +1,93 @@
+# coding:utf-8
+
+import unittest
+
+
+def make_schema():
+    from data_factory.schema import Schema, BigInteger, Email, DateTime, Choice, Slug
+
+    return Schema(
+        id=BigInteger(),
+        email=Email(10, 20),
+        created=DateTime(),
+        status=Choice(('new', 'active', 'closed')),
+        slug=Slug(12, null=0.5),
+    )
+
+
+class TestSchema(unittest.TestCase):
+    def setUp(self):
+        self.schema = make_schema()
+
+    def test_names_keep_column_order(self):
+        self.assertEqual(self.schema.names, ['id', 'email', 'created', 'status', 'slug'])
+
+    def test_makes_tuples(self):
+        rows = self.schema.tuples(20)
+        self.assertEqual(len(rows), 20)
+
+        for row in rows:
+            self.assertEqual(len(row), 5)
+            self.assertIn('@', row[1])
+            self.assertIn(row[3], ('new', 'active', 'closed'))
+
+    def test_makes_dicts(self):
+        rows = self.schema.dicts(5)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(sorted(rows[0]), sorted(self.schema.names))
+
+    def test_makes_columns(self):
+        columns = self.schema.columnar(7)
+        self.assertEqual(sorted(columns), sorted(self.schema.names))
+
+        for values in columns.values():
+            self.assertEqual(len(values), 7)
+
+    def test_null_frequency(self):
+        slugs = self.schema.columnar(200)['slug']
+        # may give false negative, but very unlikely
+        self.assertIn(None, slugs)
+        self.assertTrue(any(slugs))
+
+    def test_chunks(self):
+        chunks = list(self.schema.chunks(25, chunk_size=10))
+        self.assertEqual([len(c) for c in chunks], [10, 10, 5])
+
+        chunks = list(self.schema.chunks(25, chunk_size=10, format='columns'))
+        self.assertEqual([len(c['id']) for c in chunks], [10, 10, 5])
+
+        chunks = list(self.schema.chunks(5, format='dicts'))
+        self.assertEqual(chunks[0][0]['id'], chunks[0][0].get('id'))
+
+    def test_is_reproducible_with_seeded_factory(self):
+        from data_factory.factory import Factory
+
+        a = self.schema.columnar(10, Factory(seed=3))
+        b = self.schema.columnar(10, Factory(seed=3))
+        del a['created'], b['created']  # relative to now
+        self.assertEqual(a, b)
+
+    def test_validates_arguments_on_compile(self):
+        from data_factory.schema import Schema, Hostname
+        schema = Schema(host=Hostname(2, domains=['.com.br']))
+        self.assertRaises(AssertionError, schema.compile)
+
+    def test_rejects_non_columns(self):
+        from data_factory.schema import Schema
+        self.assertRaises(TypeError, Schema, id=int)
+
+    def test_schema_as_parallel_spec(self):
+        from data_factory.parallel import generate_parallel
+        from data_factory.schema import Schema, Integer, Slug
+
+        schema = Schema(id=Integer(), slug=Slug(8))
+        rows = list(generate_parallel(schema, 30, workers=1, seed=1, block_size=8))
+        self.assertEqual(rows, list(generate_parallel(schema, 30, workers=2, seed=1, block_size=8)))
+        self.assertEqual(len(rows), 30)
+
+    def test_call_makes_a_row(self):
+        from data_factory.factory import Factory
+
+        row = self.schema(Factory(seed=0))
+        self.assertTrue(isinstance(row, tuple))
+        self.assertEqual(len(row), 5)
@@ -0,0 +1,120 @@
+# coding:utf-8
+
+import io
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+
+def make_rows(n=500, nul=None):
+    from data_factory.factory import make_ascii_string_many, make_string_many, make_filename_many
+    from data_factory.sinks import CSV_NUL
+
+    rows = list(zip(
+        make_ascii_string_many(n, 20, True),
+        make_string_many(n, 20, True),
+        make_filename_many(n, 16),
+    ))
+    if CSV_NUL if nul is None else nul:
+        return rows
+    return [tuple(v.replace('\0', '') for v in row) for row in rows]
+
+
+class TestChunked(unittest.TestCase):
+    def test_splits_rows(self):
+        from data_factory.sinks import chunked
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 2)), [])
+
+    def test_consumes_generators_lazily(self):
+        from data_factory.sinks import chunked
+
+        consumed = []
+
+        def rows():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        next(chunked(rows(), 3))
+        self.assertEqual(consumed, [0, 1, 2])
+
+
+class TestWriteCSV(unittest.TestCase):
+    dialect = 'excel'
+
+    def write(self, rows, target, **kw):
+        from data_factory.sinks import write_csv
+        kw.setdefault('dialect', self.dialect)
+        return write_csv(rows, target, **kw)
+
+    def read(self, data):
+        return [tuple(row) for row in csv.reader(io.StringIO(data, newline=''), dialect=self.dialect)]
+
+    def test_round_trips_generated_strings(self):
+        rows = make_rows()
+        target = io.BytesIO()
+        self.write(iter(rows), target, chunk_size=64)
+        self.assertEqual(self.read(target.getvalue().decode('utf-8')), rows)
+
+    @unittest.skipIf(sys.version_info < (3, 11), 'csv.reader fails on NUL before Python 3.11')
+    def test_round_trips_nul(self):
+        rows = [('a\0b', '\0')] + make_rows(100, nul=True)
+        target = io.BytesIO()
+        self.write(rows, target)
+        self.assertEqual(self.read(target.getvalue().decode('utf-8')), rows)
+
+    @unittest.skipIf(sys.version_info >= (3, 11), 'csv.reader reads NUL from Python 3.11')
+    def test_rejects_nul(self):
+        self.assertRaises(ValueError, self.write, [('a\0b',)], io.BytesIO())
+
+    def test_writes_to_text_file_object(self):
+        rows = make_rows(50)
+        target = io.StringIO(newline='')
+        self.write(rows, target)
+        self.assertEqual(self.read(target.getvalue()), rows)
+
+    def test_writes_to_path(self):
+        rows = make_rows(50)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        try:
+            stats = self.write(rows, path, header=('a', 'b', 'c'))
+            with open(path, 'rb') as f:
+                data = f.read()
+        finally:
+            os.remove(path)
+
+        self.assertEqual(stats.bytes, len(data))
+        self.assertEqual(self.read(data.decode('utf-8')), [('a', 'b', 'c')] + rows)
+
+    def test_reports_stats(self):
+        reports = []
+        stats = self.write(make_rows(100), io.BytesIO(), chunk_size=30, progress=reports.append)
+
+        self.assertEqual(stats.rows, 100)
+        self.assertEqual(stats.chunks, 4)
+        self.assertEqual(len(reports), 4)
+        self.assertGreater(stats.bytes, 0)
+        self.assertGreaterEqual(stats.rows_per_second, 0)
+
+    def test_writes_none_as_empty_field(self):
+        target = io.BytesIO()
+        self.write([(1, None, 'x')], target)
+        self.assertEqual(self.read(target.getvalue().decode('utf-8')), [('1', '', 'x')])
+
+    def test_writes_header_without_rows(self):
+        target = io.BytesIO()
+        self.write([], target, header=('a', 'b'))
+        self.assertEqual(self.read(target.getvalue().decode('utf-8')), [('a', 'b')])
+
+
+class TestWriteTSV(TestWriteCSV):
+    dialect = 'excel-tab'
+
+    def write(self, rows, target, **kw):
+        from data_factory.sinks import write_tsv
+        return write_tsv(rows, target, **kw)
@@ -0,0 +1,129 @@
+# coding:utf-8
+
+import sqlite3
+import unittest
+
+from datetime import datetime
+from decimal import Decimal
+
+
+class TestSQLLiteral(unittest.TestCase):
+    def test_literals(self):
+        from data_factory.sql import sql_literal
+
+        self.assertEqual(sql_literal(None), 'NULL')
+        self.assertEqual(sql_literal(True), 'TRUE')
+        self.assertEqual(sql_literal(12), '12')
+        self.assertEqual(sql_literal(Decimal('-1.50')), '-1.50')
+        self.assertEqual(sql_literal("it's"), "'it''s'")
+        self.assertEqual(sql_literal(datetime(2020, 1, 2, 3, 4, 5)), "'2020-01-02 03:04:05'")
+
+    def test_bytes(self):
+        from data_factory.sql import sql_literal
+
+        self.assertEqual(sql_literal(b'2\xea\x05Z'), "X'32ea055a'")
+        self.assertEqual(sql_literal(b'2\xea\x05Z', 'postgresql'), "'\\x32ea055a'::bytea")
+
+        connection = sqlite3.connect(':memory:')
+        self.assertEqual(connection.execute('SELECT %s' % sql_literal(b'\x00\xff')).fetchone(), (b'\x00\xff',))
+
+    def test_non_finite_floats(self):
+        from data_factory.sql import sql_literal
+
+        self.assertEqual(sql_literal(float('nan'), 'postgresql'), "'NaN'")
+        self.assertEqual(sql_literal(float('-inf'), 'postgresql'), "'-Infinity'")
+        self.assertEqual(sql_literal(Decimal('Infinity'), 'postgresql'), "'Infinity'")
+        self.assertEqual(sql_literal(1.5, 'postgresql'), '1.5')
+        self.assertRaises(ValueError, sql_literal, float('inf'))
+        self.assertRaises(ValueError, sql_literal, Decimal('NaN'))
+
+
+class TestInsertStatements(unittest.TestCase):
+    def test_batches_rows(self):
+        from data_factory.sql import insert_statements
+
+        statements = list(insert_statements('t', ['a', 'b'], [(1, 'x')] * 5, batch_size=2))
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(statements[-1], 'INSERT INTO "t" ("a", "b") VALUES\n(1, \'x\');\n')
+
+    def test_statements_round_trip_through_sqlite(self):
+        from data_factory.factory import make_string_many, make_integer_many
+        from data_factory.sql import insert_statements
+
+        rows = list(zip(make_integer_many(100), make_string_many(100, 20)))
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE t (a INTEGER, b TEXT)')
+
+        for statement in insert_statements('t', ['a', 'b'], rows, batch_size=30):
+            connection.execute(statement)
+        self.assertEqual(connection.execute('SELECT a, b FROM t ORDER BY rowid').fetchall(), rows)
+
+
+class TestCopyChunks(unittest.TestCase):
+    def test_escapes_values(self):
+        from data_factory.sql import copy_chunks
+
+        rows = [(1, None, 'a\tb\nc\\d', True)]
+        self.assertEqual(list(copy_chunks(rows)), ['1\t\\N\ta\\tb\\nc\\\\d\tt\n'])
+
+    def test_bytes_and_non_finite_floats(self):
+        from data_factory.sql import copy_chunks
+
+        rows = [(b'2\xea\x05Z', float('nan'), float('inf'), -1.5)]
+        self.assertEqual(list(copy_chunks(rows)), ['\\\\x32ea055a\tNaN\tInfinity\t-1.5\n'])
+
+    def test_chunks_rows(self):
+        from data_factory.sql import copy_chunks
+
+        chunks = list(copy_chunks([(i,) for i in range(5)], chunk_size=2))
+        self.assertEqual(chunks, ['0\n1\n', '2\n3\n', '4\n'])
+
+
+class TestLoadSQLite(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.execute('CREATE TABLE t (id INTEGER, price TEXT, created TEXT, email TEXT)')
+
+    def make_rows(self, n):
+        from data_factory.schema import Schema, BigInteger, Decimal, DateTime, Email
+
+        schema = Schema(id=BigInteger(), price=Decimal(8, 3, 2), created=DateTime(), email=Email(6, 12, null=0.2))
+        return schema.tuples(n)
+
+    def test_loads_rows(self):
+        from data_factory.sql import load_sqlite
+
+        rows = self.make_rows(250)
+        reports = []
+        stats = load_sqlite(self.connection, 't', rows, batch_size=100, progress=reports.append)
+
+        self.assertEqual(stats.rows, 250)
+        self.assertEqual(len(reports), 3)
+
+        loaded = self.connection.execute('SELECT * FROM t ORDER BY rowid').fetchall()
+        self.assertEqual(len(loaded), 250)
+        self.assertEqual(loaded[0][0], rows[0][0])
+        self.assertEqual(Decimal(loaded[0][1]), rows[0][1])
+        self.assertEqual(loaded[0][2], rows[0][2].isoformat(' '))
+        self.assertEqual([r[3] for r in loaded], [r[3] for r in rows])
+
+    def test_commits_every_transaction(self):
+        from data_factory.sql import load_sqlite
+
+        commits = []
+
+        class Connection(sqlite3.Connection):
+            def commit(self):
+                commits.append(1)
+                super(Connection, self).commit()
+
+        connection = sqlite3.connect(':memory:', factory=Connection)
+        connection.execute('CREATE TABLE t (id INTEGER)')
+        load_sqlite(connection, 't', [(i,) for i in range(100)], batch_size=10, transaction_size=30)
+        self.assertEqual(len(commits), 4)  # 3 full transactions and the last one
+
+    def test_loads_selected_columns(self):
+        from data_factory.sql import load_sqlite
+
+        load_sqlite(self.connection, 't', [(1, 'a@b.com')], columns=['id', 'email'])
+        self.assertEqual(self.connection.execute('SELECT * FROM t').fetchall(), [(1, None, None, 'a@b.com')])
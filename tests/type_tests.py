@@ -5,14 +5,6 @@ import string
 import unittest
 
 
-integer_types = (int,)
-
-if sys.version_info < (3, 0):
-    integer_types += (long,)
-else:
-    basestring = unicode = str
-
-
 class HasMake(object):
     def make(self):
         raise NotImplemented()
@@ -21,7 +13,7 @@ class HasMake(object):
 class IsIntegerMixin(HasMake):
     def test_makes_integer(self):
         result = self.make()
-        self.assertIn(type(result), integer_types)
+        self.assertIs(type(result), int)
 
 
 class IsFloatMixin(HasMake):
@@ -33,7 +25,7 @@ class IsFloatMixin(HasMake):
 class IsStringMixin(HasMake):
     def test_makes_string(self):
         result = self.make()
-        self.assertTrue(isinstance(result, basestring))
+        self.assertTrue(isinstance(result, str))
 
 
 class HasDefaultStringInterfaceMixin(IsStringMixin):
@@ -95,20 +87,6 @@ class UnsignedIntegerMixin(IntegerIsInBoundsMixin):
         return super(UnsignedIntegerMixin, self).get_upper_bound() * 2 + 1
 
 
-class TestPy2Py3Hacks(unittest.TestCase):
-    def test_unichr_exists(self):
-        from data_factory import factory
-        assert hasattr(factory, 'unichr'), 'unichr not available'
-
-    def test_basestring_exists(self):
-        from data_factory import factory
-        assert hasattr(factory, 'basestring'), 'basestring not available'
-
-    def test_unicode_exists(self):
-        from data_factory import factory
-        assert hasattr(factory, 'unicode'), 'unicode not available'
-
-
 class TestOrNull(unittest.TestCase):
     def setUp(self):
         from data_factory.factory import or_null
@@ -314,6 +292,54 @@ class TestMakeDecimal(unittest.TestCase, HasMake):
         self.assertEqual(len(split[1]), precision)
 
 
+class TestMakeNumbersExactly(unittest.TestCase):
+    def test_decimal_keeps_every_digit(self):
+        from data_factory.factory import make_decimal
+
+        for i in range(20):
+            result = make_decimal(45, 35, 8).copy_abs()
+            integer, fraction = str(result).split('.')
+            self.assertEqual(len(fraction), 8)
+            self.assertLessEqual(len(integer), 35)
+
+    def test_float_has_given_precision(self):
+        from data_factory.factory import make_double, make_real
+
+        for i in range(20):
+            result = make_double(6, 2)
+            self.assertEqual(result, round(result, 2))
+            self.assertLess(abs(make_real(3)), 1000)
+
+
+class TestMakeMoney(unittest.TestCase, HasMake):
+    def make(self, *args):
+        from data_factory.factory import make_money
+        return make_money(*args)
+
+    def test_makes_decimal_with_scale(self):
+        from decimal import Decimal
+
+        for i in range(20):
+            result = self.make()
+            self.assertTrue(isinstance(result, Decimal))
+            self.assertEqual(result.as_tuple().exponent, -2)
+            self.assertTrue(0 <= result < 10 ** 10)
+
+    def test_max_digits_and_negative(self):
+        results = [self.make(4, 3, True) for i in range(200)]
+
+        self.assertTrue(all(-10 < r < 10 for r in results))
+        self.assertTrue(all(r.as_tuple().exponent == -3 for r in results))
+        self.assertTrue(any(r < 0 for r in results))  # may fail, very unlikely
+
+    def test_cents(self):
+        from data_factory.factory import Factory
+
+        cents = Factory(1).make_money_cents(8, 2)
+        self.assertIs(type(cents), int)
+        self.assertEqual(Factory(1).make_money(8, 2) * 100, cents)
+
+
 class TestMakeBoolean(unittest.TestCase, HasMake):
     def make(self):
         from data_factory.factory import make_boolean
@@ -0,0 +1,62 @@
+# coding:utf-8
+
+import sys
+import unittest
+
+from collections import Counter
+
+
+class TestCodePoints(unittest.TestCase):
+    def test_never_makes_surrogates(self):
+        from data_factory.factory import make_unicode_many
+
+        for value in make_unicode_many(50, 200, blocks='bmp'):
+            value.encode('utf-8')  # raises on lone surrogates
+
+    def test_default_covers_all_planes(self):
+        from data_factory.factory import make_unicode
+
+        result = make_unicode(2000)
+        self.assertTrue(any(ord(c) > 0xFFFF for c in result))
+        self.assertTrue(all(0 <= ord(c) <= sys.maxunicode for c in result))
+        result.encode('utf-8')
+
+    def test_blocks(self):
+        from data_factory.factory import make_unicode, UNICODE_BLOCKS
+
+        for name in ('cjk', 'emoji', 'greek', 'kana'):
+            ranges = UNICODE_BLOCKS[name]
+            for c in make_unicode(100, blocks=name):
+                self.assertTrue(any(start <= ord(c) <= end for start, end in ranges))
+
+    def test_custom_ranges(self):
+        from data_factory.factory import make_unicode
+
+        result = make_unicode(100, blocks=[(0x41, 0x43), 'greek'])
+        for c in result:
+            self.assertTrue(c in 'ABC' or 0x370 <= ord(c) <= 0x3FF)
+
+        self.assertTrue(set(make_unicode(50, blocks=(0x61, 0x61))) <= set('a'))
+
+    def test_ranges_are_merged_and_uniform(self):
+        from data_factory.factory import Factory, get_code_points
+
+        code_points = get_code_points([(0xD7FE, 0xE001), (0x41, 0x42), (0x42, 0x43)])
+        self.assertEqual(code_points.ranges, [(0x41, 0x43), (0xD7FE, 0xD7FF), (0xE000, 0xE001)])
+        self.assertEqual(code_points.size, 7)
+
+        factory = Factory(seed=4)
+        counts = Counter(code_points.draw(factory.random.getrandbits, 70000))
+        self.assertEqual(len(counts), 7)
+        for count in counts.values():
+            self.assertAlmostEqual(count / 10000.0, 1, delta=0.1)
+
+    def test_invalid_blocks(self):
+        from data_factory.factory import make_unicode
+
+        self.assertRaises(ValueError, make_unicode, 10, blocks='klingon')
+        self.assertRaises(ValueError, make_unicode, 10, blocks=(0xD800, 0xDFFF))
+
+    def test_code_points_are_cached(self):
+        from data_factory.factory import get_code_points
+        self.assertIs(get_code_points('cjk'), get_code_points(['cjk']))
@@ -0,0 +1,227 @@
+# coding:utf-8
+
+import unittest
+import warnings
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestFingerprintFilter(unittest.TestCase):
+    def test_no_false_negatives(self):
+        from data_factory.uniqueness import FingerprintFilter
+
+        bloom = FingerprintFilter(1000)
+        self.assertTrue(all(bloom.add(i) for i in range(1000)))
+        self.assertFalse(any(bloom.add(i) for i in range(1000)))
+        self.assertTrue(all(i in bloom for i in range(1000)))
+        self.assertEqual(len(bloom), 1000)
+
+    def test_fingerprint_size(self):
+        from data_factory.uniqueness import FingerprintFilter
+
+        self.assertEqual(FingerprintFilter(10, 1e-3).bits, 16)
+        self.assertEqual(FingerprintFilter(10, 1e-6).bits, 32)
+        self.assertEqual(FingerprintFilter(10, 1e-12).bits, 64)
+        self.assertLess(FingerprintFilter(10 ** 4, 1e-3).nbytes, 3 * 10 ** 4)
+
+    def test_false_positive_rate(self):
+        from data_factory.uniqueness import FingerprintFilter
+
+        bloom = FingerprintFilter(20000, 1e-3)
+        for i in range(20000):
+            bloom.add(i)
+
+        false_positives = sum(1 for i in range(20000, 120000) if i in bloom)
+        self.assertLess(false_positives / 100000.0, 2 * bloom.fp_rate + 1e-4)
+
+    def test_full(self):
+        from data_factory.uniqueness import FingerprintFilter
+
+        bloom = FingerprintFilter(2)
+        bloom.add('a')
+        bloom.add('b')
+        self.assertFalse(bloom.add('a'))
+        self.assertRaises(ValueError, bloom.add, 'c')
+        self.assertRaises(ValueError, FingerprintFilter, 10, 0)
+
+
+class TestUnique(unittest.TestCase):
+    def test_exact_values_are_unique(self):
+        from data_factory.factory import Factory
+        from data_factory.uniqueness import unique
+
+        slug = unique(Factory(1).make_slug, 1000)
+        values = [slug(3) for i in range(1000)] + slug.many(1000, 3)
+
+        self.assertTrue(slug.exact)
+        self.assertEqual(len(set(values)), 2000)
+        self.assertEqual(slug.stats.values, 2000)
+        self.assertEqual(slug.stats.draws, slug.stats.values + slug.stats.collisions)
+
+    def test_filter_values_are_unique(self):
+        from data_factory.factory import Factory
+        from data_factory.uniqueness import unique
+
+        email = unique(Factory(1).make_email, 20000, exact_threshold=10)
+        values = email.many(10000, 1, 6) + [email(1, 6) for i in range(5000)]
+
+        self.assertFalse(email.exact)
+        self.assertEqual(len(set(values)), 15000)
+        self.assertGreater(email.stats.retries, 0)
+        self.assertEqual(email.stats.bytes, email.nbytes)
+
+    def test_is_reproducible(self):
+        from data_factory.factory import Factory
+        from data_factory.uniqueness import unique
+
+        self.assertEqual(
+            unique(Factory(3).make_hostname_label, 100).many(100, 2),
+            unique(Factory(3).make_hostname_label, 100).many(100, 2))
+
+    def test_plain_callable(self):
+        import random
+        from data_factory.uniqueness import unique
+
+        rng = random.Random(1)
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            number = unique(lambda: rng.randint(0, 99), 100, space=100, max_retries=10000)
+            values = number.many(100)
+            self.assertRaises(ValueError, number)
+
+        self.assertIsNone(number.many_generator)
+        self.assertEqual(sorted(values), list(range(100)))
+        self.assertGreater(number.stats.collisions, 0)
+
+    def test_grows_over_expected_n(self):
+        from data_factory.factory import Factory
+        from data_factory.uniqueness import unique
+
+        label = unique(Factory(2).make_hostname_label, 1000, exact_threshold=10)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            values = label.many(3000, 8)
+
+        self.assertEqual(len(set(values)), 3000)
+        self.assertGreater(len(label.filters), 1)
+        self.assertTrue(any('more than 1000' in str(w.message) for w in caught))
+
+    def test_exhaustion_warnings(self):
+        from data_factory.factory import Factory
+        from data_factory.uniqueness import unique
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            slug = unique(Factory(1).make_slug, 3000)
+            slug.many(3000, 2)
+
+        messages = [str(w.message) for w in caught]
+        self.assertTrue(any('out of 4160 possible' in m for m in messages))
+        self.assertTrue(any('close to exhausted' in m for m in messages))
+
+        self.assertRaises(ValueError, unique(Factory(1).make_slug, 5000), 2)
+
+
+class TestValueSpace(unittest.TestCase):
+    def test_known_generators(self):
+        from data_factory import factory
+        from data_factory.uniqueness import value_space
+
+        self.assertEqual(value_space(factory.make_slug, 2), 64 + 64 ** 2)
+        self.assertEqual(value_space('make_slug', 1, True), 65)
+        self.assertEqual(value_space(factory.make_binary, 4), 16)
+        self.assertEqual(value_space(factory.make_hostname_label, 3), 62 * 62 * 63)
+        self.assertEqual(value_space(factory.make_email_local_part, 2), 81 * 81)
+        self.assertEqual(value_space(factory.make_email_local_part, 3), 81 ** 3 + 81 ** 2)
+        self.assertEqual(value_space(factory.make_hostname, 5), 3 * 62)
+        self.assertEqual(value_space(factory.make_ip_address_str, v=4), 2 ** 32)
+        self.assertIsNone(value_space(factory.make_integer))
+
+    def test_matches_generated_values(self):
+        from data_factory.factory import Factory
+        from data_factory.uniqueness import value_space
+
+        values = set(Factory(1).make_email_local_part_many(20000, 2))
+        self.assertLessEqual(len(values), value_space('make_email_local_part', 2))
+        hosts = set(Factory(1).make_hostname_many(5000, 5))
+        self.assertEqual(len(hosts), value_space('make_hostname', 5))
+
+
+class TestUniqueIntegers(unittest.TestCase):
+    def test_is_a_permutation(self):
+        from data_factory.uniqueness import make_unique_integers
+
+        for lo, hi in ((0, 0), (1, 2), (5, 1004), (-128, 127), (1, 4097)):
+            ids = make_unique_integers(lo, hi, seed=1)
+            values = list(ids)
+
+            self.assertEqual(len(ids), hi - lo + 1)
+            self.assertEqual(sorted(values), list(range(lo, hi + 1)))
+            self.assertEqual([ids.index(v) for v in values], list(range(len(ids))))
+            self.assertEqual(list(reversed(ids)), values[::-1])
+
+    def test_full_64_bits_ranges(self):
+        from itertools import islice
+        from data_factory.factory import MIN_BIG_INT, MAX_BIG_INT, unsigned
+        from data_factory.uniqueness import make_unique_integers
+
+        for lo, hi in ((MIN_BIG_INT, MAX_BIG_INT), (0, unsigned(MAX_BIG_INT))):
+            ids = make_unique_integers(lo, hi, seed=1)
+
+            self.assertEqual(ids.size, 2 ** 64)
+            self.assertRaises(ValueError, len, ids)
+            self.assertEqual(next(reversed(ids)), ids[-1])
+            self.assertEqual(list(islice(ids, 3)), ids[:3])
+            self.assertEqual(ids[-3:], [ids[2 ** 64 - 3], ids[2 ** 64 - 2], ids[2 ** 64 - 1]])
+
+    def test_seed(self):
+        from data_factory.uniqueness import make_unique_integers
+
+        self.assertEqual(make_unique_integers(1, 100, 3)[:], make_unique_integers(1, 100, 3)[:])
+        self.assertNotEqual(make_unique_integers(1, 100, 3)[:], make_unique_integers(1, 100, 4)[:])
+        self.assertNotEqual(make_unique_integers(1, 100, 3)[:], list(range(1, 101)))
+
+    def test_random_access(self):
+        from data_factory.factory import MIN_BIG_INT, MAX_BIG_INT
+        from data_factory.uniqueness import make_unique_integers
+
+        ids = make_unique_integers(MIN_BIG_INT, MAX_BIG_INT, seed=7)
+        shards = [ids[i * 1000:(i + 1) * 1000] for i in range(3)]
+
+        self.assertEqual(shards[1][10], ids[1010])
+        self.assertEqual(len(set(shards[0] + shards[1] + shards[2])), 3000)
+        self.assertTrue(all(MIN_BIG_INT <= v <= MAX_BIG_INT for v in shards[0]))
+        self.assertEqual(ids.index(ids[-1]), 2 ** 64 - 1)
+
+    def test_errors(self):
+        from data_factory.uniqueness import make_unique_integers
+
+        ids = make_unique_integers(1, 10)
+        self.assertRaises(IndexError, ids.__getitem__, 10)
+        self.assertRaises(ValueError, ids.index, 11)
+        self.assertRaises(ValueError, make_unique_integers, 2, 1)
+        self.assertRaises(ValueError, make_unique_integers, 0, 2 ** 64)
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TestNumpyUniqueIntegers(unittest.TestCase):
+    def test_matches_permutation(self):
+        from data_factory import np as dnp
+        from data_factory.factory import MIN_INT, MAX_INT, MAX_BIG_INT
+        from data_factory.uniqueness import make_unique_integers
+
+        for lo, hi, start in ((MIN_INT, MAX_INT, 77), (1, 1000, 0), (0, 2 ** 64 - 1, 5), (1, MAX_BIG_INT, 9)):
+            values = dnp.make_unique_integers_many(500, lo, hi, seed=9, start=start)
+            self.assertEqual(values.tolist(), make_unique_integers(lo, hi, 9)[start:start + 500])
+
+        self.assertEqual(dnp.make_unique_integers_many(5, 0, 2 ** 64 - 1).dtype, numpy.dtype('uint64'))
+        self.assertEqual(dnp.make_unique_integers_many(5).dtype, numpy.dtype('int64'))
+
+    def test_errors(self):
+        from data_factory import np as dnp
+
+        self.assertRaises(IndexError, dnp.make_unique_integers_many, 11, 1, 10)
+        self.assertRaises(ValueError, dnp.make_unique_integers_many, 5, -1, 2 ** 63)